@@ -3,5 +3,11 @@ from .classroom import ClassroomAdmin
 from .student import StudentAdmin
 from .subject import SubjectAdmin
 from .score import ScoreAdmin
+from .report import ReportAdmin
+from .term import TermAdmin, TermResultAdmin
+from .api_key import ApiKeyAdmin
 
-__all__ = ['TeacherAdmin', 'UserAdmin', 'ClassroomAdmin', 'StudentAdmin', 'SubjectAdmin', 'ScoreAdmin']
\ No newline at end of file
+__all__ = [
+    'TeacherAdmin', 'UserAdmin', 'ClassroomAdmin', 'StudentAdmin', 'SubjectAdmin', 'ScoreAdmin', 'ReportAdmin',
+    'TermAdmin', 'TermResultAdmin', 'ApiKeyAdmin',
+]
\ No newline at end of file
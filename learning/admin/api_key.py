@@ -0,0 +1,25 @@
+from django.contrib import admin, messages
+
+from ..models import ApiKey
+
+
+@admin.register(ApiKey)
+class ApiKeyAdmin(admin.ModelAdmin):
+    list_display = ['name', 'prefix', 'user', 'is_active', 'expires_at', 'created_at']
+    list_filter = ['is_active']
+    search_fields = ['name', 'prefix', 'user__username']
+    list_select_related = ['user']
+    raw_id_fields = ['user']
+    readonly_fields = ['prefix', 'created_at']
+
+    def save_model(self, request, obj, form, change):
+        if change:
+            super().save_model(request, obj, form, change)
+            return
+        # Only the digest is stored, the key can be shown this once
+        api_key, key = ApiKey.objects.create_key(
+            obj.user, obj.name, is_active=obj.is_active, expires_at=obj.expires_at
+        )
+        obj.pk = api_key.pk
+        obj.prefix = api_key.prefix
+        messages.warning(request, f'API key for {api_key.name}: {key} - copy it now, it cannot be shown again.')
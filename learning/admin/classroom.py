@@ -1,14 +1,25 @@
 from django.contrib import admin
 from ..models import Classroom
+from .filters import AutocompleteFilter, AutocompleteFilterMixin, NormalizedSearchMixin
+from .mixins import DisplayRelatedMixin
 
 
 @admin.register(Classroom)
-class ClassroomAdmin(admin.ModelAdmin):
+class ClassroomAdmin(DisplayRelatedMixin, NormalizedSearchMixin, AutocompleteFilterMixin, admin.ModelAdmin):
     list_display = ['name', 'teacher', 'grade_level', 'school_year', 'is_active', 'student_count']
-    list_filter = ['grade_level', 'school_year', 'is_active', 'teacher']
+    list_filter = ['grade_level', 'school_year', 'is_active', ('teacher', AutocompleteFilter)]
     search_fields = ['name', 'teacher__full_name']
+    search_text_fields = ['search_text', 'teacher__search_text']
+    list_select_related = ['teacher']
+    autocomplete_fields = ['teacher']
+    show_full_result_count = False
+    # Meta.ordering does not apply to the grouped, annotated queryset
+    ordering = ['name']
     readonly_fields = ['created_at', 'updated_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_students_count()
+
+    @admin.display(description='Students', ordering='students_count')
     def student_count(self, obj):
-        return obj.students.count()
-    student_count.short_description = 'Students'
\ No newline at end of file
+        return obj.students_count
@@ -0,0 +1,83 @@
+from django import forms
+from django.contrib import admin
+from django.contrib.admin.utils import get_fields_from_path
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.utils.translation import gettext_lazy as _
+
+from ..search import SEARCH_TEXT_FIELD, search_filter, search_terms
+
+
+class AutocompleteFilter(admin.FieldListFilter):
+    """
+    Filter on a foreign key with an autocomplete box instead of a link per
+    related object, so the changelist never loads the whole related table.
+
+    Use it as ``list_filter = [('student__classroom', AutocompleteFilter)]``
+    in an admin with AutocompleteFilterMixin; the related model's admin needs
+    ``search_fields``, like for ``autocomplete_fields``.
+    """
+    template = 'admin/learning/autocomplete_filter.html'
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.lookup_kwarg = f'{field_path}__{field.target_field.name}__exact'
+        self.lookup_val = params.get(self.lookup_kwarg)
+        super().__init__(field, request, params, model, model_admin, field_path)
+        self.title = getattr(field, 'verbose_name', field.related_model._meta.verbose_name)
+        self.form_field = forms.ModelChoiceField(
+            queryset=field.related_model._default_manager.all(),
+            widget=AutocompleteSelect(field, model_admin.admin_site),
+            required=False,
+        )
+
+    def has_output(self):
+        return True
+
+    def expected_parameters(self):
+        return [self.lookup_kwarg]
+
+    def choices(self, changelist):
+        yield {
+            'selected': self.lookup_val is None,
+            'query_string': changelist.get_query_string(remove=[self.lookup_kwarg]),
+            'display': _('All'),
+        }
+
+    def rendered_widget(self):
+        # Renders the selected object only, the others are fetched while typing
+        value = self.lookup_val[-1] if self.lookup_val else None
+        return self.form_field.widget.render(
+            self.lookup_kwarg, value, attrs={'id': f'id_filter_{self.lookup_kwarg}', 'data-filter': self.lookup_kwarg}
+        )
+
+
+class AutocompleteFilterMixin:
+    """Add the autocomplete widget assets to admins using AutocompleteFilter"""
+
+    @property
+    def media(self):
+        media = super().media
+        paths = [
+            list_filter[0] for list_filter in self.list_filter
+            if isinstance(list_filter, (list, tuple)) and issubclass(list_filter[1], AutocompleteFilter)
+        ]
+        if not paths:
+            return media
+        field = get_fields_from_path(self.model, paths[0])[-1]
+        return media + AutocompleteSelect(field, self.admin_site).media + forms.Media(
+            js=['learning/admin/autocomplete_filter.js']
+        )
+
+
+class NormalizedSearchMixin:
+    """
+    Admin search, including the autocomplete boxes, on the normalized search
+    text: accent-insensitive and one column per model instead of an
+    ``ILIKE`` per field in ``search_fields``.
+    """
+    search_text_fields = [SEARCH_TEXT_FIELD]
+
+    def get_search_results(self, request, queryset, search_term):
+        terms = search_terms(search_term)
+        if not terms:
+            return queryset, False
+        return queryset.filter(search_filter(terms, self.search_text_fields)), False
@@ -0,0 +1,22 @@
+from ..models.display import for_display
+
+
+class DisplayRelatedMixin:
+    """
+    Join what ``__str__`` shows, for the rows of the admin, e.g. in its
+    autocomplete results and delete confirmations, and for the options of
+    its foreign key select boxes, so every label is complete without a query.
+    """
+
+    def get_queryset(self, request):
+        queryset = for_display(super().get_queryset(request))
+        # The changelist ignores list_select_related for a queryset that already joins something
+        if isinstance(self.list_select_related, (list, tuple)):
+            queryset = queryset.select_related(*self.list_select_related)
+        return queryset
+
+    def get_field_queryset(self, db, db_field, request):
+        queryset = super().get_field_queryset(db, db_field, request)
+        if queryset is None:
+            queryset = db_field.remote_field.model._default_manager.using(db)
+        return for_display(queryset)
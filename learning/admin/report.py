@@ -0,0 +1,13 @@
+from django.contrib import admin
+
+from ..models import Report
+from .mixins import DisplayRelatedMixin
+
+
+@admin.register(Report)
+class ReportAdmin(DisplayRelatedMixin, admin.ModelAdmin):
+    list_display = ['id', 'kind', 'format', 'status', 'row_count', 'requested_by', 'created_at', 'finished_at']
+    list_filter = ['kind', 'format', 'status']
+    list_select_related = ['requested_by']
+    show_full_result_count = False
+    readonly_fields = ['task_id', 'row_count', 'error', 'created_at', 'finished_at']
@@ -1,15 +1,20 @@
 from django.contrib import admin
 from ..models import Score
+from .filters import AutocompleteFilter, AutocompleteFilterMixin, NormalizedSearchMixin
+from .mixins import DisplayRelatedMixin
 
 
 @admin.register(Score)
-class ScoreAdmin(admin.ModelAdmin):
+class ScoreAdmin(DisplayRelatedMixin, NormalizedSearchMixin, AutocompleteFilterMixin, admin.ModelAdmin):
     list_display = ['student', 'subject', 'score', 'score_type', 'date', 'teacher']
-    list_filter = ['subject', 'score_type', 'date', 'teacher', 'student__classroom']
+    list_filter = [
+        'subject', 'score_type', 'date', ('teacher', AutocompleteFilter), ('student__classroom', AutocompleteFilter),
+    ]
     search_fields = ['student__full_name', 'subject__name', 'teacher__full_name']
+    search_text_fields = ['student__search_text', 'subject__search_text']
+    list_select_related = ['student__classroom', 'subject', 'teacher']
+    autocomplete_fields = ['student', 'subject', 'teacher']
+    show_full_result_count = False
     readonly_fields = ['created_at', 'updated_at']
     date_hierarchy = 'date'
 
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.select_related('student', 'subject', 'teacher', 'student__classroom')
\ No newline at end of file
@@ -1,12 +1,17 @@
 from django.contrib import admin
 from ..models import Student
+from .filters import AutocompleteFilter, AutocompleteFilterMixin, NormalizedSearchMixin
+from .mixins import DisplayRelatedMixin
 
 
 @admin.register(Student)
-class StudentAdmin(admin.ModelAdmin):
+class StudentAdmin(DisplayRelatedMixin, NormalizedSearchMixin, AutocompleteFilterMixin, admin.ModelAdmin):
     list_display = ['full_name', 'student_id', 'classroom', 'gender', 'age', 'is_active']
-    list_filter = ['classroom', 'gender', 'is_active', 'classroom__grade_level']
+    list_filter = [('classroom', AutocompleteFilter), 'gender', 'is_active', 'classroom__grade_level']
     search_fields = ['full_name', 'student_id', 'email']
+    list_select_related = ['classroom__teacher']
+    autocomplete_fields = ['classroom']
+    show_full_result_count = False
     readonly_fields = ['created_at', 'updated_at', 'age']
     fieldsets = (
         ('Basic Information', {
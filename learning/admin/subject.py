@@ -1,9 +1,10 @@
 from django.contrib import admin
 from ..models import Subject
+from .filters import NormalizedSearchMixin
 
 
 @admin.register(Subject)
-class SubjectAdmin(admin.ModelAdmin):
+class SubjectAdmin(NormalizedSearchMixin, admin.ModelAdmin):
     list_display = ['name', 'code', 'is_active', 'created_at']
     list_filter = ['is_active']
     search_fields = ['name', 'code']
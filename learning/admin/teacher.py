@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import User
 from ..models import Teacher
+from .filters import NormalizedSearchMixin
 
 
 class TeacherInline(admin.StackedInline):
@@ -15,12 +16,22 @@ class UserAdmin(BaseUserAdmin):
 
 
 @admin.register(Teacher)
-class TeacherAdmin(admin.ModelAdmin):
-    list_display = ['full_name', 'email', 'phone', 'created_at']
+class TeacherAdmin(NormalizedSearchMixin, admin.ModelAdmin):
+    list_display = ['full_name', 'email', 'phone', 'classroom_count', 'created_at']
     list_filter = ['created_at']
     search_fields = ['full_name', 'email', 'user__username']
+    show_full_result_count = False
+    # Meta.ordering does not apply to the grouped, annotated queryset
+    ordering = ['full_name']
     readonly_fields = ['created_at', 'updated_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_classrooms_count()
+
+    @admin.display(description='Classrooms', ordering='classrooms_count')
+    def classroom_count(self, obj):
+        return obj.classrooms_count
+
 
 # Re-register UserAdmin
 admin.site.unregister(User)
@@ -0,0 +1,22 @@
+from django.contrib import admin
+
+from ..models import Term, TermResult
+from .filters import AutocompleteFilter, AutocompleteFilterMixin
+from .mixins import DisplayRelatedMixin
+
+
+@admin.register(Term)
+class TermAdmin(admin.ModelAdmin):
+    list_display = ['name', 'start_date', 'end_date', 'created_at']
+    search_fields = ['name']
+    date_hierarchy = 'start_date'
+
+
+@admin.register(TermResult)
+class TermResultAdmin(DisplayRelatedMixin, AutocompleteFilterMixin, admin.ModelAdmin):
+    list_display = ['term', 'student', 'subject', 'weighted_average', 'score_count', 'computed_at']
+    list_filter = ['term', 'subject', ('student__classroom', AutocompleteFilter)]
+    search_fields = ['student__full_name']
+    list_select_related = ['term', 'student__classroom', 'subject']
+    show_full_result_count = False
+    readonly_fields = ['computed_at']
@@ -0,0 +1,22 @@
+from .arrays import SCORE_ARRAY_DTYPE, EpochDay, load_score_arrays
+from .metrics import (
+    competition_ranks,
+    group_by,
+    group_means,
+    histogram,
+    percentile_ranks,
+    trend_slopes,
+    z_scores,
+)
+from .summaries import (
+    TREND_DAYS,
+    classroom_analytics,
+    score_distribution,
+    subject_analytics,
+)
+
+__all__ = [
+    'SCORE_ARRAY_DTYPE', 'EpochDay', 'load_score_arrays',
+    'competition_ranks', 'group_by', 'group_means', 'histogram', 'percentile_ranks', 'trend_slopes', 'z_scores',
+    'TREND_DAYS', 'classroom_analytics', 'score_distribution', 'subject_analytics',
+]
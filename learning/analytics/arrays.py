@@ -0,0 +1,51 @@
+import numpy as np
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import FloatField, Func, IntegerField
+from django.db.models.functions import Cast
+
+SCORE_ARRAY_DTYPE = np.dtype([
+    ('student', np.int64),
+    ('subject', np.int64),
+    ('classroom', np.int64),
+    ('score', np.float64),
+    ('day', np.int64),
+])
+SCORE_ARRAY_CHUNK_SIZE = 10_000
+
+
+class EpochDay(Func):
+    """Days since 1970-01-01 of a date, so no date object is built per row"""
+    template = "(%(expressions)s - DATE '1970-01-01')"
+    output_field = IntegerField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        template = 'CAST(julianday(%(expressions)s) - 2440587.5 AS INTEGER)'
+        return self.as_sql(compiler, connection, template=template, **extra_context)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        template = '(TO_DAYS(%(expressions)s) - 719528)'
+        return self.as_sql(compiler, connection, template=template, **extra_context)
+
+
+def load_score_arrays(scores):
+    """
+    Student, subject, classroom, score and day of every row of a Score queryset
+    as one structured array, read with a single query.
+
+    Scores are cast to floats and dates to day numbers by the database, so
+    every column is a plain number and the cursor rows are read straight into
+    the array, without building a Decimal and a date per row or running the
+    ORM's converters.
+    """
+    rows = scores.order_by().values_list(
+        'student_id', 'subject_id', 'student__classroom_id', Cast('score', FloatField()), EpochDay('date')
+    )
+    try:
+        sql, params = rows.query.get_compiler(using=rows.db).as_sql()
+    except EmptyResultSet:
+        return np.empty(0, dtype=SCORE_ARRAY_DTYPE)
+    with connections[rows.db].cursor() as cursor:
+        cursor.execute(sql, params)
+        chunks = iter(lambda: cursor.fetchmany(SCORE_ARRAY_CHUNK_SIZE), [])
+        return np.fromiter((row for chunk in chunks for row in chunk), dtype=SCORE_ARRAY_DTYPE)
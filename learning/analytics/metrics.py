@@ -0,0 +1,79 @@
+"""
+Vectorized score metrics.
+
+Every function works on whole NumPy arrays; grouped metrics take the group
+index of each row (see ``group_by``) and are computed with ``np.bincount``.
+"""
+import numpy as np
+
+HISTOGRAM_BINS = 10
+SCORE_RANGE = (0, 10)
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def group_by(*columns):
+    """
+    Distinct combinations of the integer columns and the group index of each row.
+
+    Returns the key columns of every group and an array mapping each row to
+    its group, both ordered by the keys.
+    """
+    key = np.zeros(len(columns[0]), dtype=np.int64)
+    for column in columns:
+        # Compress each column to 0..n-1 so the combined key cannot overflow
+        values, codes = np.unique(column, return_inverse=True)
+        key = key * len(values) + codes
+    _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    return [column[first] for column in columns], inverse
+
+
+def group_means(inverse, values, size):
+    """Number of rows and mean of ``values`` per group"""
+    counts = np.bincount(inverse, minlength=size)
+    sums = np.bincount(inverse, weights=values, minlength=size)
+    return counts, sums / np.maximum(counts, 1)
+
+
+def percentile_ranks(values):
+    """Share of values below each value, counting ties as half, in percent"""
+    ordered = np.sort(values)
+    below = np.searchsorted(ordered, values, side='left')
+    not_above = np.searchsorted(ordered, values, side='right')
+    return 50.0 * (below + not_above) / len(values)
+
+
+def competition_ranks(values):
+    """Rank of each value from the highest, ties sharing the best rank (1, 2, 2, 4)"""
+    ordered = np.sort(values)
+    return 1 + len(values) - np.searchsorted(ordered, values, side='right')
+
+
+def z_scores(values):
+    """Distance of each value from the mean in population standard deviations"""
+    std = values.std()
+    if not std:
+        return np.zeros_like(values)
+    return (values - values.mean()) / std
+
+
+def trend_slopes(inverse, days, values, size):
+    """
+    Least squares slope of ``values`` over ``days`` per group, in points per day.
+
+    Groups whose rows all fall on the same day have no slope (NaN).
+    """
+    x = (days - days.min()).astype(np.float64) if len(days) else days.astype(np.float64)
+    counts = np.bincount(inverse, minlength=size)
+    sum_x = np.bincount(inverse, weights=x, minlength=size)
+    sum_y = np.bincount(inverse, weights=values, minlength=size)
+    sum_xy = np.bincount(inverse, weights=x * values, minlength=size)
+    sum_xx = np.bincount(inverse, weights=x * x, minlength=size)
+    denominator = counts * sum_xx - sum_x * sum_x
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slopes = (counts * sum_xy - sum_x * sum_y) / denominator
+    return np.where(denominator > 0, slopes, np.nan)
+
+
+def histogram(values, bins=HISTOGRAM_BINS, value_range=SCORE_RANGE):
+    """Counts and bin edges of ``values``; the last bin includes its upper edge"""
+    return np.histogram(values, bins=bins, range=value_range)
@@ -0,0 +1,159 @@
+import math
+
+import numpy as np
+
+from ..models import Classroom, Score, Student, Subject
+from ..services import filter_scores
+from .arrays import load_score_arrays
+from .metrics import (
+    PERCENTILES,
+    competition_ranks,
+    group_by,
+    group_means,
+    histogram,
+    percentile_ranks,
+    trend_slopes,
+    z_scores,
+)
+
+# Trends are reported in score points per this many days
+TREND_DAYS = 30
+
+
+def _round(value):
+    value = float(value)
+    return round(value, 2) if math.isfinite(value) else None
+
+
+def score_distribution(values):
+    """Count, mean, standard deviation, percentiles and histogram of an array of scores"""
+    counts, edges = histogram(values)
+    empty = not len(values)
+    quantiles = np.percentile(values, PERCENTILES) if not empty else [None] * len(PERCENTILES)
+    return {
+        'count': int(len(values)),
+        'average': None if empty else _round(values.mean()),
+        'std_dev': None if empty else _round(values.std()),
+        'percentiles': {
+            f'p{percentile}': None if empty else _round(value) for percentile, value in zip(PERCENTILES, quantiles, strict=True)
+        },
+        'histogram': [
+            {'min': _round(low), 'max': _round(high), 'count': int(count)}
+            for low, high, count in zip(edges[:-1], edges[1:], counts, strict=True)
+        ],
+    }
+
+
+def _standings(key, ids, counts, means, trends=None, limit=None):
+    """Rows of ``ids`` ordered by rank, with their average, percentile rank and z-score"""
+    if not len(ids):
+        return []
+    ranks = competition_ranks(means)
+    percentiles = percentile_ranks(means)
+    scores = z_scores(means)
+    order = np.lexsort((ids, ranks))[:limit]
+
+    rows = []
+    for index in order:
+        row = {
+            key: int(ids[index]),
+            'count': int(counts[index]),
+            'average': _round(means[index]),
+            'rank': int(ranks[index]),
+            'percentile': _round(percentiles[index]),
+            'z_score': _round(scores[index]),
+        }
+        if trends is not None:
+            row['trend'] = _round(trends[index])
+        rows.append(row)
+    return rows
+
+
+def _add_names(rows, key, names, field):
+    for row in rows:
+        row[field] = names.get(row[key])
+    return rows
+
+
+def classroom_analytics(classroom, score_type=None, date_from=None, date_to=None):
+    """
+    Rankings of a classroom's students overall and per active subject.
+
+    Per subject it adds the score distribution and each student's trend, the
+    least squares slope of their scores over time in points per TREND_DAYS.
+    """
+    scores = Score.objects.filter(student__classroom=classroom, subject__is_active=True)
+    scores = filter_scores(scores, score_type=score_type, date_from=date_from, date_to=date_to)
+    arrays = load_score_arrays(scores)
+    values = arrays['score']
+    student_names = dict(classroom.students.values_list('id', 'full_name'))
+
+    (students,), inverse = group_by(arrays['student'])
+    counts, means = group_means(inverse, values, len(students))
+    ranking = _add_names(_standings('student_id', students, counts, means), 'student_id', student_names, 'full_name')
+
+    (group_subjects, group_students), inverse = group_by(arrays['subject'], arrays['student'])
+    counts, means = group_means(inverse, values, len(group_subjects))
+    trends = trend_slopes(inverse, arrays['day'], values, len(group_subjects)) * TREND_DAYS
+
+    subjects = []
+    subject_ids = np.unique(group_subjects).tolist()
+    for subject_id, name in Subject.objects.filter(pk__in=subject_ids).order_by('name').values_list('id', 'name'):
+        in_subject = group_subjects == subject_id
+        standings = _standings(
+            'student_id', group_students[in_subject], counts[in_subject], means[in_subject], trends[in_subject]
+        )
+        subjects.append({
+            'subject_id': subject_id,
+            'subject_name': name,
+            **score_distribution(values[arrays['subject'] == subject_id]),
+            'students': _add_names(standings, 'student_id', student_names, 'full_name'),
+        })
+
+    return {
+        'classroom_id': classroom.pk,
+        'total_scores': int(len(values)),
+        'students': ranking,
+        'subjects': subjects,
+    }
+
+
+def subject_analytics(subject, scores, limit=20):
+    """
+    Distribution, classroom ranking and top students of a subject's scores.
+
+    ``scores`` is the already filtered Score queryset of the subject. Only the
+    ``limit`` best ranked students are returned, with their trend in points
+    per TREND_DAYS.
+    """
+    arrays = load_score_arrays(scores)
+    values = arrays['score']
+    days = arrays['day']
+
+    (classrooms,), inverse = group_by(arrays['classroom'])
+    counts, means = group_means(inverse, values, len(classrooms))
+    classroom_rows = _standings('classroom_id', classrooms, counts, means)
+
+    (students, student_classrooms), inverse = group_by(arrays['student'], arrays['classroom'])
+    counts, means = group_means(inverse, values, len(students))
+    trends = trend_slopes(inverse, days, values, len(students)) * TREND_DAYS
+    student_rows = _standings('student_id', students, counts, means, trends, limit=limit)
+
+    students_per_classroom = dict(zip(*np.unique(student_classrooms, return_counts=True), strict=True))
+    classroom_names = dict(Classroom.objects.filter(pk__in=classrooms.tolist()).values_list('id', 'name'))
+    for row in _add_names(classroom_rows, 'classroom_id', classroom_names, 'classroom_name'):
+        row['student_count'] = int(students_per_classroom[row['classroom_id']])
+
+    student_names = dict(
+        Student.objects.filter(pk__in=[row['student_id'] for row in student_rows]).values_list('id', 'full_name')
+    )
+    overall_trend = trend_slopes(np.zeros(len(values), dtype=np.int64), days, values, 1)[0] * TREND_DAYS
+
+    return {
+        'subject_id': subject.pk,
+        'subject_name': subject.name,
+        **score_distribution(values),
+        'trend': _round(overall_trend),
+        'classrooms': classroom_rows,
+        'students': _add_names(student_rows, 'student_id', student_names, 'full_name'),
+    }
@@ -7,4 +7,6 @@ class LearningConfig(AppConfig):
     verbose_name = 'Learning Management'
 
     def ready(self):
-        import learning.signals
\ No newline at end of file
+        import learning.checks
+        import learning.signals
+        import libs.metrics
\ No newline at end of file
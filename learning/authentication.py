@@ -0,0 +1,248 @@
+"""
+JWT authentication from token claims, API keys and restricted Basic auth.
+
+Access tokens carry the user's id, username, staff/superuser flags and
+teacher profile id, so a request is authenticated without reading the user
+or the teacher from the database: ``ClaimsJWTAuthentication`` builds the
+request user from the claims, with ``teacher_profile`` already resolved.
+The claims are refreshed from the database whenever a token is obtained or
+refreshed, so a role change applies at the next refresh.
+
+Revoked tokens are kept in a cache denylist by ``jti`` until they expire,
+refresh tokens are also blacklisted in the database when the simplejwt
+blacklist app is installed. Deactivating a user, changing their role or
+password, or adding or removing their teacher profile records the time in
+the denylist too, and every token of the user issued before it is rejected:
+the claims of older tokens may no longer be true. The denylist cache must be
+persistent and shared by every process, see learning.checks.
+
+Machine clients authenticate with ``Authorization: Api-Key <key>``. Keys are
+stored as an HMAC digest and the row of a key, with its user's claims, is
+cached by its prefix, so a request costs one cache read and one HMAC.
+Basic auth hashes the password on every request and is only accepted on
+the paths listed in ``BASIC_AUTH_PATHS``.
+"""
+
+import hmac
+import re
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils import timezone
+from rest_framework.authentication import (
+    BaseAuthentication,
+    BasicAuthentication,
+    get_authorization_header,
+)
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import ApiKey, Teacher
+from .models.api_key import api_key_digest
+
+TEACHER_CLAIM = 'teacher_id'
+USERNAME_CLAIM = 'username'
+STAFF_CLAIM = 'is_staff'
+SUPERUSER_CLAIM = 'is_superuser'
+# When the claims were read, with sub-second precision unlike iat
+ISSUED_AT_CLAIM = 'claims_at'
+DENYLIST_PREFIX = 'learning:jwt:denylist'
+REVOKED_BEFORE_PREFIX = 'learning:jwt:revoked-before'
+API_KEY_KEYWORD = 'Api-Key'
+API_KEY_CACHE_PREFIX = 'learning:api-key'
+
+
+def set_principal_claims(token, user):
+    """Store what the API needs to know about ``user`` in the token"""
+    teacher = getattr(user, 'teacher_profile', None)
+    token[USERNAME_CLAIM] = user.get_username()
+    token[STAFF_CLAIM] = user.is_staff
+    token[SUPERUSER_CLAIM] = user.is_superuser
+    token[TEACHER_CLAIM] = teacher.pk if teacher is not None else None
+    token[ISSUED_AT_CLAIM] = time.time()
+    return token
+
+
+def principal_from_claims(token):
+    """
+    The request user described by a token, never read from the database.
+
+    It is a User instance so it can be assigned to foreign keys, but only
+    the claimed fields are set and it must never be saved.
+    """
+    user = get_user_model()(
+        **{api_settings.USER_ID_FIELD: token[api_settings.USER_ID_CLAIM]},
+        username=token.get(USERNAME_CLAIM, ''),
+        is_staff=token.get(STAFF_CLAIM, False),
+        is_superuser=token.get(SUPERUSER_CLAIM, False),
+        is_active=True,
+    )
+    user._state.adding = False
+    teacher_id = token.get(TEACHER_CLAIM)
+    teacher = Teacher(pk=teacher_id, user=user) if teacher_id is not None else None
+    if teacher is not None:
+        teacher._state.adding = False
+    # A cached None makes hasattr(user, 'teacher_profile') False without a query
+    get_user_model().teacher_profile.related.set_cached_value(user, teacher)
+    return user
+
+
+def _denylist():
+    return caches[getattr(settings, 'JWT_DENYLIST_CACHE', 'jwt_denylist')]
+
+
+def _denylist_key(jti):
+    return f'{DENYLIST_PREFIX}:{jti}'
+
+
+def revoke_token(token):
+    """Deny ``token`` until it expires, and blacklist it too if it is a refresh token"""
+    remaining = int(token['exp'] - timezone.now().timestamp())
+    if remaining > 0:
+        _denylist().set(_denylist_key(token[api_settings.JTI_CLAIM]), True, timeout=remaining)
+    blacklist = getattr(token, 'blacklist', None)
+    if blacklist is not None:
+        blacklist()
+
+
+def _revoked_before_key(user_id):
+    return f'{REVOKED_BEFORE_PREFIX}:{user_id}'
+
+
+def revoke_user_tokens(user_id):
+    """Deny every token of the user issued until now, they may carry claims that are no longer true"""
+    timeout = int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+    _denylist().set(_revoked_before_key(user_id), time.time(), timeout=timeout)
+
+
+def is_token_revoked(token):
+    """Whether the token itself was revoked, or issued before the tokens of its user were"""
+    token_key = _denylist_key(token[api_settings.JTI_CLAIM])
+    user_key = _revoked_before_key(token.get(api_settings.USER_ID_CLAIM))
+    denied = _denylist().get_many([token_key, user_key])
+    issued_at = token.get(ISSUED_AT_CLAIM, token.get('iat', 0))
+    return token_key in denied or (user_key in denied and issued_at < denied[user_key])
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that trusts the token claims instead of loading the user"""
+
+    def get_validated_token(self, raw_token):
+        token = super().get_validated_token(raw_token)
+        if is_token_revoked(token):
+            raise InvalidToken({'detail': 'Token has been revoked', 'code': 'token_not_valid'})
+        return token
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken('Token contained no recognizable user identification')
+        return principal_from_claims(validated_token)
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        return set_principal_claims(super().get_token(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        try:
+            refresh = self.token_class(attrs['refresh'])
+        except TokenError as exc:
+            raise InvalidToken(exc.args[0]) from exc
+        if is_token_revoked(refresh):
+            raise InvalidToken({'detail': 'Token has been revoked', 'code': 'token_not_valid'})
+
+        data = super().validate(attrs)
+        # Claims copied from the refresh token may be stale, read them again
+        access = AccessToken(data['access'])
+        user = get_user_model().objects.select_related('teacher_profile').get(
+            **{api_settings.USER_ID_FIELD: access[api_settings.USER_ID_CLAIM]}
+        )
+        data['access'] = str(set_principal_claims(access, user))
+        return data
+
+
+def _api_key_cache():
+    return caches[getattr(settings, 'API_KEY_CACHE', 'default')]
+
+
+def _api_key_cache_key(prefix):
+    return f'{API_KEY_CACHE_PREFIX}:{prefix}'
+
+
+def api_key_entry(prefix):
+    """
+    Digest, expiry and user claims of the active key with ``prefix``, or None.
+
+    Entries, including misses, are cached for ``API_KEY_CACHE_TIMEOUT``
+    seconds; saving or deleting a key drops its entry, changes to its user
+    apply once the entry expires.
+    """
+    cache = _api_key_cache()
+    key = _api_key_cache_key(prefix)
+    entry = cache.get(key)
+    if entry is None:
+        api_key = (
+            ApiKey.objects.select_related('user__teacher_profile')
+            .filter(prefix=prefix, is_active=True, user__is_active=True)
+            .first()
+        )
+        entry = {'found': False}
+        if api_key is not None:
+            entry = {
+                'found': True,
+                'digest': api_key.digest,
+                'expires_at': api_key.expires_at.timestamp() if api_key.expires_at else None,
+                'claims': set_principal_claims({api_settings.USER_ID_CLAIM: api_key.user_id}, api_key.user),
+            }
+        cache.set(key, entry, timeout=getattr(settings, 'API_KEY_CACHE_TIMEOUT', 300))
+    return entry if entry['found'] else None
+
+
+def invalidate_api_key(prefix):
+    _api_key_cache().delete(_api_key_cache_key(prefix))
+
+
+class ApiKeyAuthentication(BaseAuthentication):
+    """``Authorization: Api-Key <key>`` for machine clients, checked against the cached key digest"""
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != API_KEY_KEYWORD.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed('Invalid API key header.')
+        try:
+            key = auth[1].decode()
+        except UnicodeError as exc:
+            raise AuthenticationFailed('Invalid API key.') from exc
+
+        entry = api_key_entry(key.partition('.')[0])
+        if entry is None or not hmac.compare_digest(entry['digest'], api_key_digest(key)):
+            raise AuthenticationFailed('Invalid API key.')
+        if entry['expires_at'] is not None and entry['expires_at'] <= timezone.now().timestamp():
+            raise AuthenticationFailed('API key has expired.')
+        return principal_from_claims(entry['claims']), None
+
+    def authenticate_header(self, request):
+        return API_KEY_KEYWORD
+
+
+class RestrictedBasicAuthentication(BasicAuthentication):
+    """BasicAuthentication on the paths matching a regular expression of BASIC_AUTH_PATHS only"""
+
+    def authenticate(self, request):
+        if not any(re.match(pattern, request.path) for pattern in getattr(settings, 'BASIC_AUTH_PATHS', [])):
+            return None
+        return super().authenticate(request)
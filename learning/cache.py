@@ -0,0 +1,151 @@
+"""
+Response cache for the read-heavy statistics and list actions.
+
+Cached responses are keyed on the user scope (the teacher profile, or ``all``
+for users who see every row), the view arguments, the query parameters and
+the current version of every object the response depends on. Writes bump
+those versions (see learning.signals), so stale entries are never read again
+and simply expire. Only responses read from the primary are stored: a lagging
+replica could return data older than the versions in the key.
+"""
+import functools
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from libs.db_routing import used_replica
+from libs.metrics import record_cache_request
+
+RESPONSE_CACHE_PREFIX = 'learning:response'
+RESPONSE_CACHE_TIMEOUT = getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 60 * 60)
+
+# Names of the cached actions, for reporting hit/miss counters
+cached_response_names = set()
+
+
+def _version_key(scope, pk):
+    return f'{RESPONSE_CACHE_PREFIX}:version:{scope}:{pk}'
+
+
+def _counter_key(name, outcome):
+    return f'{RESPONSE_CACHE_PREFIX}:counter:{name}:{outcome}'
+
+
+def _incr(key, initial):
+    """Increment a cache counter, starting it at ``initial`` if it does not exist"""
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, initial, timeout=None)
+        return initial
+
+
+def get_versions(scopes):
+    """Current versions of the given (scope, pk) pairs, creating missing ones"""
+    keys = [_version_key(scope, pk) for scope, pk in scopes]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # A fresh timestamp never collides with a version that was evicted
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key, 0)
+    return [versions[key] for key in keys]
+
+
+def bump_versions(scopes):
+    """Invalidate every cached response depending on one of the (scope, pk) pairs"""
+    for scope, pk in set(scopes):
+        if pk is not None:
+            _incr(_version_key(scope, pk), time.time_ns())
+
+
+def object_scope(scope, *extra_scopes):
+    """Scopes of a detail action depending on the object in the URL"""
+    def scopes(view, request, kwargs):
+        return [(scope, kwargs.get('pk')), *extra_scopes]
+    return scopes
+
+
+def query_param_scope(scope, param, *extra_scopes):
+    """Scopes of a list action depending on the object named by a query parameter"""
+    def scopes(view, request, kwargs):
+        return [(scope, request.query_params.get(param)), *extra_scopes]
+    return scopes
+
+
+def invalidate_scores(student_ids, subject_ids):
+    """Bump the versions of everything a change to scores of these students and subjects affects"""
+    from .models import Student
+
+    student_ids = set(student_ids)
+    classroom_ids = Student.objects.filter(pk__in=student_ids).values_list('classroom_id', flat=True).distinct()
+    bump_versions(
+        [('student', pk) for pk in student_ids]
+        + [('subject', pk) for pk in set(subject_ids)]
+        + [('classroom', pk) for pk in classroom_ids]
+    )
+
+
+def user_scope(user):
+    teacher = getattr(user, 'teacher_profile', None)
+    return f'teacher:{teacher.pk}' if teacher is not None else 'all'
+
+
+def record_cache_event(name, hit):
+    record_cache_request(name, hit)
+    _incr(_counter_key(name, 'hits' if hit else 'misses'), 1)
+
+
+def response_cache_stats():
+    """Hit and miss counters of every cached action"""
+    names = sorted(cached_response_names)
+    counters = cache.get_many([_counter_key(name, outcome) for name in names for outcome in ('hits', 'misses')])
+    return {
+        name: {
+            'hits': counters.get(_counter_key(name, 'hits'), 0),
+            'misses': counters.get(_counter_key(name, 'misses'), 0),
+        }
+        for name in names
+    }
+
+
+def cached_response(name, scopes):
+    """
+    Cache the data of successful responses of a viewset action.
+
+    ``scopes(view, request, kwargs)`` returns the (scope, pk) pairs whose
+    versions the response depends on. Responses carry an ``X-Cache`` header
+    telling whether they were served from the cache.
+    """
+    cached_response_names.add(name)
+
+    def decorator(action):
+        @functools.wraps(action)
+        def wrapper(self, request, *args, **kwargs):
+            versions = get_versions(scopes(self, request, kwargs))
+            params = sorted(request.query_params.lists())
+            digest = hashlib.md5(
+                repr((sorted(kwargs.items()), params, versions)).encode(), usedforsecurity=False
+            ).hexdigest()
+            key = f'{RESPONSE_CACHE_PREFIX}:{name}:{user_scope(request.user)}:{digest}'
+
+            data = cache.get(key)
+            if data is not None:
+                record_cache_event(name, hit=True)
+                response = Response(data)
+                response['X-Cache'] = 'HIT'
+                return response
+
+            record_cache_event(name, hit=False)
+            response = action(self, request, *args, **kwargs)
+            if response.status_code == 200 and not used_replica():
+                cache.set(key, response.data, timeout=RESPONSE_CACHE_TIMEOUT)
+            response['X-Cache'] = 'MISS'
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Error, Tags, register
+
+
+@register(Tags.caches)
+def check_jwt_denylist_cache(app_configs, **kwargs):
+    """A denylist that is not shared, or not kept at all, silently accepts revoked tokens again"""
+    alias = getattr(settings, 'JWT_DENYLIST_CACHE', 'jwt_denylist')
+    try:
+        cache = caches[alias]
+    except InvalidCacheBackendError:
+        return [Error(f"JWT_DENYLIST_CACHE names the unknown cache '{alias}'.", id='learning.E001')]
+    if not settings.DEBUG and isinstance(cache, (DummyCache, LocMemCache)):
+        return [
+            Error(
+                f"The JWT denylist cache '{alias}' is a {type(cache).__name__}, revoked tokens would be "
+                "accepted by other processes or after a restart.",
+                hint='Point JWT_DENYLIST_CACHE to a persistent cache shared by every process, e.g. Redis.',
+                id='learning.E001',
+            )
+        ]
+    return []
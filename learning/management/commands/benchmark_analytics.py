@@ -0,0 +1,176 @@
+import bisect
+import statistics
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from learning.analytics import TREND_DAYS, load_score_arrays, subject_analytics
+from learning.analytics.metrics import HISTOGRAM_BINS, PERCENTILES
+from learning.models import Classroom, Student, Subject
+
+
+def _round(value):
+    return round(value, 2) if value is not None else None
+
+
+def _slope(points):
+    """Least squares slope of (day, score) points, None when they all fall on one day"""
+    count = len(points)
+    sum_x = sum(x for x, _ in points)
+    sum_y = sum(y for _, y in points)
+    sum_xy = sum(x * y for x, y in points)
+    sum_xx = sum(x * x for x, _ in points)
+    denominator = count * sum_xx - sum_x * sum_x
+    if denominator <= 0:
+        return None
+    return (count * sum_xy - sum_x * sum_y) / denominator
+
+
+def _standings(key, scores_by_id, trends=None, limit=None):
+    means = {pk: statistics.fmean(values) for pk, values in scores_by_id.items()}
+    ordered = sorted(means.values())
+    mean = statistics.fmean(ordered) if ordered else 0
+    std = statistics.pstdev(ordered) if ordered else 0
+
+    rows = []
+    for pk, average in means.items():
+        below = bisect.bisect_left(ordered, average)
+        not_above = bisect.bisect_right(ordered, average)
+        row = {
+            key: pk,
+            'count': len(scores_by_id[pk]),
+            'average': _round(average),
+            'rank': 1 + len(ordered) - not_above,
+            'percentile': _round(50.0 * (below + not_above) / len(ordered)),
+            'z_score': _round((average - mean) / std if std else 0.0),
+        }
+        if trends is not None:
+            row['trend'] = _round(trends[pk])
+        rows.append(row)
+    rows.sort(key=lambda row: (row['rank'], row[key]))
+    return rows[:limit]
+
+
+def naive_subject_analytics(subject, scores, limit=20):
+    """subject_analytics computed with Python loops over the score rows, as a baseline"""
+    rows = list(scores.order_by().values_list('student_id', 'student__classroom_id', 'score', 'date'))
+    values = [float(score) for _, _, score, _ in rows]
+    first_day = min((day for _, _, _, day in rows), default=None)
+
+    by_classroom = defaultdict(list)
+    by_student = defaultdict(list)
+    points_by_student = defaultdict(list)
+    students_by_classroom = defaultdict(set)
+    all_points = []
+    for student_id, classroom_id, score, day in rows:
+        score = float(score)
+        point = ((day - first_day).days, score)
+        by_classroom[classroom_id].append(score)
+        by_student[student_id].append(score)
+        points_by_student[student_id].append(point)
+        students_by_classroom[classroom_id].add(student_id)
+        all_points.append(point)
+
+    histogram = [0] * HISTOGRAM_BINS
+    for score in values:
+        histogram[min(int(score * HISTOGRAM_BINS / 10), HISTOGRAM_BINS - 1)] += 1
+    quantiles = statistics.quantiles(values, n=100, method='inclusive') if len(values) > 1 else values * 99
+
+    trends = {}
+    for student_id, points in points_by_student.items():
+        slope = _slope(points)
+        trends[student_id] = slope * TREND_DAYS if slope is not None else None
+    overall_trend = _slope(all_points) if all_points else None
+
+    classroom_rows = _standings('classroom_id', by_classroom)
+    classroom_names = dict(Classroom.objects.filter(pk__in=list(by_classroom)).values_list('id', 'name'))
+    for row in classroom_rows:
+        row['classroom_name'] = classroom_names.get(row['classroom_id'])
+        row['student_count'] = len(students_by_classroom[row['classroom_id']])
+
+    student_rows = _standings('student_id', by_student, trends, limit=limit)
+    student_names = dict(
+        Student.objects.filter(pk__in=[row['student_id'] for row in student_rows]).values_list('id', 'full_name')
+    )
+    for row in student_rows:
+        row['full_name'] = student_names.get(row['student_id'])
+
+    return {
+        'subject_id': subject.pk,
+        'subject_name': subject.name,
+        'count': len(values),
+        'average': _round(statistics.fmean(values)) if values else None,
+        'std_dev': _round(statistics.pstdev(values)) if values else None,
+        'percentiles': {
+            f'p{percentile}': _round(quantiles[percentile - 1]) if values else None for percentile in PERCENTILES
+        },
+        'histogram': [
+            {'min': float(index * 10 / HISTOGRAM_BINS), 'max': float((index + 1) * 10 / HISTOGRAM_BINS), 'count': count}
+            for index, count in enumerate(histogram)
+        ],
+        'trend': _round(overall_trend * TREND_DAYS) if overall_trend is not None else None,
+        'classrooms': classroom_rows,
+        'students': student_rows,
+    }
+
+
+def differences(expected, actual, path='', tolerance=0.011):
+    """Paths where two analytics results differ by more than rounding"""
+    if isinstance(expected, dict):
+        keys = set(expected) | set(actual)
+        return [diff for key in sorted(keys) for diff in differences(expected.get(key), actual.get(key), f'{path}.{key}')]
+    if isinstance(expected, list) and isinstance(actual, list) and len(expected) == len(actual):
+        return [diff for index, pair in enumerate(zip(expected, actual, strict=True)) for diff in differences(*pair, f'{path}[{index}]')]
+    if isinstance(expected, float) and isinstance(actual, float):
+        return [] if abs(expected - actual) <= tolerance else [path]
+    return [] if expected == actual else [path]
+
+
+class Command(BaseCommand):
+    help = 'Compare the vectorized subject analytics with a Python loop implementation'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--subject', type=int, action='append', help='Subject id, default every active subject')
+        parser.add_argument('--limit', type=int, default=20, help='Ranked students returned per subject')
+        parser.add_argument('--repeat', type=int, default=3, help='Runs per implementation, the best one is reported')
+
+    def handle(self, *args, **options):
+        subjects = Subject.objects.filter(is_active=True).order_by('id')
+        if options['subject']:
+            subjects = Subject.objects.filter(pk__in=options['subject']).order_by('id')
+
+        # "query s" is the part of the vectorized time spent reading the scores
+        self.stdout.write(
+            f"{'subject':<20} {'scores':>10} {'query s':>8} {'vectorized s':>13} {'naive s':>10} {'speedup':>8}  match"
+        )
+        total_scores = total_vectorized = total_naive = 0
+        for subject in subjects:
+            scores = subject.scores.all()
+
+            _, query_time = self.measure(lambda subject, scores, limit: load_score_arrays(scores), subject, scores, options)
+            vectorized, vectorized_time = self.measure(subject_analytics, subject, scores, options)
+            naive, naive_time = self.measure(naive_subject_analytics, subject, scores, options)
+
+            mismatches = differences(naive, vectorized)
+            total_scores += vectorized['count']
+            total_vectorized += vectorized_time
+            total_naive += naive_time
+            self.stdout.write(
+                f"{subject.code:<20} {vectorized['count']:>10,} {query_time:>8.3f} {vectorized_time:>13.3f} {naive_time:>10.3f} "
+                f"{naive_time / vectorized_time:>7.1f}x  {'yes' if not mismatches else ', '.join(mismatches[:5])}"
+            )
+
+        if total_vectorized:
+            self.stdout.write(
+                f"{'total':<20} {total_scores:>10,} {'':>8} {total_vectorized:>13.3f} {total_naive:>10.3f} "
+                f"{total_naive / total_vectorized:>7.1f}x"
+            )
+
+    def measure(self, implementation, subject, scores, options):
+        timings = []
+        for _ in range(max(options['repeat'], 1)):
+            started = time.perf_counter()
+            result = implementation(subject, scores, limit=options['limit'])
+            timings.append(time.perf_counter() - started)
+        return result, min(timings)
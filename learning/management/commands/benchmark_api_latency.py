@@ -0,0 +1,95 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connections
+from rest_framework.test import APIClient
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure p50/p99 latency of an API endpoint through the full request cycle, '
+        'optionally comparing connection reuse settings'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/api/v1/students/', help='Endpoint to request')
+        parser.add_argument('--requests', type=int, default=200, help='Measured requests per run')
+        parser.add_argument('--warmup', type=int, default=10, help='Unmeasured requests before each run')
+        parser.add_argument('--host', help='Host header to send (default: the first of ALLOWED_HOSTS or localhost)')
+        parser.add_argument('--username', help='User to authenticate as (default: the first superuser)')
+        parser.add_argument(
+            '--conn-max-age',
+            type=int,
+            nargs='+',
+            help='Compare runs with these CONN_MAX_AGE values, e.g. 0 60 (ignored for pooled databases)',
+        )
+
+    def handle(self, *args, **options):
+        user = self.get_user(options['username'])
+        client = APIClient(HTTP_HOST=options['host'] or self.default_host())
+        client.force_authenticate(user=user)
+
+        configured = {alias: connections[alias].settings_dict['CONN_MAX_AGE'] for alias in connections}
+        self.stdout.write(f"{'connections':<24} {'p50 ms':>8} {'p99 ms':>8} {'mean ms':>8}")
+        try:
+            for label, conn_max_age in self.runs(options['conn_max_age']):
+                if conn_max_age is not None:
+                    self.set_conn_max_age(conn_max_age)
+                latencies = self.measure(client, options['path'], options['requests'], options['warmup'])
+                percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+                self.stdout.write(
+                    f'{label:<24} {percentiles[49]:>8.2f} {percentiles[98]:>8.2f} {statistics.fmean(latencies):>8.2f}'
+                )
+        finally:
+            for alias, conn_max_age in configured.items():
+                connections[alias].settings_dict['CONN_MAX_AGE'] = conn_max_age
+
+    def default_host(self):
+        hosts = [host for host in settings.ALLOWED_HOSTS if host != '*' and not host.startswith('.')]
+        return hosts[0] if hosts else 'localhost'
+
+    def get_user(self, username):
+        users = User.objects.filter(username=username) if username else User.objects.filter(is_superuser=True)
+        user = users.order_by('pk').first()
+        if user is None:
+            raise CommandError('No user to authenticate as, pass --username')
+        return user
+
+    def runs(self, conn_max_ages):
+        if any(getattr(connections[alias], 'pool', None) is not None for alias in connections):
+            return [('pooled', None)]
+        if not conn_max_ages:
+            return [(f"CONN_MAX_AGE={connections['default'].settings_dict['CONN_MAX_AGE']}", None)]
+        return [(f'CONN_MAX_AGE={value}', value) for value in conn_max_ages]
+
+    def set_conn_max_age(self, value):
+        for alias in connections:
+            connections[alias].close()
+            connections[alias].settings_dict['CONN_MAX_AGE'] = value
+
+    def measure(self, client, path, requests, warmup):
+        """Latency in ms of each request"""
+        for _ in range(warmup):
+            self.check_response(self.request(client, path))
+        latencies = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = self.request(client, path)
+            latencies.append((time.perf_counter() - started) * 1000)
+            self.check_response(response)
+        return latencies
+
+    def request(self, client, path):
+        # The test client skips the connection housekeeping a WSGI server
+        # triggers around each request, run it like the real handler does
+        close_old_connections()
+        response = client.get(path)
+        close_old_connections()
+        return response
+
+    def check_response(self, response):
+        if response.status_code != 200:
+            raise CommandError(f'Request failed with status {response.status_code}')
@@ -0,0 +1,55 @@
+import itertools
+import time
+
+from django.core.management.base import BaseCommand
+from kombu.serialization import dumps, loads
+
+from learning.models import Report
+from learning.services import iter_report_rows
+
+SERIALIZERS = ['pickle', 'json', 'msgpack']
+
+
+class Command(BaseCommand):
+    help = 'Compare Celery message sizes and serialization throughput for the report task payloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help='Report rows in the inline result payload')
+        parser.add_argument('--iterations', type=int, default=200, help='Round trips per measurement')
+
+    def handle(self, *args, **options):
+        report = Report.objects.first() or Report(pk=1, kind=Report.KIND_SCHOOL)
+        rows = list(itertools.islice(iter_report_rows(Report(kind=Report.KIND_SCHOOL)), options['rows']))
+        # Make rows serializable by every format, as a task returning them would have to
+        rows = [[str(value) if value is not None else None for value in row] for row in rows]
+
+        payloads = [
+            ('task args: model instance', ((report,), {}), ['pickle']),
+            ('task args: primary key', ((report.pk,), {}), SERIALIZERS),
+            ('result: inline rows', rows, SERIALIZERS),
+            ('result: storage reference', {'report_id': report.pk, 'file': 'reports/2025/01/report.csv',
+                                           'row_count': len(rows)}, SERIALIZERS),
+        ]
+
+        self.stdout.write(f"{'payload':<30} {'serializer':<10} {'bytes':>10} {'round trips/s':>15}")
+        for name, payload, serializers in payloads:
+            for serializer in serializers:
+                result = self.measure(payload, serializer, options['iterations'])
+                if result is None:
+                    self.stdout.write(f'{name:<30} {serializer:<10} {"unavailable":>10}')
+                    continue
+                size, rate = result
+                self.stdout.write(f'{name:<30} {serializer:<10} {size:>10,} {rate:>15,.0f}')
+
+    def measure(self, payload, serializer, iterations):
+        try:
+            content_type, encoding, body = dumps(payload, serializer=serializer)
+        except Exception:
+            # e.g. msgpack is not installed
+            return None
+        started = time.perf_counter()
+        for _ in range(iterations):
+            content_type, encoding, body = dumps(payload, serializer=serializer)
+            loads(body, content_type, encoding, accept={content_type})
+        elapsed = time.perf_counter() - started
+        return len(body), iterations / elapsed if elapsed else float('inf')
@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from learning.models import Classroom, Term
+from learning.services import score_type_weights, store_term_results
+
+
+class Command(BaseCommand):
+    help = 'Compute and store the weighted term grades and GPAs of every student, e.g. for report cards'
+
+    def add_arguments(self, parser):
+        parser.add_argument('term', type=int, help='Term id')
+        parser.add_argument(
+            '--classroom', type=int, action='append', help='Only recompute these classrooms, default the whole school'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            term = Term.objects.get(pk=options['term'])
+        except Term.DoesNotExist as exc:
+            raise CommandError(f"Term {options['term']} does not exist") from exc
+
+        classrooms = None
+        if options['classroom']:
+            classrooms = Classroom.objects.filter(pk__in=options['classroom'])
+
+        weights = ', '.join(f'{score_type}={weight}' for score_type, weight in score_type_weights().items())
+        self.stdout.write(f'Computing term results of {term} with weights {weights}...')
+        started = time.perf_counter()
+        count = store_term_results(term, classrooms=classrooms)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'Stored {count} term results in {elapsed:.2f}s'))
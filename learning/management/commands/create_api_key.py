@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from learning.models import ApiKey
+
+
+class Command(BaseCommand):
+    help = 'Create an API key acting as a user, e.g. for the SIS integration, and print it once'
+
+    def add_arguments(self, parser):
+        parser.add_argument('username', help='User the key acts as')
+        parser.add_argument('--name', required=True, help='What the key is for')
+        parser.add_argument('--expires-in-days', type=int, help='Expire the key after this many days')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist as exc:
+            raise CommandError(f"User {options['username']} does not exist") from exc
+
+        expires_at = None
+        if options['expires_in_days'] is not None:
+            expires_at = timezone.now() + timedelta(days=options['expires_in_days'])
+        api_key, key = ApiKey.objects.create_key(user, options['name'], expires_at=expires_at)
+        self.stderr.write(f'Created API key {api_key} for {user.username}, it cannot be shown again:')
+        self.stdout.write(key)
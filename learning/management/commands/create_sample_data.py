@@ -1,8 +1,30 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from learning.models import Teacher, Classroom, Student, Subject, Score
+from django.db import connection, transaction
+from django.utils import timezone
+from learning.models import Teacher, Classroom, Student, Subject, Score, ScoreAggregate
+from learning.services import allocate_student_ids, rebuild_score_aggregates, student_id_prefix
 from datetime import date, timedelta
 import random
+import time
+
+SUBJECTS = [
+    {'name': 'Toán học', 'code': 'MATH'},
+    {'name': 'Ngữ văn', 'code': 'LIT'},
+    {'name': 'Tiếng Anh', 'code': 'ENG'},
+    {'name': 'Vật lý', 'code': 'PHY'},
+    {'name': 'Hóa học', 'code': 'CHEM'},
+    {'name': 'Sinh học', 'code': 'BIO'},
+    {'name': 'Lịch sử', 'code': 'HIST'},
+    {'name': 'Địa lý', 'code': 'GEO'},
+]
+
+SCALE_BATCH_SIZE = 5000
+SCALE_SCHOOL_YEAR = '2024-2025'
+SCALE_YEAR_START = date(2024, 9, 5)
+SCALE_SCHOOL_DAYS = 270
+SCALE_GRADES = ['10', '11', '12']
 
 
 class Command(BaseCommand):
@@ -19,18 +41,40 @@ class Command(BaseCommand):
             action='store_true',
             help='Create minimal test data with specific usernames and passwords',
         )
+        parser.add_argument(
+            '--scale',
+            action='store_true',
+            help='Bulk generate a load-test dataset of schools x classrooms x students x scores',
+        )
+        parser.add_argument('--schools', type=int, default=1, help='Number of schools in --scale mode')
+        parser.add_argument('--classrooms', type=int, default=10, help='Classrooms per school in --scale mode')
+        parser.add_argument('--students', type=int, default=30, help='Students per classroom in --scale mode')
+        parser.add_argument('--scores', type=int, default=20, help='Scores per student in --scale mode')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed, the same seed generates the same data')
 
     def handle(self, *args, **options):
         if options['clear']:
             self.stdout.write('Clearing existing data...')
-            Score.objects.all().delete()
+            # Score receivers maintain the rollup and the response cache row by
+            # row; everything they would update is deleted below, so skip them
+            ScoreAggregate.objects.all().delete()
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {connection.ops.quote_name(Score._meta.db_table)}')
             Student.objects.all().delete()
             Classroom.objects.all().delete()
             Subject.objects.all().delete()
             Teacher.objects.all().delete()
             User.objects.filter(is_superuser=False).delete()
 
-        if options['test_data']:
+        if options['scale']:
+            self.create_scale_data(
+                schools=options['schools'],
+                classrooms_per_school=options['classrooms'],
+                students_per_classroom=options['students'],
+                scores_per_student=options['scores'],
+                seed=options['seed'],
+            )
+        elif options['test_data']:
             self.create_test_data()
         else:
             self.create_full_sample_data()
@@ -148,6 +192,8 @@ class Command(BaseCommand):
         scores_created = 0
 
         for student in students:
+            # Scores are unique per (student, subject, score_type, date)
+            existing = set(student.scores.values_list('subject_id', 'score_type', 'date'))
             # Each student has scores for 3-4 subjects
             student_subjects = random.sample(subjects, random.randint(3, 4))
             
@@ -162,20 +208,21 @@ class Command(BaseCommand):
                     else:
                         score_value = random.uniform(5.0, 7.0)
                     
-                    try:
-                        score = Score.objects.create(
-                            student=student,
-                            subject=subject,
-                            score=round(score_value, 2),
-                            score_type=random.choice(score_types),
-                            date=score_date,
-                            teacher=teacher,
-                            notes=random.choice(['', 'Bài làm tốt', 'Cần cải thiện', 'Xuất sắc', 'Đạt yêu cầu'])
-                        )
-                        scores_created += 1
-                    except Exception as e:
-                        # Skip if duplicate score exists
+                    score_type = random.choice(score_types)
+                    if (subject.pk, score_type, score_date) in existing:
                         continue
+                    existing.add((subject.pk, score_type, score_date))
+
+                    Score.objects.create(
+                        student=student,
+                        subject=subject,
+                        score=round(score_value, 2),
+                        score_type=score_type,
+                        date=score_date,
+                        teacher=teacher,
+                        notes=random.choice(['', 'Bài làm tốt', 'Cần cải thiện', 'Xuất sắc', 'Đạt yêu cầu'])
+                    )
+                    scores_created += 1
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -197,19 +244,8 @@ class Command(BaseCommand):
         self.stdout.write('Creating full sample data...')
 
         # Create subjects
-        subjects_data = [
-            {'name': 'Toán học', 'code': 'MATH'},
-            {'name': 'Ngữ văn', 'code': 'LIT'},
-            {'name': 'Tiếng Anh', 'code': 'ENG'},
-            {'name': 'Vật lý', 'code': 'PHY'},
-            {'name': 'Hóa học', 'code': 'CHEM'},
-            {'name': 'Sinh học', 'code': 'BIO'},
-            {'name': 'Lịch sử', 'code': 'HIST'},
-            {'name': 'Địa lý', 'code': 'GEO'},
-        ]
-
         subjects = []
-        for subject_data in subjects_data:
+        for subject_data in SUBJECTS:
             subject, created = Subject.objects.get_or_create(
                 code=subject_data['code'],
                 defaults={'name': subject_data['name']}
@@ -282,7 +318,8 @@ class Command(BaseCommand):
 
         students = []
         for classroom in classrooms:
-            for i in range(random.randint(25, 35)):
+            student_ids = allocate_student_ids([student_id_prefix(classroom.school_year)] * random.randint(25, 35))
+            for student_id in student_ids:
                 full_name = f"{random.choice(last_names)} {random.choice(first_names)}"
                 birth_date = date(2006 + int(classroom.grade_level) - 10, 
                                 random.randint(1, 12), random.randint(1, 28))
@@ -292,7 +329,7 @@ class Command(BaseCommand):
                     birth_date=birth_date,
                     gender=random.choice(['M', 'F']),
                     classroom=classroom,
-                    student_id=f"{classroom.grade_level}{classroom.name[-2:]}{i+1:02d}",
+                    student_id=student_id,
                     email=f"student{len(students)+1}@student.edu.vn",
                     phone=f"098{random.randint(1000000, 9999999)}",
                     parent_name=f"{random.choice(last_names)} {random.choice(['Văn', 'Thị'])} {random.choice(first_names)}",
@@ -308,6 +345,8 @@ class Command(BaseCommand):
         scores_created = 0
 
         for student in students:
+            # Students are new, so only scores generated here can collide
+            existing = set()
             for subject in random.sample(subjects, random.randint(4, 6)):
                 for _ in range(random.randint(3, 8)):
                     score_date = date.today() - timedelta(days=random.randint(1, 90))
@@ -317,20 +356,21 @@ class Command(BaseCommand):
                     if random.random() < 0.7:
                         score_value = random.uniform(7.0, 10.0)
                     
-                    try:
-                        Score.objects.create(
-                            student=student,
-                            subject=subject,
-                            score=round(score_value, 2),
-                            score_type=random.choice(score_types),
-                            date=score_date,
-                            teacher=student.classroom.teacher,
-                            notes=random.choice(['', '', '', 'Bài làm tốt', 'Cần cải thiện', 'Xuất sắc'])
-                        )
-                        scores_created += 1
-                    except:
-                        # Skip if duplicate score exists
-                        pass
+                    score_type = random.choice(score_types)
+                    if (subject.pk, score_type, score_date) in existing:
+                        continue
+                    existing.add((subject.pk, score_type, score_date))
+
+                    Score.objects.create(
+                        student=student,
+                        subject=subject,
+                        score=round(score_value, 2),
+                        score_type=score_type,
+                        date=score_date,
+                        teacher=student.classroom.teacher,
+                        notes=random.choice(['', '', '', 'Bài làm tốt', 'Cần cải thiện', 'Xuất sắc'])
+                    )
+                    scores_created += 1
 
         self.stdout.write(f'Created {scores_created} scores')
         self.stdout.write(
@@ -342,4 +382,127 @@ class Command(BaseCommand):
                 f'- {len(students)} students\n'
                 f'- {scores_created} scores'
             )
-        )
\ No newline at end of file
+        )
+
+    def create_scale_data(self, schools, classrooms_per_school, students_per_classroom, scores_per_student, seed):
+        """
+        Bulk generate a load-test dataset.
+
+        Rows are written with bulk_create in batches inside one transaction and
+        unique keys (usernames, classroom names, student ids and the
+        (student, subject, score_type, date) key of scores) are generated
+        distinct up front, so nothing is inserted twice. The same seed always
+        generates the same dataset.
+        """
+        rng = random.Random(seed)
+        started = time.perf_counter()
+        for subject_data in SUBJECTS:
+            Subject.objects.get_or_create(code=subject_data['code'], defaults={'name': subject_data['name']})
+        subjects = list(Subject.objects.filter(is_active=True).order_by('code'))
+
+        score_types = [score_type for score_type, _ in Score.SCORE_TYPES]
+        max_scores = len(subjects) * len(score_types) * SCALE_SCHOOL_DAYS
+        if scores_per_student > max_scores:
+            raise CommandError(f'At most {max_scores} distinct scores per student are possible')
+        if Classroom.objects.filter(name__startswith='SC01-').exists():
+            raise CommandError('Scale data already exists, run with --clear to regenerate it')
+
+        with transaction.atomic():
+            teachers = self.create_scale_teachers(schools * classrooms_per_school)
+            classrooms = Classroom.objects.bulk_create(
+                Classroom(
+                    name=f'SC{school + 1:02d}-{SCALE_GRADES[index % len(SCALE_GRADES)]}A{index + 1:03d}',
+                    teacher=teachers[school * classrooms_per_school + index],
+                    grade_level=SCALE_GRADES[index % len(SCALE_GRADES)],
+                    school_year=SCALE_SCHOOL_YEAR,
+                )
+                for school in range(schools)
+                for index in range(classrooms_per_school)
+            )
+            self.stdout.write(f'Created {len(teachers)} teachers and {len(classrooms)} classrooms')
+
+            students = self.create_scale_students(rng, classrooms, students_per_classroom)
+            self.stdout.write(f'Created {len(students)} students')
+
+            scores_created = self.create_scale_scores(rng, students, subjects, score_types, scores_per_student)
+            self.stdout.write(f'Created {scores_created} scores')
+
+            rebuild_score_aggregates()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Successfully created scale data in {elapsed:.1f}s '
+            f'({scores_created / elapsed:,.0f} scores/s)'
+        ))
+
+    def create_scale_teachers(self, count):
+        # Hashing is slow on purpose, every scale teacher shares the same password hash
+        password = make_password('password123')
+        users = User.objects.bulk_create(
+            (User(username=f'scale_teacher_{i}', password=password) for i in range(1, count + 1)),
+            batch_size=SCALE_BATCH_SIZE,
+        )
+        return Teacher.objects.bulk_create(
+            (
+                Teacher(user=user, full_name=f'Scale Teacher {i}', email=f'scale_teacher_{i}@school.edu.vn')
+                for i, user in enumerate(users, 1)
+            ),
+            batch_size=SCALE_BATCH_SIZE,
+        )
+
+    def create_scale_students(self, rng, classrooms, students_per_classroom):
+        first_names = ['An', 'Bình', 'Cường', 'Dung', 'Em', 'Phúc', 'Giang', 'Hà', 'Khánh', 'Linh']
+        last_names = ['Nguyễn', 'Trần', 'Lê', 'Phạm', 'Hoàng', 'Phan', 'Vũ', 'Võ', 'Đặng', 'Bùi']
+        students = []
+        for classroom in classrooms:
+            birth_year = 2006 + int(classroom.grade_level) - 10
+            students.extend(
+                Student(
+                    full_name=f'{rng.choice(last_names)} {rng.choice(first_names)}',
+                    birth_date=date(birth_year, rng.randint(1, 12), rng.randint(1, 28)),
+                    gender=rng.choice('MF'),
+                    classroom=classroom,
+                    student_id=f'{classroom.name}-{i:04d}',
+                )
+                for i in range(1, students_per_classroom + 1)
+            )
+        return Student.objects.bulk_create(students, batch_size=SCALE_BATCH_SIZE)
+
+    def create_scale_scores(self, rng, students, subjects, score_types, scores_per_student):
+        """
+        Insert the scores with a plain executemany.
+
+        Building a million model instances and compiling them through
+        bulk_create costs far more than the inserts themselves; the generated
+        rows are already valid and no signal needs to see them (the rollup is
+        rebuilt afterwards).
+        """
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+        subject_ids = [subject.pk for subject in subjects]
+        columns = ['student_id', 'subject_id', 'score', 'score_type', 'date', 'teacher_id', 'created_at', 'updated_at']
+        sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            connection.ops.quote_name(Score._meta.db_table),
+            ', '.join(connection.ops.quote_name(column) for column in columns),
+            ', '.join(['%s'] * len(columns)),
+        )
+        days = [(SCALE_YEAR_START + timedelta(days=day)).isoformat() for day in range(SCALE_SCHOOL_DAYS)]
+
+        created = 0
+        batch = []
+        with connection.cursor() as cursor:
+            for student in students:
+                keys = set()
+                while len(keys) < scores_per_student:
+                    keys.add((rng.choice(subject_ids), rng.choice(score_types), rng.randrange(SCALE_SCHOOL_DAYS)))
+                teacher_id = student.classroom.teacher_id
+                # Sorted so the seed, not set iteration order, decides the score values
+                for subject_id, score_type, day in sorted(keys):
+                    score = f'{rng.uniform(4.0, 10.0):.2f}'
+                    batch.append((student.pk, subject_id, score, score_type, days[day], teacher_id, now, now))
+                if len(batch) >= SCALE_BATCH_SIZE:
+                    cursor.executemany(sql, batch)
+                    created += len(batch)
+                    batch = []
+            if batch:
+                cursor.executemany(sql, batch)
+        return created + len(batch)
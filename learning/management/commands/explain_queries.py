@@ -0,0 +1,87 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+
+from learning.models import Classroom, Score, Student, Subject, Teacher
+from learning.services import filter_scores, score_statistics_rows
+
+PAGE_SIZE = 50
+
+
+class Command(BaseCommand):
+    help = 'Print the EXPLAIN plans of the query shapes the learning views run'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--compare',
+            action='store_true',
+            help=(
+                'Also print the plans without the access pattern indexes, dropped in a transaction that is rolled '
+                'back. The dropped indexes lock their tables (ACCESS EXCLUSIVE on PostgreSQL) until the command '
+                'ends: requires --i-know-this-locks'
+            ),
+        )
+        parser.add_argument(
+            '--i-know-this-locks',
+            action='store_true',
+            help='Allow --compare to block every query on the scores, students and classrooms tables while it runs',
+        )
+        parser.add_argument('--analyze', action='store_true', help='Run EXPLAIN ANALYZE where the database supports it')
+
+    def handle(self, *args, **options):
+        explain_options = {'analyze': True} if options['analyze'] and connection.vendor == 'postgresql' else {}
+        if options['compare'] and not options['i_know_this_locks']:
+            raise CommandError(
+                '--compare locks the scores, students and classrooms tables until it ends, '
+                'pass --i-know-this-locks to run it anyway'
+            )
+        if options['compare']:
+            with transaction.atomic():
+                self.drop_indexes()
+                self.stdout.write(self.style.MIGRATE_HEADING('Without access pattern indexes'))
+                self.explain_all(explain_options)
+                transaction.set_rollback(True)
+            self.stdout.write(self.style.MIGRATE_HEADING('With access pattern indexes'))
+        self.explain_all(explain_options)
+
+    def drop_indexes(self):
+        # Plain statements instead of the schema editor context, which SQLite
+        # refuses to enter inside a transaction
+        sql_delete_index = connection.SchemaEditorClass.sql_delete_index
+        quote_name = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            for model in (Score, Student, Classroom):
+                for index in model._meta.indexes:
+                    cursor.execute(sql_delete_index % {
+                        'name': quote_name(index.name),
+                        'table': quote_name(model._meta.db_table),
+                    })
+
+    def explain_all(self, explain_options):
+        for name, queryset in self.query_shapes():
+            self.stdout.write(self.style.SQL_TABLE(name))
+            self.stdout.write(queryset.explain(**explain_options))
+            self.stdout.write('')
+
+    def query_shapes(self):
+        """The queries behind the hot endpoints, for the first row of each table"""
+        teacher = Teacher.objects.order_by('pk').first() or Teacher(pk=0)
+        classroom = Classroom.objects.order_by('pk').first() or Classroom(pk=0)
+        student = Student.objects.order_by('pk').first() or Student(pk=0)
+        subject = Subject.objects.order_by('pk').first() or Subject(pk=0)
+        latest = Score.objects.order_by('-date').values_list('date', flat=True).first()
+
+        yield 'score-list', Score.objects.order_by('-date', 'id')[:PAGE_SIZE]
+        yield 'score-list (teacher)', Score.objects.filter(
+            Q(teacher=teacher) | Q(student__classroom__teacher=teacher)
+        ).order_by('-date', 'id')[:PAGE_SIZE]
+        yield 'score-by-classroom', Score.objects.filter(student__classroom=classroom).order_by('-date', 'id')[:PAGE_SIZE]
+        yield 'student-scores', student.scores.order_by('-date', 'id')[:PAGE_SIZE]
+        yield 'subject-scores', subject.scores.order_by('-date', 'id')[:PAGE_SIZE]
+        yield 'classroom-students', classroom.students.filter(is_active=True).order_by('full_name', 'id')[:PAGE_SIZE]
+        yield 'teacher-classrooms', teacher.classrooms.filter(is_active=True).order_by('name', 'id')[:PAGE_SIZE]
+        if latest:
+            scores = Score.objects.filter(student__classroom=classroom, subject__is_active=True)
+            scores = filter_scores(scores, date_from=latest.replace(day=1), date_to=latest)
+            yield 'classroom-stats (date range)', score_statistics_rows(scores)
+
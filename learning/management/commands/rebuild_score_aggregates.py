@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from learning.models import ScoreAggregate
+from learning.services import (
+    find_score_aggregate_drift,
+    rebuild_score_aggregates,
+)
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the ScoreAggregate rollup table from scores, or verify it for drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only compare the rollup table with the scores and fail if they drifted apart',
+        )
+
+    def handle(self, *args, **options):
+        if options['verify']:
+            self.verify()
+            return
+
+        self.stdout.write('Rebuilding score aggregates...')
+        rebuild_score_aggregates()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {ScoreAggregate.objects.count()} score aggregates'))
+
+    def verify(self):
+        drift = find_score_aggregate_drift()
+        if not any(drift.values()):
+            self.stdout.write(self.style.SUCCESS('Score aggregates are up to date'))
+            return
+
+        for kind, keys in drift.items():
+            if keys:
+                self.stdout.write(f'{len(keys)} {kind} aggregates, e.g. (student, subject, score_type) {keys[:5]}')
+        raise CommandError('Score aggregates drifted, run rebuild_score_aggregates to fix them')
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from learning import views  # noqa: F401  registers the cached actions
+from learning.cache import response_cache_stats
+
+
+class Command(BaseCommand):
+    help = 'Show the hit rate of every cached API response'
+
+    def handle(self, *args, **options):
+        stats = response_cache_stats()
+        for name, counters in stats.items():
+            requests = counters['hits'] + counters['misses']
+            rate = f"{counters['hits'] / requests:.1%}" if requests else '-'
+            self.stdout.write(f"{name}: {counters['hits']} hits, {counters['misses']} misses, hit rate {rate}")
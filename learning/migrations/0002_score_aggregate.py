@@ -0,0 +1,32 @@
+# Generated by Django 5.1 on 2026-10-18 16:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoreAggregate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score_type', models.CharField(choices=[('quiz', 'Quiz'), ('midterm', 'Midterm'), ('final', 'Final'), ('assignment', 'Assignment'), ('participation', 'Participation')], max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('total_squares', models.DecimalField(decimal_places=4, default=0, max_digits=14)),
+                ('min_score', models.DecimalField(decimal_places=2, max_digits=4)),
+                ('max_score', models.DecimalField(decimal_places=2, max_digits=4)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='score_aggregates', to='learning.student')),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='score_aggregates', to='learning.subject')),
+            ],
+            options={
+                'unique_together': {('student', 'subject', 'score_type')},
+            },
+        ),
+    ]
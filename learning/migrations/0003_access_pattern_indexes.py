@@ -0,0 +1,41 @@
+# Generated by Django 5.1 on 2026-10-18 17:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0002_score_aggregate'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='score',
+            options={'ordering': ['-date', 'id']},
+        ),
+        migrations.AddIndex(
+            model_name='classroom',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['teacher', 'name'], name='classroom_active_teacher_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='score',
+            index=models.Index(fields=['-date', 'id'], name='score_date_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='score',
+            index=models.Index(fields=['student', '-date', 'subject', 'score'], name='score_student_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='score',
+            index=models.Index(fields=['subject', '-date'], name='score_subject_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='score',
+            index=models.Index(fields=['teacher', '-date'], name='score_teacher_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['classroom', 'full_name', 'id'], name='student_active_classroom_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1 on 2026-10-18 17:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0004_report'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Term',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-start_date', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TermResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weighted_average', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('score_count', models.PositiveIntegerField(default=0)),
+                ('computed_at', models.DateTimeField()),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='term_results', to='learning.student')),
+                ('subject', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='term_results', to='learning.subject')),
+                ('term', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='results', to='learning.term')),
+            ],
+            options={
+                'ordering': ['term', 'student', 'subject'],
+                'constraints': [models.UniqueConstraint(fields=('term', 'student', 'subject'), name='term_result_subject_unique'), models.UniqueConstraint(condition=models.Q(('subject__isnull', True)), fields=('term', 'student'), name='term_result_gpa_unique')],
+            },
+        ),
+    ]
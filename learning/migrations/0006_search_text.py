@@ -0,0 +1,104 @@
+# Generated by Django 5.1 on 2026-10-18 17:49
+
+import unicodedata
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+import learning.models.search
+
+# Searchable fields of each model as of this migration
+SEARCH_FIELDS = {
+    'classroom': ('name', 'grade_level', 'school_year'),
+    'student': ('full_name', 'student_id', 'email'),
+    'subject': ('name', 'code'),
+    'teacher': ('full_name', 'email'),
+}
+BACKFILL_BATCH_SIZE = 2000
+# learning.search.normalize_search_text as of this migration
+FOLDED_LETTERS = str.maketrans({'đ': 'd', 'Đ': 'd', 'ø': 'o', 'Ø': 'o', 'ł': 'l', 'Ł': 'l', 'ß': 'ss'})
+
+
+def normalize_search_text(*values):
+    text = ' '.join(str(value) for value in values if value not in (None, ''))
+    text = unicodedata.normalize('NFKD', text.translate(FOLDED_LETTERS))
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' '.join(text.casefold().split())
+
+
+def backfill_search_text(apps, schema_editor):
+    for model_name, fields in SEARCH_FIELDS.items():
+        model = apps.get_model('learning', model_name)
+        objects = model.objects.using(schema_editor.connection.alias).order_by('pk')
+        batch = []
+        for obj in objects.only('pk', *fields).iterator(chunk_size=BACKFILL_BATCH_SIZE):
+            obj.search_text = normalize_search_text(*(getattr(obj, name) for name in fields))
+            batch.append(obj)
+            if len(batch) == BACKFILL_BATCH_SIZE:
+                objects.bulk_update(batch, ['search_text'])
+                batch = []
+        objects.bulk_update(batch, ['search_text'])
+
+
+class CreateTrigramExtension(TrigramExtension):
+    """TrigramExtension, also skipped on other databases when unapplied, not only when applied"""
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0005_term_results'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='classroom',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='subject',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='teacher',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+        CreateTrigramExtension(),
+        migrations.AddIndex(
+            model_name='classroom',
+            index=learning.models.search.TrigramIndex(
+                fields=['search_text'], name='learning_classroom_search_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=learning.models.search.TrigramIndex(
+                fields=['search_text'], name='learning_student_search_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='subject',
+            index=learning.models.search.TrigramIndex(
+                fields=['search_text'], name='learning_subject_search_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='teacher',
+            index=learning.models.search.TrigramIndex(
+                fields=['search_text'], name='learning_teacher_search_trgm', opclasses=['gin_trgm_ops']
+            ),
+        ),
+    ]
@@ -3,5 +3,10 @@ from .classroom import Classroom
 from .student import Student
 from .subject import Subject
 from .score import Score
+from .score_aggregate import ScoreAggregate
+from .report import Report
+from .term import Term, TermResult
+from .api_key import ApiKey
 
-__all__ = ['Teacher', 'Classroom', 'Student', 'Subject', 'Score']
\ No newline at end of file
+__all__ = ['Teacher', 'Classroom', 'Student', 'Subject', 'Score', 'ScoreAggregate', 'Report', 'Term', 'TermResult',
+           'ApiKey']
\ No newline at end of file
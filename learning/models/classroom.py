@@ -1,7 +1,24 @@
 from django.db import models
 
+from .display import loaded_related
+from .search import SearchableModel, SearchableQuerySet, TrigramIndex
+from .teacher import Teacher
+
+
+class ClassroomQuerySet(SearchableQuerySet):
+    def with_students_count(self):
+        return self.annotate(students_count=models.Count('students'))
+
+    def with_teacher(self):
+        """Load the teacher, its user and its classrooms count in one extra query"""
+        teachers = Teacher.objects.select_related('user').with_classrooms_count()
+        return self.prefetch_related(models.Prefetch('teacher', queryset=teachers))
+
+
+class Classroom(SearchableModel):
+    SEARCH_FIELDS = ('name', 'grade_level', 'school_year')
+    DISPLAY_RELATED = ('teacher',)
 
-class Classroom(models.Model):
     name = models.CharField(max_length=50, unique=True)
     teacher = models.ForeignKey('Teacher', on_delete=models.CASCADE, related_name='classrooms')
     description = models.TextField(blank=True, null=True)
@@ -11,8 +28,20 @@ class Classroom(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ClassroomQuerySet.as_manager()
+
     def __str__(self):
-        return f"{self.name} - {self.teacher.full_name}"
+        teacher = loaded_related(self, 'teacher')
+        return f"{self.name} - {teacher.full_name}" if teacher is not None else self.name
 
     class Meta:
-        ordering = ['name']
\ No newline at end of file
+        ordering = ['name']
+        indexes = [
+            # Active classrooms of a teacher, in the order the listings page them
+            models.Index(
+                fields=['teacher', 'name'],
+                condition=models.Q(is_active=True),
+                name='classroom_active_teacher_idx',
+            ),
+            TrigramIndex(fields=['search_text'], opclasses=['gin_trgm_ops'], name='learning_classroom_search_trgm'),
+        ]
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+String representations that never query.
+
+``__str__`` of a model may only show a related object that is already
+loaded, read with ``loaded_related``, and falls back to its own columns
+otherwise: rendering a log line, an admin row or a select box option never
+costs a query. A model lists the relations its ``__str__`` shows in
+``DISPLAY_RELATED``, and ``for_display`` joins them to a queryset so the
+choices built from it get the full labels.
+"""
+
+
+def loaded_related(instance, field_name):
+    """The object of the relation ``field_name`` if it is already loaded, otherwise None without a query"""
+    field = instance._meta.get_field(field_name)
+    return field.get_cached_value(instance) if field.is_cached(instance) else None
+
+
+def for_display(queryset):
+    """Join the relations ``__str__`` of the rows of ``queryset`` shows"""
+    related = getattr(queryset.model, 'DISPLAY_RELATED', ())
+    return queryset.select_related(*related) if related else queryset
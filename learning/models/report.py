@@ -0,0 +1,52 @@
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class Report(models.Model):
+    """
+    A report generated in the background by tasks.reports.generate_report.
+
+    The artifact is written to the default storage (``STORAGES["default"]``).
+    """
+    KIND_CLASSROOM = 'classroom'
+    KIND_TEACHER = 'teacher'
+    KIND_SCHOOL = 'school'
+    KIND_CHOICES = [
+        (KIND_CLASSROOM, 'Classroom'),
+        (KIND_TEACHER, 'Teacher'),
+        (KIND_SCHOOL, 'School'),
+    ]
+    FORMAT_CHOICES = [
+        ('csv', 'CSV'),
+        ('xlsx', 'Excel'),
+        ('json', 'JSON'),
+    ]
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCESS = 'success'
+    STATUS_FAILURE = 'failure'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_SUCCESS, 'Success'),
+        (STATUS_FAILURE, 'Failure'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    format = models.CharField(max_length=10, choices=FORMAT_CHOICES, default='csv')
+    classroom = models.ForeignKey('Classroom', on_delete=models.CASCADE, related_name='reports', blank=True, null=True)
+    teacher = models.ForeignKey('Teacher', on_delete=models.CASCADE, related_name='reports', blank=True, null=True)
+    requested_by = models.ForeignKey(User, on_delete=models.SET_NULL, related_name='reports', blank=True, null=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    task_id = models.CharField(max_length=255, blank=True, null=True)
+    file = models.FileField(upload_to='reports/%Y/%m/', blank=True, null=True)
+    row_count = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return f"{self.get_kind_display()} report #{self.pk} ({self.format}, {self.status})"
+
+    class Meta:
+        ordering = ['-created_at', '-id']
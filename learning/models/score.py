@@ -1,6 +1,32 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from .display import loaded_related
+from .subject import Subject
+from .teacher import Teacher
+
+
+class ScoreQuerySet(models.QuerySet):
+    def with_nested(self, fields=None):
+        """
+        Load the objects ScoreSerializer nests: the student and its classroom in
+        the same query, subject and teacher with their counts in one prefetch each.
+
+        When ``fields`` is given, only the nested objects named in it are loaded.
+        """
+        queryset = self
+        if fields is None or 'student' in fields:
+            queryset = queryset.select_related('student__classroom')
+        if fields is None or 'subject' in fields:
+            queryset = queryset.prefetch_related(
+                models.Prefetch('subject', queryset=Subject.objects.with_scores_count()),
+            )
+        if fields is None or 'teacher' in fields:
+            queryset = queryset.prefetch_related(
+                models.Prefetch('teacher', queryset=Teacher.objects.select_related('user').with_classrooms_count()),
+            )
+        return queryset
+
 
 class Score(models.Model):
     SCORE_TYPES = [
@@ -10,6 +36,7 @@ class Score(models.Model):
         ('assignment', 'Assignment'),
         ('participation', 'Participation'),
     ]
+    DISPLAY_RELATED = ('student', 'subject')
 
     student = models.ForeignKey('Student', on_delete=models.CASCADE, related_name='scores')
     subject = models.ForeignKey('Subject', on_delete=models.CASCADE, related_name='scores')
@@ -25,9 +52,25 @@ class Score(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ScoreQuerySet.as_manager()
+
     def __str__(self):
-        return f"{self.student.full_name} - {self.subject.name}: {self.score}"
+        # The ids stand in for the student and subject when they are not loaded
+        student = loaded_related(self, 'student')
+        subject = loaded_related(self, 'subject')
+        student_name = student.full_name if student is not None else self.student_id
+        subject_name = subject.name if subject is not None else self.subject_id
+        return f"{student_name} - {subject_name}: {self.score}"
 
     class Meta:
-        ordering = ['-date', 'student__full_name']
-        unique_together = ['student', 'subject', 'score_type', 'date']
\ No newline at end of file
+        # Served by score_date_id_idx; ordering by the student name needed a join
+        ordering = ['-date', 'id']
+        unique_together = ['student', 'subject', 'score_type', 'date']
+        # The unique index already serves lookups by student and (student, subject)
+        indexes = [
+            models.Index(fields=['-date', 'id'], name='score_date_id_idx'),
+            # Student score history; covers the classroom statistics over a date range
+            models.Index(fields=['student', '-date', 'subject', 'score'], name='score_student_date_idx'),
+            models.Index(fields=['subject', '-date'], name='score_subject_date_idx'),
+            models.Index(fields=['teacher', '-date'], name='score_teacher_date_idx'),
+        ]
\ No newline at end of file
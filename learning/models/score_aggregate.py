@@ -0,0 +1,27 @@
+from django.db import models
+
+from .score import Score
+
+
+class ScoreAggregate(models.Model):
+    """
+    Running totals of a student's scores in one subject and score type.
+
+    Maintained from Score changes by learning.services.aggregates, so the
+    statistics endpoints can aggregate a few rollup rows instead of every score.
+    """
+    student = models.ForeignKey('Student', on_delete=models.CASCADE, related_name='score_aggregates')
+    subject = models.ForeignKey('Subject', on_delete=models.CASCADE, related_name='score_aggregates')
+    score_type = models.CharField(max_length=20, choices=Score.SCORE_TYPES)
+    count = models.PositiveIntegerField(default=0)
+    total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    total_squares = models.DecimalField(max_digits=14, decimal_places=4, default=0)
+    min_score = models.DecimalField(max_digits=4, decimal_places=2)
+    max_score = models.DecimalField(max_digits=4, decimal_places=2)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.student_id}/{self.subject_id}/{self.score_type}: {self.count}"
+
+    class Meta:
+        unique_together = ['student', 'subject', 'score_type']
@@ -0,0 +1,74 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+
+from ..search import (
+    SEARCH_TEXT_FIELD,
+    normalize_search_text,
+    search_filter,
+    search_rank,
+    search_terms,
+)
+
+
+class SearchableQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        # bulk_create does not call save(), fill the search text here
+        objs = list(objs)
+        for obj in objs:
+            obj.search_text = obj.build_search_text()
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        if set(fields) & set(self.model.SEARCH_FIELDS):
+            for obj in objs:
+                obj.search_text = obj.build_search_text()
+            fields = [*fields, SEARCH_TEXT_FIELD]
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+    def search(self, query):
+        """Rows whose search text contains every word of ``query``, accents and case ignored"""
+        terms = search_terms(query)
+        return self.filter(search_filter(terms)) if terms else self
+
+    def ranked(self, query):
+        """Order by relevance for ``query``, best first, annotated as ``search_rank``"""
+        return self.annotate(search_rank=search_rank(self, query)).order_by(
+            '-search_rank', *self.model._meta.ordering, 'pk'
+        )
+
+
+class TrigramIndex(GinIndex):
+    """
+    A pg_trgm GIN index, serving the ``LIKE '%word%'`` filters of the search
+    on PostgreSQL. The other databases have no GIN indexes and get a plain
+    index of the fields instead.
+    """
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        if schema_editor.connection.vendor != 'postgresql':
+            return models.Index.create_sql(self, model, schema_editor, using=using, **kwargs)
+        return super().create_sql(model, schema_editor, using=using, **kwargs)
+
+
+class SearchableModel(models.Model):
+    """
+    A model with a ``search_text`` column holding its ``SEARCH_FIELDS``
+    normalized for accent-insensitive search, kept up to date on save and
+    by the bulk operations of SearchableQuerySet.
+    """
+    SEARCH_FIELDS = ()
+
+    search_text = models.TextField(blank=True, default='', editable=False)
+
+    class Meta:
+        abstract = True
+
+    def build_search_text(self):
+        return normalize_search_text(*(getattr(self, name) for name in self.SEARCH_FIELDS))
+
+    def save(self, *args, **kwargs):
+        self.search_text = self.build_search_text()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and set(update_fields) & set(self.SEARCH_FIELDS):
+            kwargs['update_fields'] = {*update_fields, SEARCH_TEXT_FIELD}
+        super().save(*args, **kwargs)
@@ -1,12 +1,17 @@
 from django.db import models
 
+from .display import loaded_related
+from .search import SearchableModel, SearchableQuerySet, TrigramIndex
 
-class Student(models.Model):
+
+class Student(SearchableModel):
     GENDER_CHOICES = [
         ('M', 'Male'),
         ('F', 'Female'),
         ('O', 'Other'),
     ]
+    SEARCH_FIELDS = ('full_name', 'student_id', 'email')
+    DISPLAY_RELATED = ('classroom',)
 
     full_name = models.CharField(max_length=200)
     birth_date = models.DateField()
@@ -23,8 +28,11 @@ class Student(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SearchableQuerySet.as_manager()
+
     def __str__(self):
-        return f"{self.full_name} - {self.classroom.name}"
+        classroom = loaded_related(self, 'classroom')
+        return f"{self.full_name} - {classroom.name}" if classroom is not None else self.full_name
 
     @property
     def age(self):
@@ -33,4 +41,13 @@ class Student(models.Model):
         return today.year - self.birth_date.year - ((today.month, today.day) < (self.birth_date.month, self.birth_date.day))
 
     class Meta:
-        ordering = ['full_name']
\ No newline at end of file
+        ordering = ['full_name']
+        indexes = [
+            # Active students of a classroom, in the order the listings page them
+            models.Index(
+                fields=['classroom', 'full_name', 'id'],
+                condition=models.Q(is_active=True),
+                name='student_active_classroom_idx',
+            ),
+            TrigramIndex(fields=['search_text'], opclasses=['gin_trgm_ops'], name='learning_student_search_trgm'),
+        ]
\ No newline at end of file
@@ -1,15 +1,29 @@
 from django.db import models
 
+from .search import SearchableModel, SearchableQuerySet, TrigramIndex
+
+
+class SubjectQuerySet(SearchableQuerySet):
+    def with_scores_count(self):
+        return self.annotate(scores_count=models.Count('scores'))
+
+
+class Subject(SearchableModel):
+    SEARCH_FIELDS = ('name', 'code')
 
-class Subject(models.Model):
     name = models.CharField(max_length=100, unique=True)
     code = models.CharField(max_length=10, unique=True)  # e.g., "MATH", "LIT", "ENG"
     description = models.TextField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = SubjectQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
     class Meta:
-        ordering = ['name']
\ No newline at end of file
+        ordering = ['name']
+        indexes = [
+            TrigramIndex(fields=['search_text'], opclasses=['gin_trgm_ops'], name='learning_subject_search_trgm'),
+        ]
@@ -1,8 +1,17 @@
 from django.db import models
 from django.contrib.auth.models import User
 
+from .search import SearchableModel, SearchableQuerySet, TrigramIndex
+
+
+class TeacherQuerySet(SearchableQuerySet):
+    def with_classrooms_count(self):
+        return self.annotate(classrooms_count=models.Count('classrooms'))
+
+
+class Teacher(SearchableModel):
+    SEARCH_FIELDS = ('full_name', 'email')
 
-class Teacher(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='teacher_profile')
     full_name = models.CharField(max_length=200)
     email = models.EmailField(unique=True)
@@ -10,8 +19,13 @@ class Teacher(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TeacherQuerySet.as_manager()
+
     def __str__(self):
         return self.full_name
 
     class Meta:
-        ordering = ['full_name']
\ No newline at end of file
+        ordering = ['full_name']
+        indexes = [
+            TrigramIndex(fields=['search_text'], opclasses=['gin_trgm_ops'], name='learning_teacher_search_trgm'),
+        ]
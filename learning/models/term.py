@@ -0,0 +1,43 @@
+from django.db import models
+
+
+class Term(models.Model):
+    """A grading period; term grades weight the scores recorded between its dates"""
+    name = models.CharField(max_length=100)
+    start_date = models.DateField()
+    end_date = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.start_date} - {self.end_date})"
+
+    class Meta:
+        ordering = ['-start_date', 'id']
+
+
+class TermResult(models.Model):
+    """
+    A student's weighted term grade in one subject, or their GPA over every
+    subject when ``subject`` is empty.
+
+    Stored by learning.services.grades.store_term_results for report cards;
+    recompute after changing scores or weights.
+    """
+    term = models.ForeignKey(Term, on_delete=models.CASCADE, related_name='results')
+    student = models.ForeignKey('Student', on_delete=models.CASCADE, related_name='term_results')
+    subject = models.ForeignKey('Subject', on_delete=models.CASCADE, related_name='term_results', blank=True, null=True)
+    weighted_average = models.DecimalField(max_digits=5, decimal_places=2)
+    score_count = models.PositiveIntegerField(default=0)
+    computed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.term_id}/{self.student_id}/{self.subject_id or 'GPA'}: {self.weighted_average}"
+
+    class Meta:
+        ordering = ['term', 'student', 'subject']
+        constraints = [
+            models.UniqueConstraint(fields=['term', 'student', 'subject'], name='term_result_subject_unique'),
+            models.UniqueConstraint(
+                fields=['term', 'student'], condition=models.Q(subject__isnull=True), name='term_result_gpa_unique'
+            ),
+        ]
@@ -0,0 +1,192 @@
+import base64
+import datetime
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    Keeps the microseconds of datetimes and times, which DjangoJSONEncoder
+    truncates to milliseconds: a truncated value would repeat or skip the rows
+    sharing its millisecond. ``decode_cursor`` parses them back with the
+    model field's ``to_python``.
+    """
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over a unique, multi-column ordering.
+
+    The cursor holds the ordering values of the first or last row of the
+    current page and the adjacent page is fetched with a lexicographic
+    ``(a, b) > (x, y)`` filter, so a deep page costs the same as the first one.
+    The ordering must end with a unique column, and ``?ordering=`` from the
+    view's OrderingFilter is honoured with ``id`` appended as the tie-breaker.
+    """
+    ordering = ('-id',)
+    page_size = api_settings.PAGE_SIZE or 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.fields = self.get_ordering(request, queryset, view)
+        model = queryset.model
+
+        values, self.reverse = self.decode_cursor(request, model)
+        ordering = [self._flip(field) for field in self.fields] if self.reverse else list(self.fields)
+        queryset = queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self._after(ordering, values))
+
+        page = list(queryset[:self.page_size + 1])
+        has_more = len(page) > self.page_size
+        page = page[:self.page_size]
+        if self.reverse:
+            page.reverse()
+
+        self.page = page
+        self.has_next = values is not None if self.reverse else has_more
+        self.has_previous = has_more if self.reverse else values is not None
+        return page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'The pagination cursor value.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': f'Number of results to return per page (at most {self.max_page_size}).',
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, request, queryset, view):
+        """The paginator ordering, unless the client picked one through the view's OrderingFilter"""
+        if view is None or OrderingFilter not in getattr(view, 'filter_backends', []):
+            return tuple(self.ordering)
+        ordering_filter = OrderingFilter()
+        if ordering_filter.ordering_param not in request.query_params:
+            return tuple(self.ordering)
+        ordering = [field for field in ordering_filter.get_ordering(request, queryset, view) if '__' not in field]
+        if not ordering:
+            return tuple(self.ordering)
+        if not {'id', '-id', 'pk', '-pk'} & set(ordering):
+            ordering.append('id')
+        return tuple(ordering)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, obj, reverse):
+        values = [getattr(obj, self._name(field)) for field in self.fields]
+        payload = json.dumps({'v': values, 'r': int(reverse)}, cls=CursorJSONEncoder)
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request, model):
+        """Return the ordering values and direction encoded in the request cursor"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            raw_values = payload['v']
+            if len(raw_values) != len(self.fields):
+                raise ValueError
+            values = [
+                model._meta.get_field(self._name(field)).to_python(value)
+                for field, value in zip(self.fields, raw_values, strict=True)
+            ]
+            return values, bool(payload.get('r'))
+        except Exception as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+    @staticmethod
+    def _name(field):
+        name = field.lstrip('-')
+        return 'id' if name == 'pk' else name
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    def _after(self, ordering, values):
+        """Rows strictly after ``values`` in ``ordering``, as an OR of column prefixes"""
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, values, strict=True):
+            name = self._name(field)
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+
+class ScorePagination(KeysetPagination):
+    ordering = ('-date', 'id')
+
+
+class FullNamePagination(KeysetPagination):
+    ordering = ('full_name', 'id')
+
+
+class NamePagination(KeysetPagination):
+    ordering = ('name', 'id')
@@ -0,0 +1,78 @@
+"""
+Accent-insensitive search.
+
+Searchable models store ``search_text``, their searchable fields folded to
+lowercase ASCII ("Nguyễn Văn Đức" -> "nguyen van duc"), so "Nguyen" finds
+"Nguyễn". Searches fold the query the same way and match every word of it
+with ``LIKE '%word%'`` on that single column. On PostgreSQL the column has a
+pg_trgm GIN index that serves those patterns and results are ranked by
+trigram word similarity; other databases scan the column and rank prefix
+matches first.
+"""
+
+import operator
+import unicodedata
+from functools import reduce
+
+from django.db import connections
+from django.db.models import Case, FloatField, Q, Value, When
+from rest_framework.filters import SearchFilter
+
+SEARCH_TEXT_FIELD = 'search_text'
+# Letters NFKD does not decompose into a base letter and a combining mark
+FOLDED_LETTERS = str.maketrans({'đ': 'd', 'Đ': 'd', 'ø': 'o', 'Ø': 'o', 'ł': 'l', 'Ł': 'l', 'ß': 'ss'})
+
+
+def normalize_search_text(*values):
+    """Fold the non-empty values to one lowercase, unaccented, single-spaced string"""
+    text = ' '.join(str(value) for value in values if value not in (None, ''))
+    text = unicodedata.normalize('NFKD', text.translate(FOLDED_LETTERS))
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return ' '.join(text.casefold().split())
+
+
+def search_terms(query):
+    """Normalized words of a search query, without repeats"""
+    return list(dict.fromkeys(normalize_search_text(query).split()))
+
+
+def search_filter(terms, paths=(SEARCH_TEXT_FIELD,)):
+    """Every term must appear in the search text of one of ``paths``, e.g. the row's own or a related one"""
+    return reduce(
+        operator.and_,
+        (reduce(operator.or_, (Q(**{f'{path}__contains': term}) for path in paths)) for term in terms),
+        Q(),
+    )
+
+
+def search_rank(queryset, query):
+    """Relevance of the rows of ``queryset`` for ``query``, higher is better"""
+    text = normalize_search_text(query)
+    if connections[queryset.db].vendor == 'postgresql':
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        return TrigramWordSimilarity(Value(text), SEARCH_TEXT_FIELD)
+    return Case(
+        When(**{f'{SEARCH_TEXT_FIELD}__startswith': text}, then=Value(3.0)),
+        When(**{f'{SEARCH_TEXT_FIELD}__contains': f' {text}'}, then=Value(2.0)),
+        When(**{f'{SEARCH_TEXT_FIELD}__contains': text}, then=Value(1.0)),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+
+
+class NormalizedSearchFilter(SearchFilter):
+    """
+    ``?search=`` on the normalized search text instead of ``ILIKE`` over
+    several columns. The view's ``search_text_fields`` lists the search text
+    columns to look in, the row's own by default; a word may match any of them.
+    """
+
+    def get_search_text_fields(self, view):
+        return getattr(view, 'search_text_fields', [SEARCH_TEXT_FIELD])
+
+    def filter_queryset(self, request, queryset, view):
+        terms = search_terms(' '.join(self.get_search_terms(request)))
+        if not terms:
+            return queryset
+        return queryset.filter(search_filter(terms, self.get_search_text_fields(view)))
@@ -1,12 +1,18 @@
-from .base import UserSerializer
+from .base import (
+    AnnotatedCountField, DisplayPrimaryKeyRelatedField, DynamicFieldsMixin, SearchQuerySerializer, UserSerializer,
+    requested_fields,
+)
 from .teacher import TeacherSerializer
-from .classroom import ClassroomSerializer, ClassroomStatsSerializer
+from .classroom import ClassroomSerializer, ClassroomStatsSerializer, SubjectScoreStatsSerializer
 from .student import StudentListSerializer, StudentDetailSerializer, StudentScoreHistorySerializer
 from .subject import SubjectSerializer
-from .score import ScoreSerializer, ScoreCreateSerializer
+from .score import ScoreSerializer, ScoreCreateSerializer, ScoreFilterSerializer, AnalyticsFilterSerializer
+from .report import ReportSerializer, ReportCreateSerializer
+from .term import TermFilterSerializer
 
 __all__ = [
-    'UserSerializer', 'TeacherSerializer', 'ClassroomSerializer', 'ClassroomStatsSerializer',
-    'StudentListSerializer', 'StudentDetailSerializer', 'StudentScoreHistorySerializer',
-    'SubjectSerializer', 'ScoreSerializer', 'ScoreCreateSerializer'
+    'AnnotatedCountField', 'DisplayPrimaryKeyRelatedField', 'DynamicFieldsMixin', 'SearchQuerySerializer', 'requested_fields', 'UserSerializer', 'TeacherSerializer',
+    'ClassroomSerializer', 'ClassroomStatsSerializer', 'SubjectScoreStatsSerializer', 'StudentListSerializer', 'StudentDetailSerializer', 'StudentScoreHistorySerializer',
+    'SubjectSerializer', 'ScoreSerializer', 'ScoreCreateSerializer', 'ScoreFilterSerializer', 'AnalyticsFilterSerializer',
+    'ReportSerializer', 'ReportCreateSerializer', 'TermFilterSerializer'
 ]
\ No newline at end of file
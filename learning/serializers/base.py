@@ -1,9 +1,77 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
 
+from ..models.display import for_display
+
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'is_active']
-        read_only_fields = ['id']
\ No newline at end of file
+        read_only_fields = ['id']
+
+
+def requested_fields(request):
+    """Field names selected with ``?fields=a,b``, or None when every field is wanted"""
+    if request is None or 'fields' not in request.query_params:
+        return None
+    return {name.strip() for name in request.query_params['fields'].split(',') if name.strip()}
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """Query of the type-ahead search actions and how many of the best matches to return"""
+    search = serializers.CharField(max_length=200)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
+
+
+class DynamicFieldsMixin:
+    """
+    Limit the representation to the fields selected with ``?fields=``.
+
+    Only applies to the top-level serializer of a read request, so bulk
+    consumers can skip nested objects, e.g. ``?fields=id,student_id,score``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        fields = requested_fields(request)
+        if fields is None or request.method not in ('GET', 'HEAD', 'OPTIONS'):
+            return
+        for name in set(self.fields) - fields:
+            self.fields.pop(name)
+
+
+class AnnotatedCountField(serializers.IntegerField):
+    """
+    Read-only count that uses the annotation named after the field when the
+    queryset provides it, and only falls back to ``<relation>.count()`` otherwise.
+    """
+
+    def __init__(self, relation, **kwargs):
+        self.relation = relation
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, obj):
+        count = getattr(obj, self.field_name, None)
+        if count is None:
+            count = getattr(obj, self.relation).count()
+        return count
+
+
+class DisplayPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField whose choices, the options of the browsable API
+    forms, join what their labels show instead of querying it per option.
+    """
+
+    def get_choices(self, cutoff=None):
+        queryset = self.get_queryset()
+        if queryset is None:
+            return {}
+        queryset = for_display(queryset)
+        if cutoff is not None:
+            queryset = queryset[:cutoff]
+        return {self.to_representation(item): self.display_value(item) for item in queryset}
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from .base import AnnotatedCountField
 from .teacher import TeacherSerializer
 from ..models import Classroom
 
@@ -6,7 +7,7 @@ from ..models import Classroom
 class ClassroomSerializer(serializers.ModelSerializer):
     teacher = TeacherSerializer(read_only=True)
     teacher_id = serializers.IntegerField(write_only=True)
-    students_count = serializers.SerializerMethodField()
+    students_count = AnnotatedCountField('students')
 
     class Meta:
         model = Classroom
@@ -14,12 +15,21 @@ class ClassroomSerializer(serializers.ModelSerializer):
                  'school_year', 'is_active', 'students_count', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-    def get_students_count(self, obj):
-        return obj.students.count()
+
+class SubjectScoreStatsSerializer(serializers.Serializer):
+    subject_id = serializers.IntegerField()
+    subject_name = serializers.CharField()
+    count = serializers.IntegerField()
+    average = serializers.FloatField()
+    min_score = serializers.FloatField()
+    max_score = serializers.FloatField()
+    std_dev = serializers.FloatField(allow_null=True)
 
 
 class ClassroomStatsSerializer(serializers.Serializer):
     classroom = ClassroomSerializer(read_only=True)
     total_students = serializers.IntegerField()
+    total_scores = serializers.IntegerField()
     average_score_by_subject = serializers.DictField()
-    overall_average = serializers.FloatField()
\ No newline at end of file
+    subjects = SubjectScoreStatsSerializer(many=True)
+    overall_average = serializers.FloatField(allow_null=True)
\ No newline at end of file
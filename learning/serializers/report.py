@@ -0,0 +1,53 @@
+from rest_framework import serializers
+
+from ..models import Classroom, Report, Teacher
+from ..services.reports import REPORT_FORMATS
+from .base import DisplayPrimaryKeyRelatedField
+
+
+class ReportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Report
+        fields = ['id', 'kind', 'format', 'classroom', 'teacher', 'status', 'task_id',
+                 'row_count', 'error', 'created_at', 'finished_at']
+        read_only_fields = fields
+
+
+class ReportCreateSerializer(serializers.ModelSerializer):
+    classroom = DisplayPrimaryKeyRelatedField(queryset=Classroom.objects.all(), required=False, allow_null=True)
+    teacher = serializers.PrimaryKeyRelatedField(queryset=Teacher.objects.all(), required=False, allow_null=True)
+
+    class Meta:
+        model = Report
+        fields = ['id', 'kind', 'format', 'classroom', 'teacher']
+        read_only_fields = ['id']
+
+    def validate_format(self, value):
+        if value not in REPORT_FORMATS:
+            raise serializers.ValidationError(f"Supported formats are: {', '.join(REPORT_FORMATS)}")
+        return value
+
+    def validate(self, attrs):
+        user = self.context['request'].user
+        teacher_profile = getattr(user, 'teacher_profile', None)
+        kind = attrs['kind']
+
+        if kind == Report.KIND_CLASSROOM:
+            classroom = attrs.get('classroom')
+            if classroom is None:
+                raise serializers.ValidationError({'classroom': 'A classroom report needs a classroom'})
+            if teacher_profile is not None and classroom.teacher_id != teacher_profile.pk:
+                raise serializers.ValidationError({'classroom': 'You can only report on your own classrooms'})
+            attrs['teacher'] = None
+        elif kind == Report.KIND_TEACHER:
+            attrs['teacher'] = attrs.get('teacher') or teacher_profile
+            if attrs['teacher'] is None:
+                raise serializers.ValidationError({'teacher': 'A teacher report needs a teacher'})
+            if teacher_profile is not None and attrs['teacher'].pk != teacher_profile.pk:
+                raise serializers.ValidationError({'teacher': 'You can only report on yourself'})
+            attrs['classroom'] = None
+        else:
+            if not user.is_staff:
+                raise serializers.ValidationError({'kind': 'Only staff can request school-wide reports'})
+            attrs['classroom'] = attrs['teacher'] = None
+        return attrs
@@ -1,17 +1,18 @@
 from rest_framework import serializers
+from .base import DisplayPrimaryKeyRelatedField, DynamicFieldsMixin
 from .student import StudentListSerializer
 from .subject import SubjectSerializer
 from .teacher import TeacherSerializer
 from ..models import Score
 
 
-class ScoreSerializer(serializers.ModelSerializer):
+class ScoreSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     student = StudentListSerializer(read_only=True)
-    student_id = serializers.IntegerField(write_only=True)
+    student_id = serializers.IntegerField()
     subject = SubjectSerializer(read_only=True)
-    subject_id = serializers.IntegerField(write_only=True)
+    subject_id = serializers.IntegerField()
     teacher = TeacherSerializer(read_only=True)
-    teacher_id = serializers.IntegerField(write_only=True)
+    teacher_id = serializers.IntegerField()
 
     class Meta:
         model = Score
@@ -27,6 +28,8 @@ class ScoreSerializer(serializers.ModelSerializer):
 
 
 class ScoreCreateSerializer(serializers.ModelSerializer):
+    serializer_related_field = DisplayPrimaryKeyRelatedField
+
     class Meta:
         model = Score
         fields = ['student', 'subject', 'score', 'score_type', 'date', 'notes', 'teacher']
@@ -34,4 +37,23 @@ class ScoreCreateSerializer(serializers.ModelSerializer):
     def validate_score(self, value):
         if value < 0 or value > 10:
             raise serializers.ValidationError("Score must be between 0 and 10")
-        return value
\ No newline at end of file
+        return value
+
+
+class ScoreFilterSerializer(serializers.Serializer):
+    """Validates the optional score filters accepted by the statistics endpoints"""
+    score_type = serializers.ChoiceField(choices=Score.SCORE_TYPES, required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        date_from = attrs.get('date_from')
+        date_to = attrs.get('date_to')
+        if date_from and date_to and date_from > date_to:
+            raise serializers.ValidationError("date_from must be before date_to")
+        return attrs
+
+
+class AnalyticsFilterSerializer(ScoreFilterSerializer):
+    """Score filters of the analytics endpoints and how many ranked students to return"""
+    limit = serializers.IntegerField(min_value=1, max_value=500, default=20)
@@ -1,9 +1,13 @@
 from rest_framework import serializers
+from .base import DisplayPrimaryKeyRelatedField
 from .classroom import ClassroomSerializer
 from ..models import Student, Score
+from ..services.stats import aggregate_average
 
 
 class StudentListSerializer(serializers.ModelSerializer):
+    serializer_related_field = DisplayPrimaryKeyRelatedField
+
     classroom_name = serializers.CharField(source='classroom.name', read_only=True)
     age = serializers.ReadOnlyField()
 
@@ -28,10 +32,8 @@ class StudentDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
     def get_average_score(self, obj):
-        scores = obj.scores.all()
-        if scores:
-            return round(sum(float(score.score) for score in scores) / len(scores), 2)
-        return None
+        _count, average = aggregate_average(obj.score_aggregates.all())
+        return round(float(average), 2) if average is not None else None
 
 
 class StudentScoreHistorySerializer(serializers.ModelSerializer):
@@ -1,14 +1,12 @@
 from rest_framework import serializers
+from .base import AnnotatedCountField
 from ..models import Subject
 
 
 class SubjectSerializer(serializers.ModelSerializer):
-    scores_count = serializers.SerializerMethodField()
+    scores_count = AnnotatedCountField('scores')
 
     class Meta:
         model = Subject
         fields = ['id', 'name', 'code', 'description', 'is_active', 'scores_count', 'created_at']
-        read_only_fields = ['id', 'created_at']
-
-    def get_scores_count(self, obj):
-        return obj.scores.count()
\ No newline at end of file
+        read_only_fields = ['id', 'created_at']
\ No newline at end of file
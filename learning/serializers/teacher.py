@@ -1,16 +1,13 @@
 from rest_framework import serializers
-from .base import UserSerializer
+from .base import AnnotatedCountField, UserSerializer
 from ..models import Teacher
 
 
 class TeacherSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
-    classrooms_count = serializers.SerializerMethodField()
+    classrooms_count = AnnotatedCountField('classrooms')
 
     class Meta:
         model = Teacher
         fields = ['id', 'user', 'full_name', 'email', 'phone', 'classrooms_count', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'created_at', 'updated_at']
-
-    def get_classrooms_count(self, obj):
-        return obj.classrooms.count()
\ No newline at end of file
+        read_only_fields = ['id', 'created_at', 'updated_at']
\ No newline at end of file
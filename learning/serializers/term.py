@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+from ..models import Term
+
+
+class TermFilterSerializer(serializers.Serializer):
+    """Period of the weighted grade endpoints: a term, or a date range; all scores without either"""
+    term = serializers.PrimaryKeyRelatedField(queryset=Term.objects.all(), required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        term = attrs.pop('term', None)
+        if term is not None:
+            attrs['date_from'] = term.start_date
+            attrs['date_to'] = term.end_date
+        date_from = attrs.get('date_from')
+        date_to = attrs.get('date_to')
+        if date_from and date_to and date_from > date_to:
+            raise serializers.ValidationError("date_from must be before date_to")
+        return attrs
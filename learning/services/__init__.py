@@ -0,0 +1,52 @@
+from .aggregates import (
+    add_score_to_aggregates,
+    find_score_aggregate_drift,
+    rebuild_score_aggregates,
+    refresh_score_aggregates,
+)
+from .enrollment import (
+    STUDENT_BULK_MAX_ROWS,
+    EnrollmentResult,
+    allocate_student_ids,
+    enroll_students,
+    student_id_prefix,
+)
+from .export import export_students_queryset, iter_students_csv
+from .grades import (
+    classroom_grades,
+    score_type_weights,
+    store_term_results,
+    student_grades,
+    term_grades,
+    weighted_aggregate_rows,
+    weighted_score_rows,
+)
+from .reports import (
+    REPORT_FORMATS,
+    build_report,
+    iter_report_rows,
+    report_classrooms,
+    report_task_state,
+)
+from .score_import import SCORE_BULK_MAX_ROWS, ScoreImportResult, ingest_scores
+from .stats import (
+    aggregate_average,
+    aggregate_statistics,
+    averages_by_subject,
+    classroom_stats,
+    filter_scores,
+    score_statistics,
+    score_statistics_rows,
+)
+
+__all__ = [
+    'aggregate_average', 'aggregate_statistics', 'averages_by_subject', 'classroom_stats', 'filter_scores',
+    'score_statistics', 'score_statistics_rows', 'add_score_to_aggregates', 'find_score_aggregate_drift', 'rebuild_score_aggregates',
+    'refresh_score_aggregates',
+    'STUDENT_BULK_MAX_ROWS', 'EnrollmentResult', 'allocate_student_ids', 'enroll_students', 'student_id_prefix',
+    'export_students_queryset', 'iter_students_csv',
+    'SCORE_BULK_MAX_ROWS', 'ScoreImportResult', 'ingest_scores',
+    'REPORT_FORMATS', 'build_report', 'iter_report_rows', 'report_classrooms', 'report_task_state',
+    'classroom_grades', 'score_type_weights', 'store_term_results', 'student_grades', 'term_grades',
+    'weighted_aggregate_rows', 'weighted_score_rows',
+]
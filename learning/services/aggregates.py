@@ -0,0 +1,161 @@
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import Count, DecimalField, F, Max, Min, Q, Sum
+from django.db.models.functions import Greatest, Least
+from django.utils import timezone
+
+from ..models import Score, ScoreAggregate
+
+AGGREGATE_KEY_FIELDS = ['student', 'subject', 'score_type']
+AGGREGATE_VALUE_FIELDS = ['count', 'total', 'total_squares', 'min_score', 'max_score', 'updated_at']
+AGGREGATE_BATCH_SIZE = 2000
+
+
+def score_key(score):
+    return (score.student_id, score.subject_id, score.score_type)
+
+
+def aggregate_rows(scores):
+    """Group a Score queryset into rollup values per (student, subject, score_type)"""
+    return (
+        scores.order_by()
+        .values('student_id', 'subject_id', 'score_type')
+        .annotate(
+            count=Count('id'),
+            total=Sum('score'),
+            total_squares=Sum(F('score') * F('score'), output_field=DecimalField(max_digits=14, decimal_places=4)),
+            min_score=Min('score'),
+            max_score=Max('score'),
+        )
+    )
+
+
+def _aggregate_from_row(row):
+    return ScoreAggregate(
+        student_id=row['student_id'],
+        subject_id=row['subject_id'],
+        score_type=row['score_type'],
+        count=row['count'],
+        total=row['total'],
+        total_squares=row['total_squares'],
+        min_score=row['min_score'],
+        max_score=row['max_score'],
+    )
+
+
+def _keys_filter(keys):
+    condition = Q()
+    for student_id, subject_id, score_type in keys:
+        condition |= Q(student_id=student_id, subject_id=subject_id, score_type=score_type)
+    return condition
+
+
+def refresh_score_aggregates(keys):
+    """
+    Recompute the rollup rows of the given (student_id, subject_id, score_type) keys.
+
+    Used after updates, deletes and bulk writes, where running totals cannot be
+    adjusted in place (min/max cannot be decremented).
+    """
+    keys = set(keys)
+    if not keys:
+        return
+
+    scores = Score.objects.filter(
+        student_id__in={key[0] for key in keys},
+        subject_id__in={key[1] for key in keys},
+        score_type__in={key[2] for key in keys},
+    )
+    aggregates = [
+        _aggregate_from_row(row)
+        for row in aggregate_rows(scores)
+        if (row['student_id'], row['subject_id'], row['score_type']) in keys
+    ]
+    empty_keys = keys - {score_key(aggregate) for aggregate in aggregates}
+
+    with transaction.atomic():
+        ScoreAggregate.objects.bulk_create(
+            aggregates,
+            batch_size=AGGREGATE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=AGGREGATE_KEY_FIELDS,
+            update_fields=AGGREGATE_VALUE_FIELDS,
+        )
+        if empty_keys:
+            ScoreAggregate.objects.filter(_keys_filter(empty_keys)).delete()
+
+
+def add_score_to_aggregates(score):
+    """Fold a newly created score into its rollup row without rereading other scores"""
+    value = Score._meta.get_field('score').to_python(score.score)
+    key = {'student_id': score.student_id, 'subject_id': score.subject_id, 'score_type': score.score_type}
+    updated = ScoreAggregate.objects.filter(**key).update(
+        count=F('count') + 1,
+        total=F('total') + value,
+        total_squares=F('total_squares') + value * value,
+        min_score=Least('min_score', models.Value(value)),
+        max_score=Greatest('max_score', models.Value(value)),
+    )
+    if updated:
+        return
+    try:
+        with transaction.atomic():
+            ScoreAggregate.objects.create(
+                **key, count=1, total=value, total_squares=value * value, min_score=value, max_score=value,
+            )
+    except IntegrityError:
+        # Created concurrently by another score of the same key
+        refresh_score_aggregates([score_key(score)])
+
+
+def rebuild_score_aggregates():
+    """
+    Recreate the whole rollup table from the Score rows.
+
+    The grouped query is inserted with a single INSERT ... SELECT, so the
+    rows never travel through Python.
+    """
+    rows = aggregate_rows(Score.objects.all()).annotate(
+        updated_at=models.Value(timezone.now(), output_field=models.DateTimeField()),
+    )
+    select_sql, params = rows.query.sql_with_params()
+    quote_name = connection.ops.quote_name
+    columns = ', '.join(
+        quote_name(ScoreAggregate._meta.get_field(name).column)
+        for name in AGGREGATE_KEY_FIELDS + AGGREGATE_VALUE_FIELDS
+    )
+    # The grouped columns in the order of ``columns``, by name rather than position
+    selected = ', '.join(
+        quote_name(name) for name in ['student_id', 'subject_id', 'score_type', *AGGREGATE_VALUE_FIELDS]
+    )
+    with transaction.atomic():
+        ScoreAggregate.objects.all().delete()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {quote_name(ScoreAggregate._meta.db_table)} ({columns}) '
+                f'SELECT {selected} FROM ({select_sql}) AS aggregates',
+                params,
+            )
+
+
+def find_score_aggregate_drift():
+    """
+    Compare the rollup table with the Score rows.
+
+    Returns the keys that are missing from the table, stale (no scores left)
+    and the keys whose stored values differ from the recomputed ones.
+    """
+    stored = {
+        (row['student_id'], row['subject_id'], row['score_type']): row
+        for row in ScoreAggregate.objects.values(
+            'student_id', 'subject_id', 'score_type', 'count', 'total', 'total_squares', 'min_score', 'max_score',
+        ).iterator(chunk_size=AGGREGATE_BATCH_SIZE)
+    }
+    missing, mismatched = [], []
+    for row in aggregate_rows(Score.objects.all()).iterator(chunk_size=AGGREGATE_BATCH_SIZE):
+        key = (row['student_id'], row['subject_id'], row['score_type'])
+        current = stored.pop(key, None)
+        if current is None:
+            missing.append(key)
+        elif any(current[name] != row[name] for name in AGGREGATE_VALUE_FIELDS if name != 'updated_at'):
+            mismatched.append(key)
+    return {'missing': missing, 'stale': list(stored), 'mismatched': mismatched}
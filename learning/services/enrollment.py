@@ -0,0 +1,216 @@
+import operator
+import re
+from dataclasses import dataclass, field
+from functools import reduce
+
+from django.db import IntegrityError, transaction
+from django.db.models import Max, Q
+from django.db.models.functions import Substr
+from django.utils import timezone
+from rest_framework import serializers
+
+from ..cache import bump_versions
+from ..models import Classroom, Student
+
+STUDENT_BULK_MAX_ROWS = 10_000
+STUDENT_BULK_BATCH_SIZE = 1000
+# Generated ids are the first year of the school year followed by a 5 digit sequence, e.g. 202400001
+STUDENT_ID_PREFIX_LENGTH = 4
+STUDENT_ID_SEQUENCE_LENGTH = 5
+STUDENT_ID_PATTERN = rf'^[0-9]{{{STUDENT_ID_PREFIX_LENGTH + STUDENT_ID_SEQUENCE_LENGTH}}}$'
+# Another enrollment may take the same generated ids between allocation and insert
+ENROLL_ATTEMPTS = 3
+
+
+class StudentBulkItemSerializer(serializers.ModelSerializer):
+    """Shape validation of one enrollment row; classrooms and student ids are checked set-wise by enroll_students"""
+    # The classroom pk, looked up for every row at once
+    classroom = serializers.IntegerField()
+
+    class Meta:
+        model = Student
+        fields = [
+            'full_name', 'birth_date', 'gender', 'classroom', 'student_id', 'email', 'phone', 'address',
+            'parent_name', 'parent_phone', 'notes', 'is_active',
+        ]
+        extra_kwargs = {
+            # Without the per-row uniqueness query
+            'student_id': {'validators': []},
+            'is_active': {'default': True},
+        }
+
+
+@dataclass
+class EnrollmentResult:
+    created: int = 0
+    students: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+    def add_error(self, index, errors):
+        self.errors.append({'index': index, 'errors': errors})
+
+
+def student_id_prefix(school_year=None):
+    """Prefix of the generated ids of a school year like "2024-2025", the current year when it has none"""
+    match = re.match(r'\s*([0-9]{4})', school_year or '')
+    return match.group(1) if match else str(timezone.localdate().year)
+
+
+def last_student_id_sequences(prefixes, taken=()):
+    """
+    Highest sequence number used under each prefix, 0 for unused prefixes.
+
+    Generated ids all have the same width, so the highest id of a prefix is
+    the highest sequence: one grouped query, using the student_id index for
+    the prefix match, covers every prefix. ``taken`` are ids not stored yet
+    that must not be handed out either.
+    """
+    sequences = dict.fromkeys(prefixes, 0)
+    if not sequences:
+        return sequences
+    rows = (
+        Student.objects.filter(reduce(operator.or_, (Q(student_id__startswith=prefix) for prefix in sequences)))
+        .filter(student_id__regex=STUDENT_ID_PATTERN)
+        .annotate(prefix=Substr('student_id', 1, STUDENT_ID_PREFIX_LENGTH))
+        .order_by()
+        .values('prefix')
+        .annotate(last=Max('student_id'))
+        .values_list('prefix', 'last')
+    )
+    for student_id in [last for _, last in rows] + [pk for pk in taken if pk and re.match(STUDENT_ID_PATTERN, pk)]:
+        prefix = student_id[:STUDENT_ID_PREFIX_LENGTH]
+        if prefix in sequences:
+            sequences[prefix] = max(sequences[prefix], int(student_id[STUDENT_ID_PREFIX_LENGTH:]))
+    return sequences
+
+
+def allocate_student_ids(prefixes, taken=()):
+    """
+    Generate one new student id per entry of ``prefixes``, in order,
+    continuing the sequence of each prefix after a single lookup query.
+    Entries whose prefix has no id left get None.
+    """
+    sequences = last_student_id_sequences(set(prefixes), taken)
+    student_ids = []
+    for prefix in prefixes:
+        if sequences[prefix] + 1 >= 10 ** STUDENT_ID_SEQUENCE_LENGTH:
+            student_ids.append(None)
+            continue
+        sequences[prefix] += 1
+        student_ids.append(f'{prefix}{sequences[prefix]:0{STUDENT_ID_SEQUENCE_LENGTH}d}')
+    return student_ids
+
+
+def _validate_rows(rows, classrooms):
+    """Validated rows by index and the errors of the others, with one query for the classrooms"""
+    result = EnrollmentResult()
+    item_serializer = StudentBulkItemSerializer()
+
+    items = []
+    for index, row in enumerate(rows):
+        try:
+            data = item_serializer.run_validation(row)
+        except serializers.ValidationError as exc:
+            result.add_error(index, exc.detail)
+            continue
+        data['student_id'] = (data.get('student_id') or '').strip() or None
+        items.append((index, data))
+
+    school_years = dict(
+        classrooms.filter(pk__in={data['classroom'] for _, data in items}).values_list('pk', 'school_year')
+    )
+    valid = {}
+    seen = {}
+    for index, data in items:
+        student_id = data['student_id']
+        if data['classroom'] not in school_years:
+            result.add_error(index, {'classroom': [f'Invalid pk "{data["classroom"]}" - object does not exist.']})
+        elif student_id is not None and student_id in seen:
+            result.add_error(index, {'student_id': [f'Duplicate of row {seen[student_id]}.']})
+        else:
+            if student_id is not None:
+                seen[student_id] = index
+            data['prefix'] = student_id_prefix(school_years[data['classroom']])
+            valid[index] = data
+    return result, valid
+
+
+def _insert_students(result, valid, batch_size):
+    """Reject rows whose student id exists, generate the missing ids and insert the rest"""
+    explicit_ids = {data['student_id'] for data in valid.values() if data['student_id'] is not None}
+    existing = set(Student.objects.filter(student_id__in=explicit_ids).values_list('student_id', flat=True))
+    rows = []
+    for index, data in valid.items():
+        if data['student_id'] in existing:
+            result.add_error(index, {'student_id': ['student with this student id already exists.']})
+        else:
+            rows.append((index, data))
+
+    missing = [(index, data) for index, data in rows if data['student_id'] is None]
+    generated = allocate_student_ids([data['prefix'] for _, data in missing], taken=explicit_ids)
+    student_ids = {index: student_id for (index, _), student_id in zip(missing, generated, strict=True)}
+    for index, data in missing:
+        if student_ids[index] is None:
+            message = f'No student id left for the school year starting in {data["prefix"]}.'
+            result.add_error(index, {'student_id': [message]})
+    rows = [(index, data) for index, data in rows if data['student_id'] or student_ids[index]]
+
+    students = [
+        Student(
+            full_name=data['full_name'],
+            birth_date=data['birth_date'],
+            gender=data.get('gender'),
+            classroom_id=data['classroom'],
+            student_id=data['student_id'] or student_ids[index],
+            email=data.get('email') or None,
+            phone=data.get('phone'),
+            address=data.get('address'),
+            parent_name=data.get('parent_name'),
+            parent_phone=data.get('parent_phone'),
+            notes=data.get('notes'),
+            is_active=data['is_active'],
+        )
+        for index, data in rows
+    ]
+    with transaction.atomic():
+        Student.objects.bulk_create(students, batch_size=batch_size)
+    result.created = len(students)
+    result.students = [
+        {'index': index, 'id': student.pk, 'student_id': student.student_id}
+        for (index, _), student in zip(rows, students, strict=True)
+    ]
+    return {data['classroom'] for _, data in rows}
+
+
+def enroll_students(rows, classrooms=None, batch_size=STUDENT_BULK_BATCH_SIZE):
+    """
+    Validate and create students in bulk.
+
+    Classrooms are resolved with one ``IN`` query against ``classrooms`` (every
+    classroom by default, the view narrows it to a teacher's), duplicate
+    student ids are found in the payload in Python and against the database
+    with one more ``IN`` query. Rows without a student id get the next free
+    ids of their classroom's school year, allocated with a single query, and
+    everything is written with ``bulk_create`` in batches. Invalid rows are
+    reported by index and skipped, the rest is still created.
+    """
+    if classrooms is None:
+        classrooms = Classroom.objects.all()
+    result, valid = _validate_rows(rows, classrooms)
+    if not valid:
+        return result
+
+    for attempt in range(1, ENROLL_ATTEMPTS + 1):
+        attempt_result = EnrollmentResult(errors=list(result.errors))
+        try:
+            classroom_ids = _insert_students(attempt_result, valid, batch_size)
+        except IntegrityError:
+            if attempt == ENROLL_ATTEMPTS:
+                raise
+            continue
+        break
+
+    attempt_result.errors.sort(key=lambda error: error['index'])
+    # bulk_create sends no signals, so invalidate the classrooms of the new students here
+    bump_versions([('classroom', pk) for pk in classroom_ids])
+    return attempt_result
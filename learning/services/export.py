@@ -0,0 +1,59 @@
+import csv
+
+from django.db.models import Avg
+
+from ..models import Student
+
+STUDENT_EXPORT_HEADER = [
+    'Full Name', 'Student ID', 'Birth Date', 'Gender', 'Email',
+    'Phone', 'Parent Name', 'Parent Phone', 'Average Score'
+]
+EXPORT_CHUNK_SIZE = 2000
+
+
+class Echo:
+    """File-like object that hands back what is written, so csv.writer can feed a generator"""
+
+    def write(self, value):
+        return value
+
+
+def export_students_queryset(classrooms):
+    """Active students of the given classrooms with their average score computed in SQL"""
+    return (
+        Student.objects.filter(classroom__in=classrooms, is_active=True)
+        .annotate(average_score=Avg('scores__score'))
+        .order_by('classroom__name', 'full_name', 'id')
+        .values_list(
+            'classroom__name', 'full_name', 'student_id', 'birth_date', 'gender', 'email',
+            'phone', 'parent_name', 'parent_phone', 'average_score',
+        )
+    )
+
+
+def iter_students_csv(students, include_classroom=False, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield CSV lines for a queryset built by export_students_queryset.
+
+    Rows are fetched with a server-side cursor in chunks, so memory stays flat
+    no matter how many students are exported.
+    """
+    genders = dict(Student.GENDER_CHOICES)
+    writer = csv.writer(Echo())
+    header = STUDENT_EXPORT_HEADER
+    if include_classroom:
+        header = ['Classroom'] + header
+    yield writer.writerow(header)
+
+    for (
+        classroom_name, full_name, student_id, birth_date, gender, email,
+        phone, parent_name, parent_phone, avg_score,
+    ) in students.iterator(chunk_size=chunk_size):
+        row = [
+            full_name, student_id, birth_date, genders.get(gender, ''), email,
+            phone, parent_name, parent_phone,
+            round(avg_score, 2) if avg_score is not None else 'N/A',
+        ]
+        if include_classroom:
+            row = [classroom_name] + row
+        yield writer.writerow(row)
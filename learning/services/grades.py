@@ -0,0 +1,219 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import (
+    Avg,
+    Case,
+    Count,
+    DecimalField,
+    F,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Round
+from django.utils import timezone
+
+from ..models import Score, ScoreAggregate, Subject, TermResult
+
+WEIGHT_FIELD = DecimalField(max_digits=16, decimal_places=4)
+# Names are read separately, grouping on them makes the database sort every row by a string
+GRADE_KEY_FIELDS = ['student_id', 'subject_id']
+CENTS = Decimal('0.01')
+
+
+def score_type_weights():
+    """Weight of every score type from SCORE_TYPE_WEIGHTS; types it does not name weigh 1"""
+    configured = getattr(settings, 'SCORE_TYPE_WEIGHTS', {})
+    return {score_type: Decimal(str(configured.get(score_type, 1))) for score_type, _ in Score.SCORE_TYPES}
+
+
+def _weight(weights):
+    return Case(
+        *[When(score_type=score_type, then=Value(weight)) for score_type, weight in weights.items()],
+        default=Value(Decimal(0)),
+        output_field=WEIGHT_FIELD,
+    )
+
+
+def _weighted_types(weights):
+    return [score_type for score_type, weight in weights.items() if weight > 0]
+
+
+def weighted_score_rows(scores):
+    """Weighted score totals and weights per (student, subject) of a Score queryset, in one grouped query"""
+    weights = score_type_weights()
+    weight = _weight(weights)
+    return (
+        scores.filter(score_type__in=_weighted_types(weights))
+        .order_by()
+        .values(*GRADE_KEY_FIELDS)
+        .annotate(
+            weighted_total=Sum(F('score') * weight, output_field=WEIGHT_FIELD),
+            weight=Sum(weight),
+            count=Count('id'),
+        )
+    )
+
+
+def weighted_aggregate_rows(aggregates):
+    """Same as weighted_score_rows, read from a ScoreAggregate queryset"""
+    weights = score_type_weights()
+    weight = _weight(weights)
+    return (
+        aggregates.filter(score_type__in=_weighted_types(weights))
+        .order_by()
+        .values(*GRADE_KEY_FIELDS)
+        .annotate(
+            weighted_total=Sum(F('total') * weight, output_field=WEIGHT_FIELD),
+            weight=Sum(F('count') * weight, output_field=WEIGHT_FIELD),
+            count=Sum('count'),
+        )
+    )
+
+
+def term_grades(rows):
+    """
+    Group weighted rows per student into a grade per subject and the GPA,
+    the mean of the subject grades. Grades are rounded half up to 2 places,
+    like store_term_results does in the database.
+    """
+    students = {}
+    for row in rows:
+        student = students.setdefault(row['student_id'], {
+            'student_id': row['student_id'],
+            'full_name': None,
+            'subjects': [],
+            'score_count': 0,
+        })
+        student['subjects'].append({
+            'subject_id': row['subject_id'],
+            'subject_name': None,
+            'weighted_average': row['weighted_total'] / row['weight'],
+            'score_count': row['count'],
+        })
+        student['score_count'] += row['count']
+
+    for student in students.values():
+        subjects = student['subjects']
+        for subject in subjects:
+            subject['weighted_average'] = subject['weighted_average'].quantize(CENTS, rounding=ROUND_HALF_UP)
+        # Report cards show the rounded subject grades, the GPA is their mean
+        student['gpa'] = (sum(subject['weighted_average'] for subject in subjects) / len(subjects)).quantize(
+            CENTS, rounding=ROUND_HALF_UP
+        )
+    return students
+
+
+def _add_names(students, student_names):
+    """Add the student and subject names, ordering the subjects by name"""
+    subject_ids = {subject['subject_id'] for student in students for subject in student['subjects']}
+    subject_names = dict(Subject.objects.filter(pk__in=subject_ids).values_list('id', 'name')) if subject_ids else {}
+    for student in students:
+        student['full_name'] = student_names.get(student['student_id'])
+        for subject in student['subjects']:
+            subject['subject_name'] = subject_names.get(subject['subject_id'])
+        student['subjects'].sort(key=lambda subject: (subject['subject_name'], subject['subject_id']))
+    return students
+
+
+def _grade_rows(scores, aggregates, date_from=None, date_to=None):
+    """Weighted rows from the rollup, or from the scores when a date range is given"""
+    if date_from or date_to:
+        if date_from:
+            scores = scores.filter(date__gte=date_from)
+        if date_to:
+            scores = scores.filter(date__lte=date_to)
+        return weighted_score_rows(scores)
+    return weighted_aggregate_rows(aggregates)
+
+
+def student_grades(student, date_from=None, date_to=None):
+    """Weighted grades per active subject and GPA of a student over a date range, or all their scores"""
+    rows = _grade_rows(
+        student.scores.filter(subject__is_active=True),
+        student.score_aggregates.filter(subject__is_active=True),
+        date_from=date_from,
+        date_to=date_to,
+    )
+    grades = term_grades(rows).get(student.pk)
+    if grades is None:
+        grades = {'student_id': student.pk, 'full_name': None, 'subjects': [], 'score_count': 0, 'gpa': None}
+    return _add_names([grades], {student.pk: student.full_name})[0]
+
+
+def classroom_grades(classroom, date_from=None, date_to=None):
+    """Weighted grades and GPA of every student of a classroom, best GPA first"""
+    rows = _grade_rows(
+        Score.objects.filter(student__classroom=classroom, subject__is_active=True),
+        ScoreAggregate.objects.filter(student__classroom=classroom, subject__is_active=True),
+        date_from=date_from,
+        date_to=date_to,
+    )
+    students = _add_names(list(term_grades(rows).values()), dict(classroom.students.values_list('id', 'full_name')))
+    students.sort(key=lambda student: (-student['gpa'], student['full_name'], student['student_id']))
+    rank = 0
+    for position, student in enumerate(students, start=1):
+        if position == 1 or student['gpa'] != students[position - 2]['gpa']:
+            rank = position
+        student['rank'] = rank
+    return {'classroom_id': classroom.pk, 'students': students}
+
+
+def _insert_term_results(term, rows, computed_at, per_subject=True):
+    """INSERT ... SELECT the grouped ``rows`` query as TermResult rows of the term"""
+    quote_name = connection.ops.quote_name
+    subject_column = quote_name('subject_id') if per_subject else 'NULL'
+    select_sql, params = rows.query.sql_with_params()
+    columns = ', '.join(
+        quote_name(TermResult._meta.get_field(name).column)
+        for name in ['term', 'student', 'subject', 'weighted_average', 'score_count', 'computed_at']
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {quote_name(TermResult._meta.db_table)} ({columns}) '
+            f'SELECT %s, {quote_name("student_id")}, {subject_column}, {quote_name("grade")}, '
+            f'{quote_name("score_count")}, %s FROM ({select_sql}) AS grades',
+            [term.pk, connection.ops.adapt_datetimefield_value(computed_at), *params],
+        )
+
+
+def store_term_results(term, classrooms=None):
+    """
+    Compute the term grades and GPAs of the whole school, or of ``classrooms``,
+    and replace the stored TermResult rows.
+
+    The subject grades are inserted from the grouped score query and the GPAs
+    from the stored subject grades, two INSERT ... SELECT statements, so the
+    rows never travel through Python. Returns the number of rows stored.
+
+    SQLite stores decimals as floats, so there a grade ending in exactly 5 at
+    the third decimal may round down instead of up.
+    """
+    scores = Score.objects.filter(subject__is_active=True, date__gte=term.start_date, date__lte=term.end_date)
+    results = TermResult.objects.filter(term=term)
+    if classrooms is not None:
+        scores = scores.filter(student__classroom__in=classrooms)
+        results = results.filter(student__classroom__in=classrooms)
+
+    subject_grades = weighted_score_rows(scores).annotate(
+        grade=Round(F('weighted_total') / F('weight'), 2, output_field=WEIGHT_FIELD),
+        score_count=F('count'),
+    )
+    gpas = (
+        results.filter(subject__isnull=False)
+        .order_by()
+        .values('student_id')
+        .annotate(
+            grade=Round(Avg('weighted_average'), 2, output_field=WEIGHT_FIELD),
+            score_count=Sum('score_count'),
+        )
+    )
+
+    computed_at = timezone.now()
+    with transaction.atomic():
+        results.delete()
+        _insert_term_results(term, subject_grades, computed_at)
+        _insert_term_results(term, gpas, computed_at, per_subject=False)
+    return results.count()
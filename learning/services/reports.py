@@ -0,0 +1,121 @@
+import csv
+import io
+import json
+import tempfile
+
+from django.apps import apps
+from django.core.files import File
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+try:
+    import openpyxl
+except ImportError:  # XLSX reports are unavailable without the optional dependency
+    openpyxl = None
+
+from ..models import Classroom, Report, Student
+from .export import (
+    EXPORT_CHUNK_SIZE,
+    STUDENT_EXPORT_HEADER,
+    export_students_queryset,
+)
+
+REPORT_HEADER = ['Classroom'] + STUDENT_EXPORT_HEADER
+REPORT_FORMATS = ['csv', 'json'] + (['xlsx'] if openpyxl is not None else [])
+
+
+def report_classrooms(report):
+    """Classrooms covered by a report"""
+    if report.kind == Report.KIND_CLASSROOM:
+        return Classroom.objects.filter(pk=report.classroom_id)
+    if report.kind == Report.KIND_TEACHER:
+        return Classroom.objects.filter(teacher_id=report.teacher_id, is_active=True)
+    return Classroom.objects.filter(is_active=True)
+
+
+def iter_report_rows(report, chunk_size=EXPORT_CHUNK_SIZE):
+    """Report rows, fetched from the database in chunks"""
+    genders = dict(Student.GENDER_CHOICES)
+    students = export_students_queryset(report_classrooms(report).order_by().values('id'))
+    for (
+        classroom_name, full_name, student_id, birth_date, gender, email,
+        phone, parent_name, parent_phone, avg_score,
+    ) in students.iterator(chunk_size=chunk_size):
+        yield [
+            classroom_name, full_name, student_id, birth_date, genders.get(gender, ''), email,
+            phone, parent_name, parent_phone, round(avg_score, 2) if avg_score is not None else None,
+        ]
+
+
+def _write_csv(rows, output):
+    text = io.TextIOWrapper(output, encoding='utf-8', newline='')
+    writer = csv.writer(text)
+    writer.writerow(REPORT_HEADER)
+    count = 0
+    for row in rows:
+        writer.writerow(['N/A' if value is None else value for value in row])
+        count += 1
+    text.flush()
+    text.detach()
+    return count
+
+
+def _write_json(rows, output):
+    count = 0
+    output.write(b'[')
+    for row in rows:
+        if count:
+            output.write(b',')
+        output.write(json.dumps(dict(zip(REPORT_HEADER, row, strict=True)), cls=DjangoJSONEncoder).encode())
+        count += 1
+    output.write(b']')
+    return count
+
+
+def _write_xlsx(rows, output):
+    # write_only keeps memory flat, rows are flushed as they are appended
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet('Students')
+    sheet.append(REPORT_HEADER)
+    count = 0
+    for row in rows:
+        sheet.append(row)
+        count += 1
+    workbook.save(output)
+    return count
+
+
+WRITERS = {'csv': _write_csv, 'json': _write_json, 'xlsx': _write_xlsx}
+
+
+def build_report(report):
+    """
+    Generate the artifact of a report and save it to the default storage.
+
+    The rows are streamed into a temporary file, so neither the rows nor the
+    artifact are held in memory.
+    """
+    if report.format not in REPORT_FORMATS:
+        raise ValueError(f'Unsupported report format: {report.format}')
+
+    with tempfile.TemporaryFile() as output:
+        row_count = WRITERS[report.format](iter_report_rows(report), output)
+        output.seek(0)
+        filename = f'{report.kind}_report_{report.pk}_{timezone.now():%Y%m%d%H%M%S}.{report.format}'
+        report.file.save(filename, File(output), save=False)
+
+    report.row_count = row_count
+    report.status = Report.STATUS_SUCCESS
+    report.finished_at = timezone.now()
+    report.save(update_fields=['file', 'row_count', 'status', 'finished_at'])
+    return report
+
+
+def report_task_state(report):
+    """State of the report's Celery task as recorded by django_celery_results, if it is installed"""
+    if not report.task_id or not apps.is_installed('django_celery_results'):
+        return None
+    from django_celery_results.models import TaskResult
+
+    result = TaskResult.objects.filter(task_id=report.task_id).values('status', 'date_done').first()
+    return result or {'status': 'PENDING', 'date_done': None}
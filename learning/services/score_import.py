@@ -0,0 +1,124 @@
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from rest_framework import serializers
+
+from ..cache import invalidate_scores
+from ..models import Score, Student, Subject, Teacher
+from .aggregates import refresh_score_aggregates
+
+SCORE_BULK_MAX_ROWS = 10_000
+SCORE_BULK_BATCH_SIZE = 1000
+SCORE_UNIQUE_FIELDS = ['student', 'subject', 'score_type', 'date']
+SCORE_UPDATE_FIELDS = ['score', 'notes', 'teacher', 'updated_at']
+
+
+class ScoreBulkItemSerializer(serializers.Serializer):
+    """Shape validation of one bulk row; related ids are checked set-wise by ingest_scores"""
+    student = serializers.IntegerField()
+    subject = serializers.IntegerField()
+    teacher = serializers.IntegerField(required=False)
+    score = serializers.DecimalField(max_digits=4, decimal_places=2, min_value=0, max_value=10)
+    score_type = serializers.ChoiceField(choices=Score.SCORE_TYPES, default='quiz')
+    date = serializers.DateField()
+    notes = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+
+@dataclass
+class ScoreImportResult:
+    created: int = 0
+    updated: int = 0
+    errors: list = field(default_factory=list)
+
+    def add_error(self, index, errors):
+        self.errors.append({'index': index, 'errors': errors})
+
+
+def _missing(model, ids):
+    return set(ids) - set(model.objects.filter(pk__in=ids).values_list('pk', flat=True))
+
+
+def ingest_scores(rows, teacher=None, batch_size=SCORE_BULK_BATCH_SIZE):
+    """
+    Validate and upsert score rows keyed on (student, subject, score_type, date).
+
+    Related objects are resolved with one ``IN`` query per model and existing
+    keys with one more query, then the rows are written with
+    ``bulk_create(update_conflicts=True)``. Invalid rows are reported by index
+    and skipped, the rest of the batch is still written. When ``teacher`` is
+    given it is recorded on every row, as for single score creation.
+    """
+    result = ScoreImportResult()
+    item_serializer = ScoreBulkItemSerializer()
+
+    items = []
+    for index, row in enumerate(rows):
+        try:
+            data = item_serializer.run_validation(row)
+        except serializers.ValidationError as exc:
+            result.add_error(index, exc.detail)
+            continue
+        if teacher is not None:
+            data['teacher'] = teacher.pk
+        elif 'teacher' not in data:
+            result.add_error(index, {'teacher': ['This field is required.']})
+            continue
+        items.append((index, data))
+
+    missing = {
+        name: _missing(model, {data[name] for _, data in items})
+        for name, model in (('student', Student), ('subject', Subject), ('teacher', Teacher))
+        if name != 'teacher' or teacher is None
+    }
+
+    scores = {}
+    for index, data in items:
+        errors = {
+            name: [f'Invalid pk "{data[name]}" - object does not exist.']
+            for name, ids in missing.items()
+            if data[name] in ids
+        }
+        key = (data['student'], data['subject'], data['score_type'], data['date'])
+        if not errors and key in scores:
+            errors = {'non_field_errors': [f'Duplicate of row {scores[key][0]}.']}
+        if errors:
+            result.add_error(index, errors)
+            continue
+        scores[key] = (index, data)
+
+    if not scores:
+        return result
+
+    existing = set(
+        Score.objects.filter(
+            student_id__in={key[0] for key in scores},
+            subject_id__in={key[1] for key in scores},
+            date__in={key[3] for key in scores},
+        ).values_list('student_id', 'subject_id', 'score_type', 'date')
+    )
+    result.updated = len(existing & scores.keys())
+    result.created = len(scores) - result.updated
+
+    with transaction.atomic():
+        Score.objects.bulk_create(
+            [
+                Score(
+                    student_id=data['student'],
+                    subject_id=data['subject'],
+                    teacher_id=data['teacher'],
+                    score=data['score'],
+                    score_type=data['score_type'],
+                    date=data['date'],
+                    notes=data.get('notes'),
+                )
+                for _, data in scores.values()
+            ],
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=SCORE_UNIQUE_FIELDS,
+            update_fields=SCORE_UPDATE_FIELDS,
+        )
+        # bulk_create sends no signals, so refresh the rollup rows of the batch here
+        refresh_score_aggregates({key[:3] for key in scores})
+    invalidate_scores({key[0] for key in scores}, {key[1] for key in scores})
+    return result
@@ -0,0 +1,139 @@
+import math
+
+from django.db.models import Count, DecimalField, F, Max, Min, Sum
+
+from ..models import Score, ScoreAggregate
+
+
+def _round(value):
+    return round(float(value), 2) if value is not None else None
+
+
+def _std_dev(count, total, total_squares):
+    """Population standard deviation from running totals"""
+    if not count:
+        return None
+    mean = float(total) / count
+    return math.sqrt(max(float(total_squares) / count - mean * mean, 0))
+
+
+def filter_scores(scores, score_type=None, date_from=None, date_to=None):
+    """Apply the optional dashboard filters to a Score queryset"""
+    if score_type:
+        scores = scores.filter(score_type=score_type)
+    if date_from:
+        scores = scores.filter(date__gte=date_from)
+    if date_to:
+        scores = scores.filter(date__lte=date_to)
+    return scores
+
+
+def _summarise(rows):
+    subjects = []
+    total_count = 0
+    total_sum = 0
+    for row in rows:
+        total_count += row['count']
+        total_sum += row['total']
+        subjects.append({
+            'subject_id': row['subject_id'],
+            'subject_name': row['subject__name'],
+            'count': row['count'],
+            'average': _round(row['total'] / row['count']),
+            'min_score': _round(row['min_score']),
+            'max_score': _round(row['max_score']),
+            'std_dev': _round(_std_dev(row['count'], row['total'], row['total_squares'])),
+        })
+
+    return {
+        'subjects': subjects,
+        'total_scores': total_count,
+        'overall_average': _round(total_sum / total_count) if total_count else None,
+    }
+
+
+def score_statistics_rows(scores):
+    """The grouped per-subject query behind score_statistics"""
+    return (
+        scores.order_by()
+        .values('subject_id', 'subject__name')
+        .annotate(
+            count=Count('id'),
+            total=Sum('score'),
+            total_squares=Sum(F('score') * F('score'), output_field=DecimalField(max_digits=14, decimal_places=4)),
+            min_score=Min('score'),
+            max_score=Max('score'),
+        )
+        .order_by('subject__name')
+    )
+
+
+def score_statistics(scores):
+    """
+    Aggregate a Score queryset per subject in a single grouped query.
+
+    The overall average is derived from the per-subject sums and counts,
+    so no score rows are loaded into Python.
+    """
+    return _summarise(score_statistics_rows(scores))
+
+
+def aggregate_statistics(aggregates):
+    """Same as score_statistics, read from a ScoreAggregate queryset"""
+    rows = (
+        aggregates.order_by()
+        .values('subject_id', 'subject__name')
+        .annotate(
+            count=Sum('count'),
+            total=Sum('total'),
+            total_squares=Sum('total_squares'),
+            min_score=Min('min_score'),
+            max_score=Max('max_score'),
+        )
+        .order_by('subject__name')
+    )
+    return _summarise(rows)
+
+
+def aggregate_average(aggregates):
+    """Number of scores and their average over a ScoreAggregate queryset"""
+    totals = aggregates.aggregate(count=Sum('count'), total=Sum('total'))
+    if not totals['count']:
+        return 0, None
+    return totals['count'], totals['total'] / totals['count']
+
+
+def averages_by_subject(aggregates):
+    """Average score per subject name over a ScoreAggregate queryset"""
+    rows = (
+        aggregates.order_by()
+        .values('subject__name')
+        .annotate(count=Sum('count'), total=Sum('total'))
+        .order_by('subject__name')
+    )
+    return {row['subject__name']: round(row['total'] / row['count'], 2) for row in rows}
+
+
+def classroom_stats(classroom, score_type=None, date_from=None, date_to=None):
+    """
+    Statistics of all scores recorded for a classroom's students in active subjects.
+
+    Served from the ScoreAggregate rollup; only date range filters, which the
+    rollup does not keep, need the raw Score rows.
+    """
+    if date_from or date_to:
+        scores = Score.objects.filter(student__classroom=classroom, subject__is_active=True)
+        scores = filter_scores(scores, score_type=score_type, date_from=date_from, date_to=date_to)
+        stats = score_statistics(scores)
+    else:
+        aggregates = ScoreAggregate.objects.filter(student__classroom=classroom, subject__is_active=True)
+        if score_type:
+            aggregates = aggregates.filter(score_type=score_type)
+        stats = aggregate_statistics(aggregates)
+
+    stats['classroom'] = classroom
+    stats['total_students'] = classroom.students.filter(is_active=True).count()
+    stats['average_score_by_subject'] = {
+        subject['subject_name']: subject['average'] for subject in stats['subjects']
+    }
+    return stats
@@ -1,7 +1,10 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import Teacher
+from .cache import bump_versions, invalidate_scores
+from .authentication import invalidate_api_key, revoke_user_tokens
+from .models import ApiKey, Classroom, Score, Student, Subject, Teacher
+from .services.aggregates import add_score_to_aggregates, refresh_score_aggregates, score_key
 
 
 @receiver(post_save, sender=User)
@@ -16,4 +19,135 @@ def create_teacher_profile(sender, instance, created, **kwargs):
 def save_teacher_profile(sender, instance, **kwargs):
     """Save teacher profile when user is saved"""
     if hasattr(instance, 'teacher_profile'):
-        instance.teacher_profile.save()
\ No newline at end of file
+        instance.teacher_profile.save()
+
+
+# User fields the token claims and the API key entries are derived from
+PRINCIPAL_FIELDS = ('is_active', 'is_staff', 'is_superuser', 'password')
+
+
+@receiver(pre_save, sender=User)
+def remember_user_principal(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Remember the fields the tokens of a user carry before an update, e.g. not on a last_login update"""
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not set(update_fields) & set(PRINCIPAL_FIELDS):
+        return
+    instance._previous_principal = User.objects.filter(pk=instance.pk).values_list(*PRINCIPAL_FIELDS).first()
+
+
+def revoke_user_credentials(user_id):
+    """Deny the tokens issued to a user so far and drop the cached entries of their API keys"""
+    revoke_user_tokens(user_id)
+    for prefix in ApiKey.objects.filter(user_id=user_id).values_list('prefix', flat=True):
+        invalidate_api_key(prefix)
+
+
+@receiver(post_save, sender=User)
+def revoke_changed_user_credentials(sender, instance, created, raw=False, **kwargs):
+    previous = getattr(instance, '_previous_principal', None)
+    if raw or created or previous is None:
+        return
+    instance._previous_principal = None
+    if previous != tuple(getattr(instance, name) for name in PRINCIPAL_FIELDS):
+        revoke_user_credentials(instance.pk)
+
+
+@receiver(post_save, sender=Teacher)
+def revoke_credentials_of_new_teacher(sender, instance, created, raw=False, **kwargs):
+    # Tokens issued before carry no teacher id
+    if created and not raw:
+        revoke_user_credentials(instance.user_id)
+
+
+@receiver(post_delete, sender=Teacher)
+def revoke_credentials_of_removed_teacher(sender, instance, **kwargs):
+    revoke_user_credentials(instance.user_id)
+
+
+@receiver(pre_save, sender=Score)
+def remember_score_aggregate_key(sender, instance, raw=False, **kwargs):
+    """Remember the rollup key of a score before an update, the update may move it"""
+    if raw or instance._state.adding:
+        return
+    instance._previous_aggregate_key = (
+        Score.objects.filter(pk=instance.pk).values_list('student_id', 'subject_id', 'score_type').first()
+    )
+
+
+@receiver(post_save, sender=Score)
+def update_score_aggregates(sender, instance, created, raw=False, **kwargs):
+    """Keep the ScoreAggregate rollup in step with single score writes"""
+    if raw:
+        return
+    if created:
+        add_score_to_aggregates(instance)
+        return
+    keys = {score_key(instance)}
+    previous_key = getattr(instance, '_previous_aggregate_key', None)
+    if previous_key:
+        keys.add(previous_key)
+    refresh_score_aggregates(keys)
+
+
+@receiver(post_delete, sender=Score)
+def remove_score_from_aggregates(sender, instance, **kwargs):
+    refresh_score_aggregates([score_key(instance)])
+
+
+@receiver(post_save, sender=Score)
+@receiver(post_delete, sender=Score)
+def invalidate_score_responses(sender, instance, **kwargs):
+    student_ids = {instance.student_id}
+    subject_ids = {instance.subject_id}
+    previous_key = getattr(instance, '_previous_aggregate_key', None)
+    if previous_key:
+        student_ids.add(previous_key[0])
+        subject_ids.add(previous_key[1])
+    invalidate_scores(student_ids, subject_ids)
+
+
+@receiver(pre_save, sender=Student)
+def remember_student_classroom(sender, instance, raw=False, **kwargs):
+    """Remember the classroom of a student before an update, a move affects both classrooms"""
+    if raw or instance._state.adding:
+        return
+    instance._previous_classroom_id = (
+        Student.objects.filter(pk=instance.pk).values_list('classroom_id', flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+def invalidate_student_responses(sender, instance, **kwargs):
+    scopes = [('student', instance.pk), ('classroom', instance.classroom_id)]
+    previous_classroom_id = getattr(instance, '_previous_classroom_id', instance.classroom_id)
+    if previous_classroom_id != instance.classroom_id:
+        # Subject responses of teachers are restricted to their classrooms' students
+        scopes += [('classroom', previous_classroom_id), ('subjects', 'all')]
+    bump_versions(scopes)
+
+
+@receiver(post_save, sender=Classroom)
+@receiver(post_delete, sender=Classroom)
+def invalidate_classroom_responses(sender, instance, **kwargs):
+    bump_versions([('classroom', instance.pk), ('subjects', 'all')])
+
+
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+def invalidate_subject_responses(sender, instance, **kwargs):
+    bump_versions([('subject', instance.pk), ('subjects', 'all')])
+
+
+@receiver(post_save, sender=Teacher)
+@receiver(post_delete, sender=Teacher)
+def invalidate_teacher_responses(sender, instance, **kwargs):
+    # Teachers are nested in scores and classrooms of any scope; saving a user saves its teacher too
+    bump_versions([('teachers', 'all')])
+
+
+@receiver(post_save, sender=ApiKey)
+@receiver(post_delete, sender=ApiKey)
+def invalidate_api_key_entry(sender, instance, **kwargs):
+    invalidate_api_key(instance.prefix)
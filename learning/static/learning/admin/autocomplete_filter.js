@@ -0,0 +1,14 @@
+'use strict';
+// Reload the changelist filtered on the object picked in an autocomplete filter
+{
+    const $ = django.jQuery;
+    $(document).on('change', '.autocomplete-filter select[data-filter]', function() {
+        const url = new URL(window.location.href);
+        url.searchParams.delete(this.dataset.filter);
+        url.searchParams.delete('p');
+        if (this.value) {
+            url.searchParams.set(this.dataset.filter, this.value);
+        }
+        window.location.href = url.toString();
+    });
+}
@@ -8,6 +8,7 @@ router.register(r'classrooms', views.ClassroomViewSet)
 router.register(r'students', views.StudentViewSet)
 router.register(r'subjects', views.SubjectViewSet)
 router.register(r'scores', views.ScoreViewSet)
+router.register(r'reports', views.ReportViewSet)
 
 urlpatterns = [
     path('api/v1/', include(router.urls)),
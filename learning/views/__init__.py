@@ -3,5 +3,7 @@ from .classroom import ClassroomViewSet
 from .student import StudentViewSet
 from .subject import SubjectViewSet
 from .score import ScoreViewSet
+from .report import ReportViewSet
+from .auth import TokenRevokeView
 
-__all__ = ['TeacherViewSet', 'ClassroomViewSet', 'StudentViewSet', 'SubjectViewSet', 'ScoreViewSet']
\ No newline at end of file
+__all__ = ['TeacherViewSet', 'ClassroomViewSet', 'StudentViewSet', 'SubjectViewSet', 'ScoreViewSet', 'ReportViewSet', 'TokenRevokeView']
\ No newline at end of file
@@ -0,0 +1,47 @@
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from ..authentication import revoke_token
+
+
+class TokenRevokeView(APIView):
+    """
+    Revoke the access token of the request and, when given, a refresh token
+    of the same user, e.g. on logout
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="Revoke tokens",
+        operation_description=(
+            "Revoke the access token used for this request and the optional `refresh` token; "
+            "both are rejected until they expire"
+        ),
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={'refresh': openapi.Schema(type=openapi.TYPE_STRING)},
+        ),
+        responses={204: 'Revoked'},
+        tags=['Auth: Tokens']
+    )
+    def post(self, request):
+        refresh = None
+        if request.data.get('refresh'):
+            try:
+                refresh = RefreshToken(request.data['refresh'])
+            except TokenError as exc:
+                return Response({'refresh': [str(exc)]}, status=status.HTTP_400_BAD_REQUEST)
+            if str(refresh[api_settings.USER_ID_CLAIM]) != str(request.user.pk):
+                return Response({'refresh': ['Token belongs to another user']}, status=status.HTTP_400_BAD_REQUEST)
+
+        if request.auth is not None and api_settings.JTI_CLAIM in request.auth:
+            revoke_token(request.auth)
+        if refresh is not None:
+            revoke_token(refresh)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -2,27 +2,37 @@ from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Avg
-from django.http import HttpResponse
-import csv
+from rest_framework.filters import OrderingFilter
+from django.http import StreamingHttpResponse
 from datetime import datetime
 from drf_yasg.utils import swagger_auto_schema
 
-from ..models import Classroom, Subject, Score
-from ..serializers import ClassroomSerializer, StudentListSerializer, ClassroomStatsSerializer
+from libs.instrumentation import serialized_data
 
+from ..models import Classroom
+from ..pagination import FullNamePagination, NamePagination
+from ..serializers import (
+    ClassroomSerializer, StudentListSerializer, ClassroomStatsSerializer, ScoreFilterSerializer, SearchQuerySerializer,
+    TermFilterSerializer,
+)
+from ..services import classroom_grades, classroom_stats, export_students_queryset, iter_students_csv
+from ..analytics import classroom_analytics
+from ..cache import cached_response, object_scope
+from ..search import NormalizedSearchFilter
+from .mixins import PaginatedActionMixin, RankedSearchMixin, TimedSerializationMixin
 
-class ClassroomViewSet(viewsets.ModelViewSet):
+
+class ClassroomViewSet(TimedSerializationMixin, RankedSearchMixin, PaginatedActionMixin, viewsets.ModelViewSet):
     """
     Classroom Management ViewSet
     """
-    queryset = Classroom.objects.all()
+    queryset = Classroom.objects.with_students_count().with_teacher()
     serializer_class = ClassroomSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = NamePagination
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, OrderingFilter]
     filterset_fields = ['teacher', 'grade_level', 'school_year', 'is_active']
-    search_fields = ['name', 'teacher__full_name']
+    search_text_fields = ['search_text', 'teacher__search_text']
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
 
@@ -39,54 +49,69 @@ class ClassroomViewSet(viewsets.ModelViewSet):
         tags=['Classroom: Student Management']
     )
     @action(detail=True, methods=['get'])
+    @cached_response('classroom-students', object_scope('classroom'))
     def students(self, request, pk=None):
         """Get all students in a classroom"""
         classroom = self.get_object()
         students = classroom.students.filter(is_active=True)
-        serializer = StudentListSerializer(students, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(students, StudentListSerializer, FullNamePagination)
 
     @swagger_auto_schema(
         operation_summary="Get classroom statistics",
-        operation_description="Get classroom statistics including average scores by subject",
+        operation_description=(
+            "Get classroom statistics including average, count, min/max and standard deviation "
+            "of scores by subject. Optionally filter by score_type and date_from/date_to"
+        ),
+        query_serializer=ScoreFilterSerializer,
         tags=['Classroom: Statistics']
     )
     @action(detail=True, methods=['get'])
+    @cached_response('classroom-stats', object_scope('classroom', ('subjects', 'all'), ('teachers', 'all')))
     def stats(self, request, pk=None):
         """Get classroom statistics"""
         classroom = self.get_object()
-        students = classroom.students.filter(is_active=True)
-        total_students = students.count()
-
-        # Calculate average scores by subject
-        subjects = Subject.objects.filter(is_active=True)
-        average_score_by_subject = {}
-        overall_scores = []
+        filters = ScoreFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
 
-        for subject in subjects:
-            scores = Score.objects.filter(
-                student__classroom=classroom,
-                subject=subject
-            ).values_list('score', flat=True)
-            
-            if scores:
-                avg_score = sum(float(score) for score in scores) / len(scores)
-                average_score_by_subject[subject.name] = round(avg_score, 2)
-                overall_scores.extend(scores)
-
-        overall_average = None
-        if overall_scores:
-            overall_average = round(sum(float(score) for score in overall_scores) / len(overall_scores), 2)
+        data = classroom_stats(classroom, **filters.validated_data)
+        serializer = ClassroomStatsSerializer(data)
+        return Response(serialized_data(serializer))
 
-        data = {
-            'classroom': classroom,
-            'total_students': total_students,
-            'average_score_by_subject': average_score_by_subject,
-            'overall_average': overall_average
-        }
+    @swagger_auto_schema(
+        operation_summary="Get classroom analytics",
+        operation_description=(
+            "Rank the classroom's students overall and per subject with their percentile rank and z-score. "
+            "Per subject it adds the score percentiles, a histogram and each student's trend in points per "
+            "30 days. Optionally filter by score_type and date_from/date_to"
+        ),
+        query_serializer=ScoreFilterSerializer,
+        tags=['Classroom: Statistics']
+    )
+    @action(detail=True, methods=['get'])
+    @cached_response('classroom-analytics', object_scope('classroom', ('subjects', 'all')))
+    def analytics(self, request, pk=None):
+        """Get classroom rankings and score distributions"""
+        classroom = self.get_object()
+        filters = ScoreFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        return Response(classroom_analytics(classroom, **filters.validated_data))
 
-        serializer = ClassroomStatsSerializer(data)
-        return Response(serializer.data)
+    @swagger_auto_schema(
+        operation_summary="Get classroom weighted grades",
+        operation_description=(
+            "Get every student's grade per subject, weighting each score by its score_type as configured in "
+            "SCORE_TYPE_WEIGHTS, and their GPA, ranked by GPA. Pass a term, or date_from/date_to"
+        ),
+        query_serializer=TermFilterSerializer,
+        tags=['Classroom: Statistics']
+    )
+    @action(detail=True, methods=['get'])
+    def gpa(self, request, pk=None):
+        """Get classroom weighted grades and GPA ranking"""
+        classroom = self.get_object()
+        filters = TermFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        return Response(classroom_grades(classroom, **filters.validated_data))
 
     @swagger_auto_schema(
         operation_summary="Export students to CSV",
@@ -97,25 +122,49 @@ class ClassroomViewSet(viewsets.ModelViewSet):
     def export_students(self, request, pk=None):
         """Export students list to CSV"""
         classroom = self.get_object()
-        students = classroom.students.filter(is_active=True)
-
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="students_{classroom.name}_{datetime.now().strftime("%Y%m%d")}.csv"'
+        students = export_students_queryset([classroom])
+        filename = f'students_{classroom.name}_{datetime.now().strftime("%Y%m%d")}.csv'
+        return self._stream_csv(iter_students_csv(students), filename)
 
-        writer = csv.writer(response)
-        writer.writerow([
-            'Full Name', 'Student ID', 'Birth Date', 'Gender', 'Email', 
-            'Phone', 'Parent Name', 'Parent Phone', 'Average Score'
-        ])
-
-        for student in students:
-            avg_score = student.scores.aggregate(avg=Avg('score'))['avg']
-            avg_score = round(avg_score, 2) if avg_score else 'N/A'
-            
-            writer.writerow([
-                student.full_name, student.student_id, student.birth_date,
-                student.get_gender_display(), student.email, student.phone,
-                student.parent_name, student.parent_phone, avg_score
-            ])
+    @swagger_auto_schema(
+        operation_summary="Export students of many classrooms to CSV",
+        operation_description=(
+            "Export students of several classrooms (comma separated `ids`) or, without `ids`, "
+            "of every classroom matching the list filters, as a single streamed CSV file"
+        ),
+        tags=['Classroom: Export']
+    )
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Export students of many classrooms to one CSV"""
+        classrooms = self.filter_queryset(self.get_queryset())
+        ids = request.query_params.get('ids')
+        if ids:
+            try:
+                classrooms = classrooms.filter(id__in=[int(id_) for id_ in ids.split(',')])
+            except ValueError:
+                return Response({'error': 'ids must be a comma separated list of integers'},
+                                status=status.HTTP_400_BAD_REQUEST)
+
+        students = export_students_queryset(classrooms.order_by().values('id'))
+        filename = f'students_{datetime.now().strftime("%Y%m%d")}.csv'
+        return self._stream_csv(iter_students_csv(students, include_classroom=True), filename)
 
-        return response
\ No newline at end of file
+    @swagger_auto_schema(
+        operation_summary="Search classrooms",
+        operation_description=(
+            "Type-ahead search over name, grade level, school year and teacher name, ignoring accents and case: "
+            "the `limit` best matches of `search`, best first"
+        ),
+        query_serializer=SearchQuerySerializer,
+        tags=['Classroom: Search']
+    )
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """Best matches of a search query"""
+        return self.ranked_search_response(ClassroomSerializer)
+
+    def _stream_csv(self, rows, filename):
+        response = StreamingHttpResponse(rows, content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
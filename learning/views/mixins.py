@@ -0,0 +1,51 @@
+from rest_framework.response import Response
+
+from libs.instrumentation import serialized_data
+
+from ..serializers import SearchQuerySerializer
+
+
+class TimedSerializationMixin:
+    """
+    The list and retrieve actions of DRF, reading ``serializer.data`` through
+    ``serialized_data`` so that sampled requests report its time apart
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serialized_data(serializer))
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serialized_data(serializer))
+
+    def retrieve(self, request, *args, **kwargs):
+        serializer = self.get_serializer(self.get_object())
+        return Response(serialized_data(serializer))
+
+
+class PaginatedActionMixin:
+    """Paginate the list returned by a custom @action the same way the list endpoint is"""
+
+    def paginated_response(self, queryset, serializer_class, pagination_class=None):
+        # ``?ordering=`` only applies when the action lists the viewset's own model
+        view = self if pagination_class is None else None
+        paginator = (pagination_class or self.pagination_class)()
+        page = paginator.paginate_queryset(queryset, self.request, view=view)
+        serializer = serializer_class(page, many=True, context=self.get_serializer_context())
+        return paginator.get_paginated_response(serialized_data(serializer))
+
+
+class RankedSearchMixin:
+    """Type-ahead search: the best matches of ``?search=`` by relevance, without pagination"""
+
+    def ranked_search_response(self, serializer_class):
+        params = SearchQuerySerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        # filter_queryset applies the other filters and the search itself, ranked() replaces its ordering
+        queryset = self.filter_queryset(self.get_queryset()).ranked(params.validated_data['search'])
+        serializer = serializer_class(
+            queryset[:params.validated_data['limit']], many=True, context=self.get_serializer_context()
+        )
+        return Response(serialized_data(serializer))
@@ -0,0 +1,92 @@
+import os
+
+from celery import uuid
+from django.db import transaction
+from django.http import FileResponse, HttpResponseRedirect
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import mixins, permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from libs.instrumentation import serialized_data
+from tasks.reports import generate_report
+
+from ..models import Report
+from ..pagination import KeysetPagination
+from ..serializers import ReportCreateSerializer, ReportSerializer
+from ..services import report_task_state
+from .mixins import TimedSerializationMixin
+
+
+class ReportViewSet(TimedSerializationMixin, mixins.CreateModelMixin, mixins.ListModelMixin,
+                    mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    """
+    Report ViewSet
+
+    Reports are generated by a Celery task; clients poll ``status`` and fetch
+    the artifact from ``download`` once it succeeded.
+    """
+    queryset = Report.objects.all()
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    def get_serializer_class(self):
+        if self.action == 'create':
+            return ReportCreateSerializer
+        return ReportSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Staff see every report, everyone else the reports they requested
+        if not self.request.user.is_staff:
+            queryset = queryset.filter(requested_by=self.request.user)
+        return queryset
+
+    @swagger_auto_schema(
+        operation_summary="Request a report",
+        operation_description=(
+            "Enqueue a classroom, teacher or school-wide student report (csv, json or xlsx). "
+            "Poll the status endpoint until it succeeded, then download it"
+        ),
+        responses={202: ReportSerializer},
+        tags=['Report: Generation']
+    )
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # Only the user id is needed, request.user may be built from token claims
+        report = serializer.save(requested_by_id=request.user.pk, task_id=uuid())
+        # Only enqueue once the report row is visible to the worker
+        transaction.on_commit(lambda: generate_report.apply_async((report.pk,), task_id=report.task_id))
+        return Response(serialized_data(ReportSerializer(report)), status=status.HTTP_202_ACCEPTED)
+
+    @swagger_auto_schema(
+        operation_summary="Get report status",
+        operation_description="Get the report status and the state of its Celery task",
+        tags=['Report: Generation']
+    )
+    @action(detail=True, methods=['get'])
+    def status(self, request, pk=None):
+        """Get the report status"""
+        report = self.get_object()
+        data = serialized_data(ReportSerializer(report))
+        data['task'] = report_task_state(report)
+        return Response(data)
+
+    @swagger_auto_schema(
+        operation_summary="Download a report",
+        operation_description="Download the report artifact, or redirect to it when the storage serves it directly",
+        tags=['Report: Generation']
+    )
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        """Download the report artifact"""
+        report = self.get_object()
+        if report.status != Report.STATUS_SUCCESS or not report.file:
+            return Response({'error': f'Report is {report.status}'}, status=status.HTTP_409_CONFLICT)
+
+        url = report.file.url
+        if url.startswith(('http://', 'https://')):
+            # e.g. a signed S3 URL, the download then does not hold a worker
+            return HttpResponseRedirect(url)
+        return FileResponse(report.file.open('rb'), as_attachment=True, filename=os.path.basename(report.file.name))
@@ -2,29 +2,40 @@ from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from django.db.models import Q
+from dataclasses import asdict
 from drf_yasg.utils import swagger_auto_schema
 
+from libs.instrumentation import serialized_data
+
 from ..models import Score
-from ..serializers import ScoreSerializer, ScoreCreateSerializer
+from ..pagination import ScorePagination
+from ..serializers import ScoreSerializer, ScoreCreateSerializer, requested_fields
+from ..cache import cached_response, query_param_scope
+from ..services import SCORE_BULK_MAX_ROWS, ingest_scores
+from ..search import NormalizedSearchFilter
+from .mixins import TimedSerializationMixin
 
 
-class ScoreViewSet(viewsets.ModelViewSet):
+class ScoreViewSet(TimedSerializationMixin, viewsets.ModelViewSet):
     """
     Score Management ViewSet
     """
     queryset = Score.objects.all()
     serializer_class = ScoreSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = ScorePagination
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, OrderingFilter]
     filterset_fields = ['student', 'subject', 'score_type', 'teacher']
-    search_fields = ['student__full_name', 'subject__name']
+    search_text_fields = ['student__search_text', 'subject__search_text']
     ordering_fields = ['date', 'score', 'created_at']
     ordering = ['-date']
 
     def get_queryset(self):
         queryset = super().get_queryset()
+        if self.action not in ['create', 'update', 'partial_update', 'bulk_create']:
+            queryset = queryset.with_nested(requested_fields(self.request))
         # If user is a teacher, only show scores they gave or for their students
         if hasattr(self.request.user, 'teacher_profile'):
             queryset = queryset.filter(
@@ -51,35 +62,42 @@ class ScoreViewSet(viewsets.ModelViewSet):
         tags=['Score: Classroom Filter']
     )
     @action(detail=False, methods=['get'])
+    @cached_response(
+        'score-by-classroom', query_param_scope('classroom', 'classroom_id', ('subjects', 'all'), ('teachers', 'all'))
+    )
     def by_classroom(self, request):
         """Get scores filtered by classroom"""
         classroom_id = request.query_params.get('classroom_id')
         if not classroom_id:
             return Response({'error': 'classroom_id is required'}, status=status.HTTP_400_BAD_REQUEST)
         
-        scores = self.get_queryset().filter(student__classroom_id=classroom_id)
-        serializer = self.get_serializer(scores, many=True)
-        return Response(serializer.data)
+        scores = self.filter_queryset(self.get_queryset()).filter(student__classroom_id=classroom_id)
+        page = self.paginate_queryset(scores)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serialized_data(serializer))
 
     @swagger_auto_schema(
         operation_summary="Bulk create scores",
-        operation_description="Create multiple scores at once",
+        operation_description=(
+            "Create or update up to 10,000 scores at once. Rows are matched on "
+            "(student, subject, score_type, date): existing scores are updated, new ones created. "
+            "Invalid rows are reported by index in `errors` and do not abort the batch"
+        ),
         tags=['Score: Bulk Operations']
     )
     @action(detail=False, methods=['post'])
     def bulk_create(self, request):
-        """Create multiple scores at once"""
+        """Create or update multiple scores at once"""
         data = request.data
         if not isinstance(data, list):
             return Response({'error': 'Expected a list of scores'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        serializer = ScoreCreateSerializer(data=data, many=True)
-        if serializer.is_valid():
-            # Set teacher for all scores if user is a teacher
-            if hasattr(request.user, 'teacher_profile'):
-                for score_data in serializer.validated_data:
-                    score_data['teacher'] = request.user.teacher_profile
-            
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+        if len(data) > SCORE_BULK_MAX_ROWS:
+            return Response({'error': f'At most {SCORE_BULK_MAX_ROWS} scores can be submitted at once'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        # Set teacher for all scores if user is a teacher
+        teacher = getattr(request.user, 'teacher_profile', None)
+        result = ingest_scores(data, teacher=teacher)
+
+        response_status = status.HTTP_201_CREATED if result.created or result.updated else status.HTTP_400_BAD_REQUEST
+        return Response(asdict(result), status=response_status)
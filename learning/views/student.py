@@ -2,23 +2,31 @@ from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Avg
+from rest_framework.filters import OrderingFilter
+from dataclasses import asdict
 from drf_yasg.utils import swagger_auto_schema
 
-from ..models import Student, Subject
-from ..serializers import StudentListSerializer, StudentDetailSerializer, StudentScoreHistorySerializer
+from ..models import Classroom, Student
+from ..pagination import FullNamePagination, ScorePagination
+from ..serializers import (
+    SearchQuerySerializer, StudentListSerializer, StudentDetailSerializer, StudentScoreHistorySerializer,
+    TermFilterSerializer,
+)
+from ..services import STUDENT_BULK_MAX_ROWS, averages_by_subject, enroll_students, student_grades
+from ..cache import cached_response, object_scope
+from ..search import NormalizedSearchFilter
+from .mixins import PaginatedActionMixin, RankedSearchMixin, TimedSerializationMixin
 
 
-class StudentViewSet(viewsets.ModelViewSet):
+class StudentViewSet(TimedSerializationMixin, RankedSearchMixin, PaginatedActionMixin, viewsets.ModelViewSet):
     """
     Student Management ViewSet
     """
     queryset = Student.objects.all()
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = FullNamePagination
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, OrderingFilter]
     filterset_fields = ['classroom', 'gender', 'is_active', 'classroom__grade_level']
-    search_fields = ['full_name', 'student_id', 'email']
     ordering_fields = ['full_name', 'birth_date', 'created_at']
     ordering = ['full_name']
 
@@ -28,7 +36,7 @@ class StudentViewSet(viewsets.ModelViewSet):
         return StudentDetailSerializer
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = super().get_queryset().select_related('classroom')
         # If user is a teacher, only show students in their classrooms
         if hasattr(self.request.user, 'teacher_profile'):
             queryset = queryset.filter(classroom__teacher=self.request.user.teacher_profile)
@@ -40,10 +48,11 @@ class StudentViewSet(viewsets.ModelViewSet):
         tags=['Student: Score Management']
     )
     @action(detail=True, methods=['get'])
+    @cached_response('student-scores', object_scope('student', ('subjects', 'all'), ('teachers', 'all')))
     def scores(self, request, pk=None):
         """Get all scores for a specific student"""
         student = self.get_object()
-        scores = student.scores.all().order_by('-date')
+        scores = student.scores.select_related('subject', 'teacher')
         
         # Filter by subject if provided
         subject_id = request.query_params.get('subject_id')
@@ -55,8 +64,7 @@ class StudentViewSet(viewsets.ModelViewSet):
         if score_type:
             scores = scores.filter(score_type=score_type)
 
-        serializer = StudentScoreHistorySerializer(scores, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(scores, StudentScoreHistorySerializer, ScorePagination)
 
     @swagger_auto_schema(
         operation_summary="Get student average by subject",
@@ -64,15 +72,68 @@ class StudentViewSet(viewsets.ModelViewSet):
         tags=['Student: Statistics']
     )
     @action(detail=True, methods=['get'])
+    @cached_response('student-average-by-subject', object_scope('student', ('subjects', 'all')))
     def average_by_subject(self, request, pk=None):
         """Get student's average score by subject"""
         student = self.get_object()
-        subjects = Subject.objects.filter(is_active=True)
-        
-        averages = {}
-        for subject in subjects:
-            avg = student.scores.filter(subject=subject).aggregate(avg=Avg('score'))['avg']
-            if avg:
-                averages[subject.name] = round(avg, 2)
-        
-        return Response(averages)
\ No newline at end of file
+        aggregates = student.score_aggregates.filter(subject__is_active=True)
+        return Response(averages_by_subject(aggregates))
+
+    @swagger_auto_schema(
+        operation_summary="Get student weighted grades",
+        operation_description=(
+            "Get the student's grade per subject, weighting each score by its score_type as configured in "
+            "SCORE_TYPE_WEIGHTS, and their GPA, the mean of the subject grades. Pass a term, or date_from/date_to"
+        ),
+        query_serializer=TermFilterSerializer,
+        tags=['Student: Statistics']
+    )
+    @action(detail=True, methods=['get'])
+    def gpa(self, request, pk=None):
+        """Get student's weighted grades and GPA"""
+        student = self.get_object()
+        filters = TermFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        return Response(student_grades(student, **filters.validated_data))
+
+    @swagger_auto_schema(
+        operation_summary="Bulk enroll students",
+        operation_description=(
+            "Create up to 10,000 students at once. Rows without a student_id get the next free ids of their "
+            "classroom's school year, e.g. 202400001. Invalid rows are reported by index in `errors` and do not "
+            "abort the batch, created rows are listed in `students` with their id and student_id"
+        ),
+        tags=['Student: Bulk Operations']
+    )
+    @action(detail=False, methods=['post'])
+    def bulk_enroll(self, request):
+        """Create multiple students at once"""
+        data = request.data
+        if not isinstance(data, list):
+            return Response({'error': 'Expected a list of students'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(data) > STUDENT_BULK_MAX_ROWS:
+            return Response({'error': f'At most {STUDENT_BULK_MAX_ROWS} students can be submitted at once'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        # Teachers can only enroll students into their own classrooms
+        classrooms = Classroom.objects.all()
+        if hasattr(request.user, 'teacher_profile'):
+            classrooms = classrooms.filter(teacher=request.user.teacher_profile)
+        result = enroll_students(data, classrooms=classrooms)
+
+        response_status = status.HTTP_201_CREATED if result.created else status.HTTP_400_BAD_REQUEST
+        return Response(asdict(result), status=response_status)
+
+    @swagger_auto_schema(
+        operation_summary="Search students",
+        operation_description=(
+            "Type-ahead search over full name, student id and email, ignoring accents and case: "
+            "the `limit` best matches of `search`, best first"
+        ),
+        query_serializer=SearchQuerySerializer,
+        tags=['Student: Search']
+    )
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """Best matches of a search query"""
+        return self.ranked_search_response(StudentListSerializer)
@@ -2,24 +2,31 @@ from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Avg, Count
+from rest_framework.filters import OrderingFilter
 from drf_yasg.utils import swagger_auto_schema
 
 from ..models import Subject
-from ..serializers import SubjectSerializer, ScoreSerializer
+from ..pagination import NamePagination, ScorePagination
+from ..serializers import (
+    AnalyticsFilterSerializer, SearchQuerySerializer, SubjectSerializer, ScoreSerializer, requested_fields
+)
+from ..services import aggregate_average, filter_scores
+from ..analytics import subject_analytics
+from ..cache import cached_response, object_scope
+from ..search import NormalizedSearchFilter
+from .mixins import PaginatedActionMixin, RankedSearchMixin, TimedSerializationMixin
 
 
-class SubjectViewSet(viewsets.ModelViewSet):
+class SubjectViewSet(TimedSerializationMixin, RankedSearchMixin, PaginatedActionMixin, viewsets.ModelViewSet):
     """
     Subject Management ViewSet
     """
-    queryset = Subject.objects.all()
+    queryset = Subject.objects.with_scores_count()
     serializer_class = SubjectSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = NamePagination
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, OrderingFilter]
     filterset_fields = ['is_active']
-    search_fields = ['name', 'code']
     ordering_fields = ['name', 'code', 'created_at']
     ordering = ['name']
 
@@ -29,17 +36,17 @@ class SubjectViewSet(viewsets.ModelViewSet):
         tags=['Subject: Score Management']
     )
     @action(detail=True, methods=['get'])
+    @cached_response('subject-scores', object_scope('subject', ('subjects', 'all'), ('teachers', 'all')))
     def scores(self, request, pk=None):
         """Get all scores for a specific subject"""
         subject = self.get_object()
-        scores = subject.scores.all()
+        scores = subject.scores.with_nested(requested_fields(request))
         
         # Filter by classroom if user is a teacher
         if hasattr(self.request.user, 'teacher_profile'):
             scores = scores.filter(student__classroom__teacher=self.request.user.teacher_profile)
             
-        serializer = ScoreSerializer(scores, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(scores, ScoreSerializer, ScorePagination)
 
     @swagger_auto_schema(
         operation_summary="Get subject statistics",
@@ -47,22 +54,56 @@ class SubjectViewSet(viewsets.ModelViewSet):
         tags=['Subject: Statistics']
     )
     @action(detail=True, methods=['get'])
+    @cached_response('subject-statistics', object_scope('subject', ('subjects', 'all')))
     def statistics(self, request, pk=None):
         """Get statistics for a specific subject"""
         subject = self.get_object()
-        scores = subject.scores.all()
+        aggregates = subject.score_aggregates.all()
         
         # Filter by classroom if user is a teacher
         if hasattr(self.request.user, 'teacher_profile'):
-            scores = scores.filter(student__classroom__teacher=self.request.user.teacher_profile)
+            aggregates = aggregates.filter(student__classroom__teacher=self.request.user.teacher_profile)
         
-        if scores.exists():
-            stats = scores.aggregate(
-                average=Avg('score'),
-                count=Count('id')
-            )
-            stats['average'] = round(stats['average'], 2) if stats['average'] else 0
-        else:
-            stats = {'average': 0, 'count': 0}
-            
-        return Response(stats)
\ No newline at end of file
+        count, average = aggregate_average(aggregates)
+        stats = {'average': round(average, 2) if average is not None else 0, 'count': count}
+        return Response(stats)
+
+    @swagger_auto_schema(
+        operation_summary="Get subject analytics",
+        operation_description=(
+            "Score percentiles, histogram and trend of a subject, its classrooms ranked by average and its "
+            "`limit` best ranked students with their percentile rank, z-score and trend in points per 30 days. "
+            "Optionally filter by score_type and date_from/date_to"
+        ),
+        query_serializer=AnalyticsFilterSerializer,
+        tags=['Subject: Statistics']
+    )
+    @action(detail=True, methods=['get'])
+    @cached_response('subject-analytics', object_scope('subject', ('subjects', 'all')))
+    def analytics(self, request, pk=None):
+        """Get subject rankings and score distribution"""
+        subject = self.get_object()
+        filters = AnalyticsFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        limit = filters.validated_data.pop('limit')
+
+        scores = filter_scores(subject.scores.all(), **filters.validated_data)
+        # Filter by classroom if user is a teacher
+        if hasattr(self.request.user, 'teacher_profile'):
+            scores = scores.filter(student__classroom__teacher=self.request.user.teacher_profile)
+
+        return Response(subject_analytics(subject, scores, limit=limit))
+
+    @swagger_auto_schema(
+        operation_summary="Search subjects",
+        operation_description=(
+            "Type-ahead search over name and code, ignoring accents and case: "
+            "the `limit` best matches of `search`, best first"
+        ),
+        query_serializer=SearchQuerySerializer,
+        tags=['Subject: Search']
+    )
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """Best matches of a search query"""
+        return self.ranked_search_response(SubjectSerializer)
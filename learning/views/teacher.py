@@ -2,27 +2,34 @@ from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import permissions, viewsets
 from rest_framework.decorators import action
-from rest_framework.filters import OrderingFilter, SearchFilter
-from rest_framework.response import Response
+from rest_framework.filters import OrderingFilter
 
 from ..models import Student, Teacher
+from ..pagination import FullNamePagination, NamePagination
+from ..search import NormalizedSearchFilter
 from ..serializers import (
     ClassroomSerializer,
+    SearchQuerySerializer,
     StudentListSerializer,
     TeacherSerializer,
 )
+from .mixins import (
+    PaginatedActionMixin,
+    RankedSearchMixin,
+    TimedSerializationMixin,
+)
 
 
-class TeacherViewSet(viewsets.ModelViewSet):
+class TeacherViewSet(TimedSerializationMixin, RankedSearchMixin, PaginatedActionMixin, viewsets.ModelViewSet):
     """
     Teacher Management ViewSet
     """
 
-    queryset = Teacher.objects.all()
+    queryset = Teacher.objects.select_related("user").with_classrooms_count()
     serializer_class = TeacherSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    search_fields = ["full_name", "email"]
+    pagination_class = FullNamePagination
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, OrderingFilter]
     ordering_fields = ["full_name", "created_at"]
     ordering = ["full_name"]
 
@@ -42,9 +49,14 @@ class TeacherViewSet(viewsets.ModelViewSet):
     def classrooms(self, request, pk=None):
         """Get all classrooms for a specific teacher"""
         teacher = self.get_object()
-        classrooms = teacher.classrooms.filter(is_active=True)
-        serializer = ClassroomSerializer(classrooms, many=True)
-        return Response(serializer.data)
+        classrooms = (
+            teacher.classrooms.filter(is_active=True)
+            .with_students_count()
+            .with_teacher()
+        )
+        return self.paginated_response(
+            classrooms, ClassroomSerializer, NamePagination
+        )
 
     @swagger_auto_schema(
         operation_summary="Get teacher's students",
@@ -57,6 +69,21 @@ class TeacherViewSet(viewsets.ModelViewSet):
         teacher = self.get_object()
         students = Student.objects.filter(
             classroom__teacher=teacher, is_active=True
+        ).select_related("classroom")
+        return self.paginated_response(
+            students, StudentListSerializer, FullNamePagination
         )
-        serializer = StudentListSerializer(students, many=True)
-        return Response(serializer.data)
+
+    @swagger_auto_schema(
+        operation_summary="Search teachers",
+        operation_description=(
+            "Type-ahead search over full name and email, ignoring accents and case: "
+            "the `limit` best matches of `search`, best first"
+        ),
+        query_serializer=SearchQuerySerializer,
+        tags=["Teacher: Search"],
+    )
+    @action(detail=False, methods=["get"])
+    def search(self, request):
+        """Best matches of a search query"""
+        return self.ranked_search_response(TeacherSerializer)
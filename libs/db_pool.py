@@ -0,0 +1,24 @@
+"""Connection reuse statistics of the configured databases."""
+
+from django.db import connections
+
+
+def database_pool_stats():
+    """
+    Per database alias: the psycopg pool counters when a pool is configured,
+    otherwise whether this worker holds a persistent connection.
+    """
+    stats = {}
+    for alias in connections:
+        connection = connections[alias]
+        pool = getattr(connection, "pool", None)
+        if pool is not None:
+            stats[alias] = {"pooled": True, **pool.get_stats()}
+        else:
+            stats[alias] = {
+                "pooled": False,
+                "conn_max_age": connection.settings_dict.get("CONN_MAX_AGE"),
+                "health_checks": connection.settings_dict.get("CONN_HEALTH_CHECKS"),
+                "connected": connection.connection is not None,
+            }
+    return stats
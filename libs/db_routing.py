@@ -0,0 +1,163 @@
+"""
+Read-replica routing.
+
+Reads of the routed apps go to a replica listed in ``DATABASE_REPLICAS``
+while a request or task opted into it, the same replica for all of its reads
+so they see one consistent state despite replicas lagging differently: ``ReplicaRoutingMiddleware`` opts in
+safe (GET/HEAD/OPTIONS) requests and ``use_replica()`` opts in background
+work. Everything else, and every read after a write in the same request or
+task, uses the primary. A client that wrote is pinned to the primary for
+``DATABASE_REPLICA_PIN_SECONDS`` with a cookie, so it reads its own writes
+while the replicas catch up. Replicas that cannot be reached are skipped for
+``DATABASE_REPLICA_RETRY_SECONDS``.
+"""
+
+import contextlib
+import contextvars
+import random
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+@dataclass
+class RoutingState:
+    use_replica: bool = False
+    wrote: bool = False
+    # Replica of the request or task, None for the primary, chosen at its first routed read
+    replica: str | None = None
+    replica_chosen: bool = False
+
+    def get_replica(self):
+        if not self.replica_chosen:
+            self.replica = choose_replica()
+            self.replica_chosen = True
+        return self.replica
+
+
+_state = contextvars.ContextVar("db_routing_state", default=None)
+# alias -> monotonic time until which the replica is considered down
+_unavailable_until = {}
+
+
+def replica_aliases():
+    return list(getattr(settings, "DATABASE_REPLICAS", []))
+
+
+def replica_available(alias):
+    """Whether a replica accepts connections, remembering failures for a while"""
+    if _unavailable_until.get(alias, 0) > time.monotonic():
+        return False
+    try:
+        connections[alias].ensure_connection()
+    except DatabaseError:
+        retry = getattr(settings, "DATABASE_REPLICA_RETRY_SECONDS", 30)
+        _unavailable_until[alias] = time.monotonic() + retry
+        return False
+    _unavailable_until.pop(alias, None)
+    return True
+
+
+def choose_replica():
+    """A reachable replica, or None to read from the primary"""
+    aliases = replica_aliases()
+    random.shuffle(aliases)
+    for alias in aliases:
+        if replica_available(alias):
+            return alias
+    return None
+
+
+def used_replica():
+    """Whether the current request or task read from a replica, whose data may lag"""
+    state = _state.get()
+    return state is not None and state.replica_chosen and state.replica is not None
+
+
+@contextlib.contextmanager
+def use_replica(enabled=True):
+    """Route the reads of the enclosed block to a replica until it writes"""
+    token = _state.set(RoutingState(use_replica=enabled))
+    try:
+        yield
+    finally:
+        _state.reset(token)
+
+
+class ReplicaRouter:
+    """Send reads to replicas when the current request or task allows it"""
+
+    def _routed(self, model):
+        apps = getattr(settings, "DATABASE_REPLICA_APPS", ["learning"])
+        return model._meta.app_label in apps
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.use_replica or state.wrote or not self._routed(model):
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            # Reads inside a transaction must see its writes
+            return None
+        return state.get_replica()
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            # Stick to the primary for the rest of the request or task
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas are copies of the primary, never migrated directly
+        return db not in replica_aliases()
+
+
+class ReplicaRoutingMiddleware:
+    """Let safe requests read from replicas unless the client wrote recently"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = RoutingState(
+            use_replica=request.method in SAFE_METHODS and PRIMARY_PIN_COOKIE not in request.COOKIES
+        )
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+
+        if response.streaming:
+            # Streamed bodies query the database after this middleware returned
+            response.streaming_content = self._stream_with_state(state, response.streaming_content)
+        elif state.wrote:
+            self._pin(response)
+        return response
+
+    def _stream_with_state(self, state, content):
+        iterator = iter(content)
+        while True:
+            token = _state.set(state)
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _state.reset(token)
+            yield chunk
+
+    def _pin(self, response):
+        max_age = getattr(settings, "DATABASE_REPLICA_PIN_SECONDS", 5)
+        response.set_cookie(PRIMARY_PIN_COOKIE, "1", max_age=max_age, httponly=True, samesite="Lax")
@@ -0,0 +1,154 @@
+"""
+Per-request SQL and latency instrumentation.
+
+A sample of requests (``REQUEST_INSTRUMENTATION_SAMPLE_RATE``) records the
+number of queries, the time spent in the database, in serializing the data
+(``serializer.data`` read through ``serialized_data()``, without the queries
+it runs), in rendering the response and in total, and the response size. The
+measurements are logged as key=value fields by the ``libs.instrumentation``
+logger and returned in a ``Server-Timing`` header. Requests that are not
+sampled only pay for one random number.
+"""
+
+import contextlib
+import contextvars
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Measurements of the sampled request being handled, None outside of one
+current_metrics = contextvars.ContextVar("request_metrics", default=None)
+
+
+class QueryTimer:
+    """Database execute wrapper counting queries and the time spent running them"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = QueryTimer()
+        self.render_started = None
+        self.render_duration = 0.0
+        self.serialize_duration = 0.0
+        self.serializing = False
+
+    @contextlib.contextmanager
+    def serializing_data(self):
+        """Add the time spent in the block, less its queries, to the serialization time"""
+        if self.serializing:
+            # A serializer reading the data of another one, already timed
+            yield
+            return
+        self.serializing = True
+        started = time.perf_counter()
+        db_started = self.queries.duration
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.serialize_duration += elapsed - (self.queries.duration - db_started)
+            self.serializing = False
+
+    def start_render(self):
+        self.render_started = time.perf_counter()
+
+    def end_render(self, response):
+        if self.render_started is not None:
+            self.render_duration = time.perf_counter() - self.render_started
+        return response
+
+
+def serialized_data(serializer):
+    """``serializer.data``, timed as serialization when the request is sampled"""
+    metrics = current_metrics.get()
+    if metrics is None:
+        return serializer.data
+    with metrics.serializing_data():
+        return serializer.data
+
+
+def view_labels(request):
+    """Route name and viewset action of the resolved view"""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unresolved", ""
+    actions = getattr(match.func, "actions", None) or {}
+    return match.view_name or match.func.__name__, actions.get(request.method.lower(), "")
+
+
+class RequestInstrumentationMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        rate = getattr(settings, "REQUEST_INSTRUMENTATION_SAMPLE_RATE", 0)
+        if not rate or random.random() >= rate:
+            return self.get_response(request)
+
+        metrics = request._instrumentation = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            with contextlib.ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(metrics.queries))
+                response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        self.report(request, response, metrics)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered after the view returned
+        metrics = getattr(request, "_instrumentation", None)
+        if metrics is not None:
+            metrics.start_render()
+            response.add_post_render_callback(metrics.end_render)
+        return response
+
+    def report(self, request, response, metrics):
+        total = time.perf_counter() - metrics.started
+        db = metrics.queries.duration
+        serialize = metrics.serialize_duration
+        render = metrics.render_duration
+        view, action = view_labels(request)
+        size = None if response.streaming else len(response.content)
+
+        fields = {
+            "view": view,
+            "action": action,
+            "method": request.method,
+            "status": response.status_code,
+            "queries": metrics.queries.count,
+            "db_ms": round(db * 1000, 2),
+            "serialize_ms": round(serialize * 1000, 2),
+            "render_ms": round(render * 1000, 2),
+            "app_ms": round(max(total - db - serialize - render, 0) * 1000, 2),
+            "total_ms": round(total * 1000, 2),
+            "bytes": size,
+        }
+        logger.info(" ".join(f"{key}={value}" for key, value in fields.items()), extra=fields)
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={fields["db_ms"]};desc="{fields["queries"]} queries"',
+            f'serialize;dur={fields["serialize_ms"]}',
+            f'render;dur={fields["render_ms"]}',
+            f'app;dur={fields["app_ms"]}',
+            f'total;dur={fields["total_ms"]}',
+        ])
@@ -0,0 +1,172 @@
+"""
+Prometheus metrics of the API and the Celery workers.
+
+``PrometheusMetricsMiddleware`` records the latency and the number of queries
+of every request per DRF route and action, the response cache records its
+hits and misses and the Celery signal handlers below time every task.
+``metrics_view`` exposes them together with the Celery queue lengths and the
+database pool counters, which are read when the endpoint is scraped.
+
+Every gunicorn worker and Celery process keeps its own values. Set
+``PROMETHEUS_MULTIPROC_DIR`` to a directory shared by the processes of a host
+(and emptied when they start) so that ``/metrics`` aggregates all of them.
+The variable has to be set before the processes start, prometheus_client
+reads it when it is imported.
+"""
+
+import contextlib
+import logging
+import os
+import time
+
+from celery.signals import task_postrun, task_prerun
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
+from kombu.exceptions import OperationalError
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from .db_pool import database_pool_stats
+from .instrumentation import QueryTimer, view_labels
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time spent serving a request",
+    ["view", "action", "method", "status"],
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Number of SQL queries run by a request",
+    ["view", "action"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+RESPONSE_CACHE_REQUESTS = Counter(
+    "response_cache_requests",
+    "Lookups of the response cache by action and result",
+    ["name", "result"],
+)
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Time spent running a Celery task",
+    ["task", "state"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600, float("inf")),
+)
+
+# task id -> perf_counter when the task started, in the worker process
+_task_started = {}
+
+
+@task_prerun.connect
+def start_task_timer(task_id=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def observe_task_duration(task_id=None, task=None, state=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    if started is not None:
+        CELERY_TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(time.perf_counter() - started)
+
+
+def record_cache_request(name, hit):
+    RESPONSE_CACHE_REQUESTS.labels(name, "hit" if hit else "miss").inc()
+
+
+def celery_queue_lengths(queues):
+    """Number of messages waiting in each queue, or {} when the broker cannot be reached
+
+    A queue missing from the result has no gauge in the scrape.
+    """
+    from student_management.celery_tasks import celery_app
+
+    lengths = {}
+    with celery_app.connection_for_read() as connection:
+        errors = (OperationalError, *connection.connection_errors, *connection.channel_errors)
+        try:
+            connection.ensure_connection(max_retries=1)
+            for queue in queues:
+                lengths[queue] = connection.default_channel.queue_declare(queue=queue, passive=True).message_count
+        except errors:
+            logger.warning("Could not read the Celery queue lengths", exc_info=True)
+    return lengths
+
+
+class ScrapeTimeCollector:
+    """Values read when the endpoint is scraped rather than recorded by the processes"""
+
+    def describe(self):
+        # Registering the collector would otherwise call collect() and reach
+        # the broker, at import time
+        return []
+
+    def collect(self):
+        queues = getattr(settings, "METRICS_CELERY_QUEUES", [])
+        if queues:
+            depth = GaugeMetricFamily("celery_queue_length", "Messages waiting in a Celery queue", labels=["queue"])
+            for queue, length in celery_queue_lengths(queues).items():
+                depth.add_metric([queue], length)
+            yield depth
+
+        # Only the pools of the process answering the scrape
+        pools = {}
+        for alias, stats in database_pool_stats().items():
+            if not stats["pooled"]:
+                continue
+            for stat, value in stats.items():
+                if isinstance(value, int) and not isinstance(value, bool):
+                    if stat not in pools:
+                        pools[stat] = GaugeMetricFamily(f"db_{stat}", f"psycopg pool {stat}", labels=["alias"])
+                    pools[stat].add_metric([alias], value)
+        yield from pools.values()
+
+
+_scrape_time_collector = ScrapeTimeCollector()
+if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+    REGISTRY.register(_scrape_time_collector)
+
+
+def metrics_registry():
+    """The default registry, or one aggregating every process sharing PROMETHEUS_MULTIPROC_DIR"""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(_scrape_time_collector)
+    return registry
+
+
+def metrics_view(request):
+    return HttpResponse(generate_latest(metrics_registry()), content_type=CONTENT_TYPE_LATEST)
+
+
+class PrometheusMetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = QueryTimer()
+        started = time.perf_counter()
+        with contextlib.ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(queries))
+            response = self.get_response(request)
+
+        view, action = view_labels(request)
+        REQUEST_LATENCY.labels(view, action, request.method, response.status_code).observe(
+            time.perf_counter() - started
+        )
+        REQUEST_QUERIES.labels(view, action).observe(queries.count)
+        return response
@@ -8,6 +8,7 @@ from .celery import *
 from .database import *
 from .drf import *
 from .internationalization import *
+from .learning import *
 from .logging import *
 from .middleware import *
 from .password import *
@@ -1,5 +1,18 @@
+from .base import config
+
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.dummy.DummyCache",
-    }
+    },
+    # Revoked JWTs, only valid in a single process; deployments use a shared cache
+    "jwt_denylist": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "jwt-denylist",
+    },
 }
+
+# Lifetime of cached statistics responses. They are invalidated by version
+# bumps when scores or students change, the timeout only bounds memory use.
+RESPONSE_CACHE_TIMEOUT = config(
+    "RESPONSE_CACHE_TIMEOUT", default=60 * 60, cast=int
+)
@@ -11,11 +11,24 @@ CELERY_BROKER_URL = config(
 CELERY_RESULT_BACKEND = "django-db"
 CELERY_CACHE_BACKEND = "django-cache"
 CELERY_TIMEZONE = TIME_ZONE
-CELERY_TASK_SERIALIZER = "pickle"
-CELERY_RESULT_SERIALIZER = "pickle"
-CELERY_RESULT_EXTENDED = True
-CELERY_ACCEPT_CONTENT = ["pickle"]
+# Tasks take primary keys and return small references (large artifacts such as
+# reports go to STORAGES["default"]), so a compact serializer is enough.
+# "msgpack" is supported when the msgpack package is installed; see
+# `manage.py benchmark_celery_serializers`.
+CELERY_TASK_SERIALIZER = config("CELERY_TASK_SERIALIZER", default="json")
+CELERY_RESULT_SERIALIZER = config("CELERY_RESULT_SERIALIZER", default="json")
+CELERY_ACCEPT_CONTENT = sorted(
+    {"json", CELERY_TASK_SERIALIZER, CELERY_RESULT_SERIALIZER}
+)
+CELERY_RESULT_ACCEPT_CONTENT = CELERY_ACCEPT_CONTENT
+CELERY_TASK_COMPRESSION = config("CELERY_TASK_COMPRESSION", default=None)
+# Extended results copy the task args, kwargs and name into every result row
+CELERY_RESULT_EXTENDED = config(
+    "CELERY_RESULT_EXTENDED", default=False, cast=bool
+)
 CELERY_TASK_DEFAULT_QUEUE = "default"
+# Queues whose lengths /metrics reads from the broker when it is scraped
+METRICS_CELERY_QUEUES = [CELERY_TASK_DEFAULT_QUEUE]
 CELERY_TASK_SOFT_TIME_LIMIT = 60 * 60 * 6  # default to 6 hours.
 CELERY_TASK_ALWAYS_EAGER = config(
     "CELERY_TASK_ALWAYS_EAGER", default=False, cast=bool
@@ -1,11 +1,17 @@
 from datetime import timedelta
 
+from decouple import Csv
+
 from .base import config
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.BasicAuthentication",
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # Builds request.user from the token claims, no user or teacher query per request
+        "learning.authentication.ClaimsJWTAuthentication",
+        # Machine clients, e.g. the SIS integration: a cached lookup and one HMAC per request
+        "learning.authentication.ApiKeyAuthentication",
+        # Hashes the password on every request, only on the BASIC_AUTH_PATHS endpoints
+        "learning.authentication.RestrictedBasicAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
@@ -19,6 +25,8 @@ REST_FRAMEWORK = {
         "django_filters.rest_framework.DjangoFilterBackend",
         "rest_framework.filters.OrderingFilter",
     ],
+    "DEFAULT_PAGINATION_CLASS": "learning.pagination.KeysetPagination",
+    "PAGE_SIZE": 50,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "EXCEPTION_HANDLER": "drf_standardized_errors.handler.exception_handler",
 }
@@ -38,4 +46,22 @@ SIMPLE_JWT = {
             cast=int,
         )
     ),
+    # Embed the user id, username, role flags and teacher id as claims
+    "TOKEN_OBTAIN_SERIALIZER": "learning.authentication.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "learning.authentication.ClaimsTokenRefreshSerializer",
 }
+
+# Cache holding the jti of revoked tokens and the revocation times of users until their tokens expire.
+# It must be persistent, shared by every process and never evict, or revoked tokens are accepted again:
+# a separate Redis cache with maxmemory-policy noeviction, not the response cache. The learning.E001
+# check fails on a local memory or dummy cache when DEBUG is off.
+JWT_DENYLIST_CACHE = config("JWT_DENYLIST_CACHE", default="jwt_denylist")
+
+# Regular expressions of the request paths accepting Basic auth, e.g. ^/api/v1/scores/bulk_create/$
+BASIC_AUTH_PATHS = config("BASIC_AUTH_PATHS", default="", cast=Csv())
+
+# API keys are HMAC-ed with this secret, SECRET_KEY when empty. Changing it invalidates every key
+API_KEY_SECRET = config("API_KEY_SECRET", default="")
+API_KEY_CACHE = config("API_KEY_CACHE", default="default")
+# How long a key lookup is cached, bounds how long changes to its user take to apply
+API_KEY_CACHE_TIMEOUT = config("API_KEY_CACHE_TIMEOUT", default=300, cast=int)
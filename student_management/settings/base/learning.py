@@ -0,0 +1,9 @@
+# Weight of each Score.score_type in weighted term grades and GPAs, e.g. a
+# final counts three times as much as a quiz. Types with weight 0 are ignored.
+SCORE_TYPE_WEIGHTS = {
+    "quiz": 1,
+    "assignment": 1,
+    "participation": 1,
+    "midterm": 2,
+    "final": 3,
+}
@@ -1,7 +1,13 @@
-from .base import BASE_DIR, LOG_LEVEL
+from .base import BASE_DIR, LOG_LEVEL, config
 
 LOG_DIRECTORY = BASE_DIR
 
+# Share of requests whose query count, DB, serialization and render time and size are
+# logged by libs.instrumentation and returned as a Server-Timing header
+REQUEST_INSTRUMENTATION_SAMPLE_RATE = config(
+    "REQUEST_INSTRUMENTATION_SAMPLE_RATE", default=0.05, cast=float
+)
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -24,4 +30,11 @@ LOGGING = {
         "handlers": ["console"],
         "level": LOG_LEVEL,
     },
+    "loggers": {
+        "libs.instrumentation": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
 }
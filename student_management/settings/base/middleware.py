@@ -1,5 +1,8 @@
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "libs.metrics.PrometheusMetricsMiddleware",
+    "libs.instrumentation.RequestInstrumentationMiddleware",
+    "libs.db_routing.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -25,6 +25,12 @@ CACHES = {
         "KEY_PREFIX": CACHE_PREFIX + "default",
         "TIMEOUT": CACHE_TIMEOUT,
     },
+    # Revoked JWTs, kept apart from the evictable response cache
+    "jwt_denylist": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": config("JWT_DENYLIST_CACHE_URL", default=CACHE_URL),
+        "KEY_PREFIX": CACHE_PREFIX + "jwt-denylist",
+    },
 }
 
 # Session settings
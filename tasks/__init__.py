@@ -0,0 +1,3 @@
+from .reports import generate_report
+
+__all__ = ["generate_report"]
@@ -0,0 +1,28 @@
+from celery import shared_task
+from django.utils import timezone
+
+from learning.models import Report
+from learning.services import build_report
+from libs.db_routing import use_replica
+
+
+@shared_task(bind=True)
+def generate_report(self, report_id):
+    """
+    Build a report artifact outside the request cycle.
+
+    Takes the report's primary key and returns only a reference to the
+    artifact, which lives in the default storage, not in the result backend.
+    """
+    Report.objects.filter(pk=report_id).update(status=Report.STATUS_RUNNING)
+    # Read from the primary, a replica may not have the new report yet
+    report = Report.objects.get(pk=report_id)
+    try:
+        with use_replica():
+            build_report(report)
+    except Exception as exc:
+        Report.objects.filter(pk=report_id).update(
+            status=Report.STATUS_FAILURE, error=str(exc), finished_at=timezone.now()
+        )
+        raise
+    return {"report_id": report.pk, "file": report.file.name, "row_count": report.row_count}
@@ -0,0 +1,134 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+
+pytestmark = pytest.mark.urls("tests.admin.urls")
+
+CHANGELISTS = [
+    "/admin/learning/teacher/",
+    "/admin/learning/classroom/",
+    "/admin/learning/student/",
+    "/admin/learning/subject/",
+    "/admin/learning/score/",
+    "/admin/learning/termresult/",
+]
+
+
+@pytest.fixture
+def client():
+    client = Client()
+    client.force_login(
+        get_user_model().objects.create_superuser(username="admin_cl", password="pass")
+    )
+    return client
+
+
+def _add_classrooms(count, offset=0):
+    subject, _ = Subject.objects.get_or_create(name="Math", code="MATH")
+    for n in range(offset, offset + count):
+        user = get_user_model().objects.create(username=f"teacher_cl{n}")
+        teacher = Teacher.objects.create(user=user, full_name=f"Teacher {n}", email=f"teacher{n}@email.com")
+        classroom = Classroom.objects.create(name=f"Class {n}", teacher=teacher)
+        for m in range(2):
+            student = Student.objects.create(
+                full_name=f"Student {n}-{m}",
+                student_id=f"CL{n:03d}{m}",
+                birth_date=date(2010, 1, 1),
+                classroom=classroom,
+            )
+            Score.objects.create(
+                student=student, subject=subject, teacher=teacher, score=8, score_type="quiz", date=date(2024, 10, 1)
+            )
+
+
+def _query_counts(client):
+    counts = {}
+    for url in CHANGELISTS:
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        assert response.status_code == 200, url
+        counts[url] = len(queries)
+    return counts
+
+
+@pytest.mark.django_db
+def test_changelist_queries_do_not_grow_with_rows(client):
+    _add_classrooms(2)
+    few = _query_counts(client)
+    _add_classrooms(8, offset=2)
+
+    assert _query_counts(client) == few
+
+
+@pytest.mark.django_db
+def test_changelist_filters_on_autocomplete_value(client):
+    _add_classrooms(3)
+    classroom = Classroom.objects.get(name="Class 1")
+
+    response = client.get(
+        "/admin/learning/student/", {"classroom__id__exact": classroom.pk}
+    )
+
+    assert response.status_code == 200
+    assert [student.classroom_id for student in response.context["cl"].result_list] == [
+        classroom.pk,
+        classroom.pk,
+    ]
+    # Only the selected classroom is rendered in the filter, not an option per classroom
+    content = response.content.decode()
+    assert 'data-filter="classroom__id__exact"' in content
+    assert "Class 1" in content
+    assert "Class 2" not in content
+
+
+@pytest.mark.django_db
+def test_changelist_search_ignores_accents(client):
+    _add_classrooms(1)
+    Student.objects.filter(full_name="Student 0-0").update(full_name="Nguyễn Văn Đức")
+    Student.objects.get(full_name="Nguyễn Văn Đức").save()
+
+    response = client.get("/admin/learning/student/", {"q": "nguyen duc"})
+
+    assert [student.full_name for student in response.context["cl"].result_list] == [
+        "Nguyễn Văn Đức"
+    ]
+
+
+@pytest.mark.django_db
+def test_autocomplete_filter_lookup(client):
+    _add_classrooms(3)
+    classroom = Classroom.objects.get(name="Class 2")
+
+    changelist = client.get("/admin/learning/score/")
+    response = client.get(
+        "/admin/autocomplete/",
+        {"app_label": "learning", "model_name": "student", "field_name": "classroom", "term": "class 2"},
+    )
+
+    assert "learning/admin/autocomplete_filter.js" in changelist.content.decode()
+    assert response.status_code == 200
+    assert [result["id"] for result in response.json()["results"]] == [str(classroom.pk)]
+
+
+@pytest.mark.django_db
+def test_autocomplete_labels_load_relations_in_one_query(client):
+    _add_classrooms(3)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(
+            "/admin/autocomplete/",
+            {"app_label": "learning", "model_name": "score", "field_name": "student", "term": "student"},
+        )
+
+    assert "Student 0-0 - Class 0" in [result["text"] for result in response.json()["results"]]
+    assert not [query for query in queries if 'FROM "learning_classroom"' in query["sql"]]
@@ -0,0 +1,21 @@
+import pytest
+from django.core.cache import caches
+
+
+def _clear_caches():
+    for cache in caches.all():
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cached responses and revoked tokens are keyed on ids, which are reused between tests"""
+    _clear_caches()
+    yield
+    _clear_caches()
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """Keep files written to the default storage out of the working tree"""
+    settings.MEDIA_ROOT = tmp_path / "media"
@@ -0,0 +1,60 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from libs.db_pool import database_pool_stats
+
+
+@pytest.mark.django_db
+def test_database_pool_stats_without_pool():
+    connection.ensure_connection()
+
+    stats = database_pool_stats()
+
+    assert stats["default"] == {
+        "pooled": False,
+        "conn_max_age": 0,
+        "health_checks": False,
+        "connected": True,
+    }
+
+
+def test_database_pool_stats_with_pool(monkeypatch):
+    class Pool:
+        def get_stats(self):
+            return {"pool_size": 4, "pool_available": 3}
+
+    monkeypatch.setattr(
+        type(connections["default"]), "pool", Pool(), raising=False
+    )
+
+    assert database_pool_stats()["default"] == {
+        "pooled": True,
+        "pool_size": 4,
+        "pool_available": 3,
+    }
+
+
+@pytest.mark.django_db
+def test_database_health_is_restricted_to_staff():
+    from urls import database_health
+
+    user = get_user_model().objects.create_user(username="pool_user")
+    staff = get_user_model().objects.create_user(
+        username="pool_staff", is_staff=True
+    )
+    factory = APIRequestFactory()
+
+    response = database_health(factory.get("/health/db/"))
+    assert response.status_code in (401, 403)
+
+    request = factory.get("/health/db/")
+    force_authenticate(request, user=user)
+    assert database_health(request).status_code == 403
+
+    request = factory.get("/health/db/")
+    force_authenticate(request, user=staff)
+    response = database_health(request)
+    assert response.status_code == 200
+    assert "default" in response.data
@@ -0,0 +1,124 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import DEFAULT_DB_ALIAS, DatabaseError
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+
+from learning.models import Score
+from libs import db_routing
+from libs.db_routing import (
+    PRIMARY_PIN_COOKIE,
+    ReplicaRouter,
+    ReplicaRoutingMiddleware,
+    use_replica,
+    used_replica,
+)
+
+
+@pytest.fixture
+def replicas(settings, monkeypatch):
+    settings.DATABASE_REPLICAS = ["replica_1"]
+    monkeypatch.setattr(db_routing, "replica_available", lambda alias: True)
+    return ReplicaRouter()
+
+
+def test_reads_use_replica_until_write(replicas):
+    router = replicas
+    assert router.db_for_read(Score) is None
+
+    with use_replica():
+        assert router.db_for_read(Score) == "replica_1"
+        # Only the routed apps read from replicas
+        assert router.db_for_read(User) is None
+
+        assert router.db_for_write(Score) == DEFAULT_DB_ALIAS
+        assert router.db_for_read(Score) is None
+
+    assert router.db_for_read(Score) is None
+
+
+def test_used_replica(replicas, monkeypatch):
+    router = replicas
+    assert not used_replica()
+
+    with use_replica():
+        assert not used_replica()
+        router.db_for_read(Score)
+        assert used_replica()
+
+    monkeypatch.setattr(db_routing, "replica_available", lambda alias: False)
+    with use_replica():
+        # Every replica is down, the reads went to the primary
+        assert router.db_for_read(Score) is None
+        assert not used_replica()
+
+
+def test_reads_of_a_request_stick_to_one_replica(settings, monkeypatch):
+    settings.DATABASE_REPLICAS = ["replica_1", "replica_2", "replica_3"]
+    monkeypatch.setattr(db_routing, "replica_available", lambda alias: True)
+    router = ReplicaRouter()
+
+    chosen = set()
+    for _ in range(10):
+        with use_replica():
+            reads = {router.db_for_read(Score) for _ in range(20)}
+        assert len(reads) == 1
+        chosen |= reads
+    assert chosen <= set(settings.DATABASE_REPLICAS)
+
+
+def test_unreachable_replica_falls_back_to_primary(settings, monkeypatch):
+    settings.DATABASE_REPLICAS = ["replica_1"]
+    calls = []
+
+    class BrokenConnection:
+        def ensure_connection(self):
+            calls.append(1)
+            raise DatabaseError("unreachable")
+
+    monkeypatch.setattr(
+        db_routing, "connections", {"replica_1": BrokenConnection()}
+    )
+    monkeypatch.setattr(db_routing, "_unavailable_until", {})
+
+    assert db_routing.choose_replica() is None
+    # The failure is remembered instead of retried on every query
+    assert db_routing.choose_replica() is None
+    assert len(calls) == 1
+
+
+def test_middleware_routes_safe_requests_and_pins_after_write(replicas):
+    router = replicas
+    seen = []
+
+    def read_view(request):
+        seen.append(router.db_for_read(Score))
+        return HttpResponse()
+
+    def write_view(request):
+        router.db_for_write(Score)
+        seen.append(router.db_for_read(Score))
+        return HttpResponse()
+
+    factory = RequestFactory()
+    ReplicaRoutingMiddleware(read_view)(factory.get("/"))
+    response = ReplicaRoutingMiddleware(write_view)(factory.post("/"))
+    assert PRIMARY_PIN_COOKIE in response.cookies
+
+    pinned = factory.get("/")
+    pinned.COOKIES[PRIMARY_PIN_COOKIE] = "1"
+    ReplicaRoutingMiddleware(read_view)(pinned)
+
+    assert seen == ["replica_1", None, None]
+
+
+def test_middleware_keeps_routing_while_streaming(replicas):
+    router = replicas
+
+    def stream_view(request):
+        return StreamingHttpResponse(
+            router.db_for_read(Score) for _ in range(2)
+        )
+
+    response = ReplicaRoutingMiddleware(stream_view)(RequestFactory().get("/"))
+    assert list(response.streaming_content) == [b"replica_1", b"replica_1"]
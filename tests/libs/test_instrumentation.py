@@ -0,0 +1,82 @@
+import logging
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from learning.models.subject import Subject
+from learning.serializers.subject import SubjectSerializer
+
+
+@pytest.fixture
+def client():
+    user = get_user_model().objects.create_superuser(
+        username="admin_instrumentation", password="adminpass"
+    )
+    Subject.objects.create(name="Math", code="MATH")
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.mark.django_db
+def test_sampled_request_is_instrumented(client, settings, caplog):
+    settings.REQUEST_INSTRUMENTATION_SAMPLE_RATE = 1
+
+    with caplog.at_level(logging.INFO, logger="libs.instrumentation"):
+        response = client.get(reverse("subject-list"))
+
+    timing = response["Server-Timing"]
+    assert 'db;dur=' in timing
+    assert 'desc="1 queries"' in timing
+    assert "serialize;dur=" in timing
+    assert "render;dur=" in timing
+
+    (record,) = caplog.records
+    assert record.view == "subject-list"
+    assert record.action == "list"
+    assert record.queries == 1
+    assert record.bytes == len(response.content)
+    assert "view=subject-list action=list method=GET status=200" in (
+        record.getMessage()
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("detail", [False, True])
+def test_serialization_is_timed_apart_from_the_view(
+    client, settings, caplog, monkeypatch, detail
+):
+    settings.REQUEST_INSTRUMENTATION_SAMPLE_RATE = 1
+    if detail:
+        url = reverse("subject-detail", args=[Subject.objects.get().pk])
+    else:
+        url = reverse("subject-list")
+    to_representation = SubjectSerializer.to_representation
+
+    def slow_to_representation(self, instance):
+        time.sleep(0.05)
+        return to_representation(self, instance)
+
+    monkeypatch.setattr(SubjectSerializer, "to_representation", slow_to_representation)
+
+    with caplog.at_level(logging.INFO, logger="libs.instrumentation"):
+        client.get(url)
+
+    (record,) = caplog.records
+    assert record.serialize_ms >= 50
+    assert record.app_ms < record.serialize_ms
+    assert f"serialize_ms={record.serialize_ms}" in record.getMessage()
+
+
+@pytest.mark.django_db
+def test_unsampled_request_is_not_instrumented(client, settings, caplog):
+    settings.REQUEST_INSTRUMENTATION_SAMPLE_RATE = 0
+
+    with caplog.at_level(logging.INFO, logger="libs.instrumentation"):
+        response = client.get(reverse("subject-list"))
+
+    assert "Server-Timing" not in response
+    assert not caplog.records
@@ -0,0 +1,149 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from django.urls import reverse
+from kombu import Connection
+from kombu.exceptions import OperationalError
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from learning.models.subject import Subject
+from libs.metrics import ScrapeTimeCollector, metrics_view
+from student_management.celery_tasks import celery_app
+from tasks.reports import generate_report
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+
+def _sample(metric, **labels):
+    return REGISTRY.get_sample_value(metric, labels) or 0
+
+
+def _scrape():
+    response = metrics_view(RequestFactory().get("/metrics"))
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain")
+    return response.content.decode()
+
+
+@pytest.fixture
+def client():
+    user = get_user_model().objects.create_superuser(
+        username="admin_metrics", password="adminpass"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.mark.django_db
+def test_request_latency_and_queries_per_route_and_action(client):
+    labels = {"view": "subject-list", "action": "list"}
+    requests = _sample("http_request_duration_seconds_count", method="GET", status="200", **labels)
+    queries = _sample("http_request_db_queries_sum", **labels)
+
+    client.get(reverse("subject-list"))
+
+    assert _sample("http_request_duration_seconds_count", method="GET", status="200", **labels) == requests + 1
+    assert _sample("http_request_db_queries_sum", **labels) == queries + 1
+    assert (
+        'http_request_duration_seconds_bucket{action="list",le="0.005",method="GET",status="200",view="subject-list"}'
+        in _scrape()
+    )
+
+
+@pytest.mark.django_db
+def test_response_cache_hits_and_misses(client):
+    subject = Subject.objects.create(name="Math", code="MATH")
+    url = reverse("subject-statistics", args=[subject.pk])
+    hits = _sample("response_cache_requests_total", name="subject-statistics", result="hit")
+    misses = _sample("response_cache_requests_total", name="subject-statistics", result="miss")
+
+    client.get(url)
+    client.get(url)
+
+    assert _sample("response_cache_requests_total", name="subject-statistics", result="hit") == hits + 1
+    assert _sample("response_cache_requests_total", name="subject-statistics", result="miss") == misses + 1
+
+
+@pytest.mark.django_db
+def test_celery_task_duration():
+    labels = {"task": "tasks.reports.generate_report", "state": "FAILURE"}
+    count = _sample("celery_task_duration_seconds_count", **labels)
+
+    # The report does not exist, the task still runs and fails
+    generate_report.apply(args=[0])
+
+    assert _sample("celery_task_duration_seconds_count", **labels) == count + 1
+
+
+@pytest.mark.django_db
+def test_celery_queue_length(settings, monkeypatch):
+    settings.METRICS_CELERY_QUEUES = ["default"]
+    broker = Connection("memory://")
+    monkeypatch.setattr(celery_app, "connection_for_read", lambda: Connection("memory://"))
+    with broker:
+        queue = broker.SimpleQueue("default")
+        queue.put({"task": 1})
+        queue.put({"task": 2})
+
+        assert 'celery_queue_length{queue="default"} 2.0' in _scrape()
+        queue.clear()
+        queue.close()
+
+
+@pytest.mark.django_db
+def test_celery_queue_length_of_missing_queue(settings, monkeypatch):
+    settings.METRICS_CELERY_QUEUES = ["undeclared"]
+    monkeypatch.setattr(celery_app, "connection_for_read", lambda: Connection("memory://"))
+
+    # The broker refuses the passive declaration, the scrape still succeeds
+    output = _scrape()
+
+    assert "# TYPE celery_queue_length gauge" in output
+    assert 'celery_queue_length{queue="undeclared"}' not in output
+
+
+@pytest.mark.django_db
+def test_celery_queue_length_without_broker(settings, monkeypatch):
+    settings.METRICS_CELERY_QUEUES = ["default"]
+    broker = Connection("memory://")
+
+    def refuse(**kwargs):
+        raise OperationalError("broker is down")
+
+    monkeypatch.setattr(broker, "ensure_connection", refuse)
+    monkeypatch.setattr(celery_app, "connection_for_read", lambda: broker)
+
+    output = _scrape()
+
+    assert 'celery_queue_length{queue="default"}' not in output
+
+
+def test_scrape_time_collector_is_registered_without_collecting(monkeypatch):
+    collector = ScrapeTimeCollector()
+    monkeypatch.setattr(collector, "collect", lambda: pytest.fail("collected when registered"))
+
+    REGISTRY.register(collector)
+    REGISTRY.unregister(collector)
+
+
+@pytest.mark.django_db
+def test_multiprocess_directory_aggregates_every_process(tmp_path, monkeypatch):
+    observe = (
+        "from libs.metrics import CELERY_TASK_DURATION;"
+        "CELERY_TASK_DURATION.labels('tasks.example', 'SUCCESS').observe(0.5)"
+    )
+    env = {"PROMETHEUS_MULTIPROC_DIR": str(tmp_path), "DJANGO_SETTINGS_MODULE": "tests.settings"}
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", observe], cwd=ROOT_DIR, env=env, check=True)
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    output = _scrape()
+
+    assert 'celery_task_duration_seconds_count{state="SUCCESS",task="tasks.example"} 2.0' in output
+    assert 'celery_task_duration_seconds_sum{state="SUCCESS",task="tasks.example"} 1.0' in output
@@ -0,0 +1,37 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+
+
+@pytest.mark.django_db
+def test_benchmark_analytics(capsys):
+    user = get_user_model().objects.create(username="teacher_benchmark")
+    teacher = Teacher.objects.create(user=user, email="tbenchmark@email.com")
+    classroom = Classroom.objects.create(name="B1", teacher=teacher)
+    subject = Subject.objects.create(name="Math", code="MATH")
+    for i in range(3):
+        student = Student.objects.create(
+            full_name=f"Student Benchmark {i}",
+            birth_date=date(2010, 1, 1),
+            classroom=classroom,
+        )
+        for day in (1, 15):
+            Score.objects.create(
+                student=student, subject=subject, score=4 + i + day / 10,
+                score_type="quiz", date=date(2024, 9, day), teacher=teacher,
+            )
+
+    call_command("benchmark_analytics", "--repeat", "1")
+
+    output = capsys.readouterr().out
+    (row,) = [line for line in output.splitlines() if line.startswith("MATH")]
+    assert row.split()[1] == "6"
+    assert row.endswith("yes")
@@ -0,0 +1,22 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+
+# Not wrapped in a transaction: the benchmark closes connections between requests
+@pytest.mark.django_db(transaction=True)
+def test_benchmark_api_latency(capsys):
+    get_user_model().objects.create_superuser(
+        username="admin_bench", password="adminpass"
+    )
+
+    call_command(
+        "benchmark_api_latency",
+        "--requests", "5",
+        "--warmup", "1",
+        "--conn-max-age", "0", "60",
+    )
+
+    output = capsys.readouterr().out
+    assert "CONN_MAX_AGE=0" in output
+    assert "CONN_MAX_AGE=60" in output
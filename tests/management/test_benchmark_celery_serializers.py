@@ -0,0 +1,11 @@
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+def test_benchmark_celery_serializers(capsys):
+    call_command("benchmark_celery_serializers", "--rows", "10", "--iterations", "2")
+
+    output = capsys.readouterr().out
+    assert "task args: primary key         json" in output
+    assert "result: storage reference      json" in output
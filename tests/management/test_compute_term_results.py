@@ -0,0 +1,40 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+from learning.models.term import Term, TermResult
+
+
+@pytest.mark.django_db
+def test_compute_term_results(capsys):
+    user = get_user_model().objects.create(username="teacher_term_results")
+    teacher = Teacher.objects.create(user=user, email="ttermresults@email.com")
+    classroom = Classroom.objects.create(name="T2", teacher=teacher)
+    student = Student.objects.create(
+        full_name="Student Term Results",
+        birth_date=date(2010, 1, 1),
+        classroom=classroom,
+    )
+    subject = Subject.objects.create(name="Math", code="MATH")
+    Score.objects.create(
+        student=student, subject=subject, score=8,
+        score_type="final", date=date(2024, 10, 1), teacher=teacher,
+    )
+    term = Term.objects.create(
+        name="Term 1", start_date=date(2024, 9, 1), end_date=date(2024, 12, 31)
+    )
+
+    call_command("compute_term_results", term.id, "--classroom", classroom.id)
+
+    assert "Stored 2 term results" in capsys.readouterr().out
+    assert TermResult.objects.get(term=term, subject=None).weighted_average == 8
+
+    with pytest.raises(CommandError):
+        call_command("compute_term_results", 0)
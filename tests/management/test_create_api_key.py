@@ -0,0 +1,22 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+
+from learning.models.api_key import ApiKey, api_key_digest
+
+
+@pytest.mark.django_db
+def test_create_api_key(capsys):
+    user = get_user_model().objects.create(username="sis")
+
+    call_command("create_api_key", "sis", "--name", "SIS sync", "--expires-in-days", "30")
+
+    key = capsys.readouterr().out.strip()
+    api_key = ApiKey.objects.get()
+    assert (api_key.user, api_key.name) == (user, "SIS sync")
+    assert key.startswith(f"{api_key.prefix}.")
+    assert api_key.digest == api_key_digest(key)
+    assert api_key.expires_at is not None
+
+    with pytest.raises(CommandError):
+        call_command("create_api_key", "nobody", "--name", "SIS")
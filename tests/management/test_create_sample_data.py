@@ -0,0 +1,54 @@
+import pytest
+from django.core.management import CommandError, call_command
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.services import find_score_aggregate_drift
+
+SCALE_ARGS = [
+    "--scale",
+    "--schools", "2",
+    "--classrooms", "3",
+    "--students", "4",
+    "--scores", "15",
+]
+
+
+def _scores():
+    return list(
+        Score.objects.order_by(
+            "student__student_id", "subject__code", "score_type", "date"
+        ).values_list(
+            "student__student_id", "subject__code", "score_type", "date", "score"
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_create_sample_data_scale():
+    call_command("create_sample_data", *SCALE_ARGS, "--seed", "1")
+
+    assert Classroom.objects.count() == 6
+    assert Student.objects.count() == 24
+    assert Score.objects.count() == 24 * 15
+    assert not any(find_score_aggregate_drift().values())
+
+
+@pytest.mark.django_db
+def test_create_sample_data_scale_is_reproducible():
+    call_command("create_sample_data", *SCALE_ARGS, "--seed", "7")
+    first = _scores()
+
+    call_command("create_sample_data", "--clear", *SCALE_ARGS, "--seed", "7")
+    assert _scores() == first
+
+    call_command("create_sample_data", "--clear", *SCALE_ARGS, "--seed", "8")
+    assert _scores() != first
+
+
+@pytest.mark.django_db
+def test_create_sample_data_scale_requires_clear():
+    call_command("create_sample_data", *SCALE_ARGS)
+    with pytest.raises(CommandError):
+        call_command("create_sample_data", *SCALE_ARGS)
@@ -0,0 +1,58 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+
+
+@pytest.mark.django_db
+def test_explain_queries_compare_restores_indexes(capsys):
+    user = get_user_model().objects.create(username="teacher_explain")
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Explain", email="texplain@email.com"
+    )
+    classroom = Classroom.objects.create(name="E1", teacher=teacher)
+    student = Student.objects.create(
+        full_name="Student Explain",
+        birth_date=date(2010, 1, 1),
+        classroom=classroom,
+    )
+    subject = Subject.objects.create(name="Math", code="MATH")
+    Score.objects.create(
+        student=student,
+        subject=subject,
+        teacher=teacher,
+        score=8,
+        score_type="quiz",
+        date=date(2025, 1, 1),
+    )
+
+    call_command("explain_queries", "--compare", "--i-know-this-locks")
+
+    output = capsys.readouterr().out
+    assert "Without access pattern indexes" in output
+    assert "classroom-stats (date range)" in output
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(
+            cursor, Score._meta.db_table
+        )
+    assert "score_date_id_idx" in constraints
+
+
+@pytest.mark.django_db
+def test_explain_queries_compare_requires_acknowledging_the_locks():
+    with pytest.raises(CommandError, match="--i-know-this-locks"):
+        call_command("explain_queries", "--compare")
+
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(
+            cursor, Score._meta.db_table
+        )
+    assert "score_date_id_idx" in constraints
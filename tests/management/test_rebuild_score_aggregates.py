@@ -0,0 +1,44 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.score_aggregate import ScoreAggregate
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+
+
+@pytest.mark.django_db
+def test_rebuild_and_verify_score_aggregates():
+    user = get_user_model().objects.create(username="teacher_rebuild")
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Rebuild", email="trebuild@email.com"
+    )
+    classroom = Classroom.objects.create(name="R2", teacher=teacher)
+    student = Student.objects.create(
+        full_name="Student Rebuild",
+        birth_date=date(2010, 1, 1),
+        classroom=classroom,
+    )
+    subject = Subject.objects.create(name="Math", code="MATH")
+    # bulk_create bypasses the signals that maintain the rollup
+    Score.objects.bulk_create(
+        Score(
+            student=student, subject=subject, score=value,
+            date=date(2024, 9, day), teacher=teacher,
+        )
+        for day, value in ((1, 5), (2, 9))
+    )
+
+    with pytest.raises(CommandError):
+        call_command("rebuild_score_aggregates", verify=True)
+
+    call_command("rebuild_score_aggregates")
+    aggregate = ScoreAggregate.objects.get()
+    assert (aggregate.count, aggregate.total) == (2, 14)
+
+    call_command("rebuild_score_aggregates", verify=True)
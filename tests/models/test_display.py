@@ -0,0 +1,65 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from learning.models.classroom import Classroom
+from learning.models.display import for_display
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+from tests.utils import LazyLoadError, assert_renders_without_queries
+
+
+@pytest.fixture
+def score():
+    user = get_user_model().objects.create(username="teacher_display")
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher D", email="td@email.com"
+    )
+    classroom = Classroom.objects.create(name="D1", teacher=teacher)
+    student = Student.objects.create(
+        full_name="Student D", birth_date=date(2010, 1, 1), classroom=classroom
+    )
+    subject = Subject.objects.create(name="History", code="HIS")
+    return Score.objects.create(
+        student=student,
+        subject=subject,
+        score=7,
+        score_type="quiz",
+        date=date(2024, 10, 1),
+        teacher=teacher,
+    )
+
+
+@pytest.mark.django_db
+def test_str_falls_back_to_own_columns_without_a_query(score):
+    assert assert_renders_without_queries(Classroom.objects.all()) == ["D1"]
+    assert assert_renders_without_queries(Student.objects.all()) == ["Student D"]
+    assert assert_renders_without_queries(Score.objects.all()) == [
+        f"{score.student_id} - {score.subject_id}: 7.00"
+    ]
+
+
+@pytest.mark.django_db
+def test_str_shows_loaded_relations(score):
+    assert assert_renders_without_queries(for_display(Classroom.objects.all())) == [
+        "D1 - Teacher D"
+    ]
+    assert assert_renders_without_queries(for_display(Student.objects.all())) == [
+        "Student D - D1"
+    ]
+    assert assert_renders_without_queries(for_display(Score.objects.all())) == [
+        "Student D - History: 7.00"
+    ]
+    prefetched = Student.objects.prefetch_related("classroom")
+    assert assert_renders_without_queries(prefetched) == ["Student D - D1"]
+
+
+@pytest.mark.django_db
+def test_assert_renders_without_queries_reports_lazy_loads(score):
+    with pytest.raises(LazyLoadError):
+        assert_renders_without_queries(
+            Score.objects.all(), render=lambda score: score.student.full_name
+        )
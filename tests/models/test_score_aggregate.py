@@ -0,0 +1,58 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.score_aggregate import ScoreAggregate
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+
+
+@pytest.mark.django_db
+def test_score_aggregate_follows_score_changes():
+    user = get_user_model().objects.create(username="teacher_rollup")
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Rollup", email="trollup@email.com"
+    )
+    classroom = Classroom.objects.create(name="R1", teacher=teacher)
+    student = Student.objects.create(
+        full_name="Student Rollup",
+        birth_date=date(2010, 1, 1),
+        classroom=classroom,
+    )
+    subject = Subject.objects.create(name="Math", code="MATH")
+
+    def create(value, day):
+        return Score.objects.create(
+            student=student, subject=subject, score=value,
+            score_type="quiz", date=date(2024, 9, day), teacher=teacher,
+        )
+
+    first = create(6, 1)
+    create(8, 2)
+    aggregate = ScoreAggregate.objects.get()
+    assert aggregate.count == 2
+    assert aggregate.total == 14
+    assert aggregate.total_squares == 100
+    assert (aggregate.min_score, aggregate.max_score) == (6, 8)
+
+    first.score = 9
+    first.save()
+    aggregate.refresh_from_db()
+    assert (aggregate.total, aggregate.min_score, aggregate.max_score) == (
+        17, 8, 9
+    )
+
+    first.score_type = "final"
+    first.save()
+    assert sorted(
+        ScoreAggregate.objects.values_list("score_type", "count")
+    ) == [("final", 1), ("quiz", 1)]
+
+    first.delete()
+    assert list(
+        ScoreAggregate.objects.values_list("score_type", "total")
+    ) == [("quiz", 8)]
@@ -0,0 +1,84 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+from learning.models.classroom import Classroom
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+from learning.search import normalize_search_text, search_terms
+
+
+def test_normalize_search_text():
+    assert normalize_search_text("Nguyễn  Văn Đức", None, "HS-01") == (
+        "nguyen van duc hs-01"
+    )
+    assert search_terms("Nguyen nguyễn  VAN") == ["nguyen", "van"]
+
+
+@pytest.fixture
+def classroom():
+    user = get_user_model().objects.create(username="teacher_search")
+    teacher = Teacher.objects.create(
+        user=user, full_name="Trần Thị Hương", email="tsearch@email.com"
+    )
+    return Classroom.objects.create(name="S1", teacher=teacher)
+
+
+@pytest.mark.django_db
+def test_search_text_follows_saves_and_bulk_operations(classroom):
+    student = Student.objects.create(
+        full_name="Lê Thị Ánh",
+        birth_date=date(2010, 1, 1),
+        classroom=classroom,
+        student_id="HS001",
+    )
+    assert student.search_text == "le thi anh hs001"
+
+    student.full_name = "Lê Thị Ánh Dương"
+    student.save(update_fields=["full_name"])
+    student.refresh_from_db()
+    assert student.search_text == "le thi anh duong hs001"
+
+    [subject] = Subject.objects.bulk_create([Subject(name="Ngữ Văn", code="LIT")])
+    assert Subject.objects.get(pk=subject.pk).search_text == "ngu van lit"
+
+    subject.name = "Tiếng Việt"
+    Subject.objects.bulk_update([subject], ["name"])
+    assert Subject.objects.get(pk=subject.pk).search_text == "tieng viet lit"
+    assert classroom.teacher.search_text == "tran thi huong tsearch@email.com"
+
+
+@pytest.mark.django_db
+def test_search_and_ranked(classroom):
+    for full_name in ["Phạm Văn Minh", "Nguyễn Minh Anh", "Minh Nguyễn", "Hoàng An"]:
+        Student.objects.create(
+            full_name=full_name, birth_date=date(2010, 1, 1), classroom=classroom
+        )
+
+    assert list(
+        Student.objects.search("nguyen MINH").values_list("full_name", flat=True)
+    ) == ["Minh Nguyễn", "Nguyễn Minh Anh"]
+    ranked = Student.objects.search("minh").ranked("minh")
+    assert [student.full_name for student in ranked] == [
+        "Minh Nguyễn",
+        "Nguyễn Minh Anh",
+        "Phạm Văn Minh",
+    ]
+    assert Student.objects.search("  ").count() == 4
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("model", [Classroom, Student, Subject, Teacher])
+def test_search_text_is_indexed(model):
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(
+            cursor, model._meta.db_table
+        )
+
+    name = f"learning_{model._meta.model_name}_search_trgm"
+    assert constraints[name]["columns"] == ["search_text"]
+    if connection.vendor == "postgresql":
+        assert constraints[name]["type"] == "gin"
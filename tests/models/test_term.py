@@ -0,0 +1,35 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError
+
+from learning.models.classroom import Classroom
+from learning.models.student import Student
+from learning.models.teacher import Teacher
+from learning.models.term import Term
+
+
+@pytest.mark.django_db
+def test_create_term():
+    term = Term.objects.create(
+        name="Term 1", start_date=date(2024, 9, 1), end_date=date(2024, 12, 31)
+    )
+    assert str(term) == "Term 1 (2024-09-01 - 2024-12-31)"
+
+
+@pytest.mark.django_db
+def test_one_gpa_per_student_and_term():
+    user = get_user_model().objects.create(username="teacher_term")
+    teacher = Teacher.objects.create(user=user, email="tterm@email.com")
+    student = Student.objects.create(
+        full_name="Student Term",
+        birth_date=date(2010, 1, 1),
+        classroom=Classroom.objects.create(name="T1", teacher=teacher),
+    )
+    term = Term.objects.create(
+        name="Term 1", start_date=date(2024, 9, 1), end_date=date(2024, 12, 31)
+    )
+    term.results.create(student=student, weighted_average=7, computed_at="2024-12-31T00:00:00Z")
+    with pytest.raises(IntegrityError):
+        term.results.create(student=student, weighted_average=8, computed_at="2024-12-31T00:00:00Z")
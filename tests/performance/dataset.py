@@ -0,0 +1,86 @@
+"""
+Bulk seeding of a growing dataset for the query budget suite.
+
+Every call to ``grow`` adds rows everywhere at once: a new classroom and
+subject, new students in every classroom and a new score for every
+student/subject pair, so every endpoint sees more rows at each size.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+
+from learning.models import Classroom, Score, Student, Subject, Teacher
+from learning.services import rebuild_score_aggregates
+
+SCORE_TYPES = [score_type for score_type, _ in Score.SCORE_TYPES]
+
+
+@dataclass
+class Dataset:
+    teacher: Teacher
+    classrooms: list = field(default_factory=list)
+    subjects: list = field(default_factory=list)
+    students: list = field(default_factory=list)
+    steps: int = 0
+
+    @property
+    def user(self):
+        return self.teacher.user
+
+
+def create_dataset():
+    user = get_user_model().objects.create_user(
+        username="perf_teacher", password="pass"
+    )
+    teacher = Teacher.objects.create(
+        user=user, full_name="Perf Teacher", email="perf@email.com"
+    )
+    return Dataset(teacher=teacher)
+
+
+def grow(dataset, students_per_classroom):
+    step = dataset.steps
+    dataset.steps += 1
+
+    dataset.classrooms.append(
+        Classroom.objects.create(
+            name=f"PERF{step}",
+            teacher=dataset.teacher,
+            grade_level="10",
+            school_year="2024-2025",
+        )
+    )
+    dataset.subjects.append(
+        Subject.objects.create(name=f"Perf Subject {step}", code=f"PS{step}")
+    )
+
+    students = Student.objects.bulk_create(
+        Student(
+            full_name=f"Perf Student {step}-{classroom.pk}-{i}",
+            birth_date=date(2010, 1, 1),
+            gender="MF"[i % 2],
+            classroom=classroom,
+            student_id=f"P{step}-{classroom.pk}-{i}",
+        )
+        for classroom in dataset.classrooms
+        for i in range(students_per_classroom)
+    )
+    dataset.students.extend(students)
+
+    score_date = date(2024, 9, 1) + timedelta(days=step)
+    Score.objects.bulk_create(
+        Score(
+            student=student,
+            subject=subject,
+            score=(student.pk + subject.pk) % 11,
+            score_type=SCORE_TYPES[step % len(SCORE_TYPES)],
+            date=score_date,
+            teacher=dataset.teacher,
+        )
+        for student in dataset.students
+        for subject in dataset.subjects
+    )
+    rebuild_score_aggregates()
+    return dataset
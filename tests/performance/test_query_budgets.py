@@ -0,0 +1,197 @@
+"""
+Query budget regression suite.
+
+Each endpoint is called against a dataset that grows between calls. The
+number of queries must not change as the data grows (no N+1) and must stay
+within the budget checked in to ``query_budgets.json``. Latencies are
+recorded as test properties, e.g. ``pytest --junitxml=report.xml``.
+The response cache is cleared before each call so budgets cover the
+uncached path.
+
+Set ``QUERY_BUDGET_SCALE`` to seed larger datasets for a benchmark run.
+"""
+
+import json
+import os
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from learning.models import Report
+from learning.urls import router
+from tasks.reports import generate_report
+
+from .dataset import create_dataset, grow
+
+BUDGETS = json.loads(
+    (Path(__file__).parent / "query_budgets.json").read_text()
+)
+SCALE = int(os.environ.get("QUERY_BUDGET_SCALE", "1"))
+SIZES = [2 * SCALE, 5 * SCALE, 10 * SCALE]
+
+
+def _bulk_scores(dataset):
+    score_date = date(2025, 1, 1) + timedelta(days=dataset.steps)
+    return [
+        {
+            "student": student.pk,
+            "subject": dataset.subjects[0].pk,
+            "score": "7.50",
+            "score_type": "quiz",
+            "date": score_date.isoformat(),
+            "teacher": dataset.teacher.pk,
+        }
+        for student in dataset.students
+    ]
+
+
+def _bulk_students(dataset):
+    return [
+        {
+            "full_name": f"Enrolled Student {dataset.steps}-{classroom.pk}",
+            "birth_date": "2010-01-01",
+            "classroom": classroom.pk,
+        }
+        for classroom in dataset.classrooms
+    ]
+
+
+def _get(name, target=None, **params):
+    def request(dataset):
+        args = [target(dataset).pk] if target else []
+        return "get", reverse(name, args=args), params
+
+    return request
+
+
+def _report(dataset):
+    """A finished school-wide report over the current dataset"""
+    report = Report.objects.create(kind="school", requested_by=dataset.user)
+    generate_report(report.pk)
+    return report
+
+
+def _first_classroom(dataset):
+    return dataset.classrooms[0]
+
+
+def _first_student(dataset):
+    return dataset.students[0]
+
+
+def _first_subject(dataset):
+    return dataset.subjects[0]
+
+
+# How to call each route, keyed by the route name used in the budgets file.
+ENDPOINTS = {
+    "api-root": _get("api-root"),
+    "teacher-list": _get("teacher-list"),
+    "teacher-detail": _get("teacher-detail", lambda d: d.teacher),
+    "teacher-classrooms": _get("teacher-classrooms", lambda d: d.teacher),
+    "teacher-students": _get("teacher-students", lambda d: d.teacher),
+    "teacher-search": _get("teacher-search", search="perf"),
+    "classroom-list": _get("classroom-list"),
+    "classroom-detail": _get("classroom-detail", _first_classroom),
+    "classroom-students": _get("classroom-students", _first_classroom),
+    "classroom-stats": _get("classroom-stats", _first_classroom),
+    "classroom-analytics": _get("classroom-analytics", _first_classroom),
+    "classroom-gpa": _get("classroom-gpa", _first_classroom),
+    "classroom-export-students": _get(
+        "classroom-export-students", _first_classroom
+    ),
+    "classroom-export": _get("classroom-export"),
+    "classroom-search": _get("classroom-search", search="perf"),
+    "student-list": _get("student-list"),
+    "student-detail": _get("student-detail", _first_student),
+    "student-scores": _get("student-scores", _first_student),
+    "student-average-by-subject": _get(
+        "student-average-by-subject", _first_student
+    ),
+    "student-gpa": _get("student-gpa", _first_student),
+    "student-search": _get("student-search", search="perf student"),
+    "student-bulk-enroll": lambda d: (
+        "post",
+        reverse("student-bulk-enroll"),
+        _bulk_students(d),
+    ),
+    "subject-list": _get("subject-list"),
+    "subject-detail": _get("subject-detail", _first_subject),
+    "subject-scores": _get("subject-scores", _first_subject),
+    "subject-statistics": _get("subject-statistics", _first_subject),
+    "subject-analytics": _get("subject-analytics", _first_subject),
+    "subject-search": _get("subject-search", search="perf"),
+    "score-list": _get("score-list"),
+    "score-detail": _get("score-detail", lambda d: d.students[0].scores.first()),
+    "score-by-classroom": lambda d: (
+        "get",
+        reverse("score-by-classroom"),
+        {"classroom_id": d.classrooms[0].pk},
+    ),
+    "score-bulk-create": lambda d: (
+        "post",
+        reverse("score-bulk-create"),
+        _bulk_scores(d),
+    ),
+    "report-list": _get("report-list"),
+    "report-detail": _get("report-detail", _report),
+    "report-status": _get("report-status", _report),
+    "report-download": _get("report-download", _report),
+}
+
+
+def _params():
+    for name, budget in sorted(BUDGETS.items()):
+        marks = []
+        if budget.get("known_issue"):
+            marks.append(
+                pytest.mark.xfail(reason=budget["known_issue"], strict=True)
+            )
+        yield pytest.param(name, budget, id=name, marks=marks)
+
+
+def test_every_route_has_a_budget():
+    routes = {url.name for url in router.urls}
+    assert routes == set(BUDGETS) == set(ENDPOINTS)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name, budget", _params())
+def test_query_budget(name, budget, record_property):
+    dataset = create_dataset()
+    client = APIClient()
+    client.force_authenticate(user=dataset.user)
+
+    query_counts = []
+    for size in SIZES:
+        grow(dataset, students_per_classroom=size)
+        method, url, data = ENDPOINTS[name](dataset)
+        kwargs = {"format": "json"} if method == "post" else {}
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = getattr(client, method)(url, data, **kwargs)
+            if response.streaming:
+                b"".join(response.streaming_content)
+            elapsed = time.perf_counter() - started
+
+        assert response.status_code < 300, response.content
+        query_counts.append(len(queries))
+        record_property(f"queries_{size}", len(queries))
+        record_property(f"latency_ms_{size}", round(elapsed * 1000, 2))
+
+    assert len(set(query_counts)) == 1, (
+        f"{name} query count grows with the data: {query_counts}"
+    )
+    assert query_counts[0] <= budget["max_queries"], (
+        f"{name} issued {query_counts[0]} queries, "
+        f"budget is {budget['max_queries']}"
+    )
@@ -17,3 +17,23 @@ def test_classroom_serializer():
         serializer.data["teacher"] == teacher.id
         or serializer.data["teacher"]["id"] == teacher.id
     )
+
+
+@pytest.mark.django_db
+def test_classroom_serializer_uses_annotated_counts(django_assert_num_queries):
+    user = get_user_model().objects.create(username="teacher5")
+    teacher = Teacher.objects.create(user=user, email="t5@email.com")
+    Classroom.objects.create(name="B3", teacher=teacher)
+    Classroom.objects.create(name="B4", teacher=teacher)
+
+    classroom = Classroom.objects.get(name="B3")
+    with django_assert_num_queries(4):
+        data = ClassroomSerializer(classroom).data
+    assert data["students_count"] == 0
+    assert data["teacher"]["classrooms_count"] == 2
+
+    classrooms = Classroom.objects.with_students_count().with_teacher()
+    with django_assert_num_queries(2):
+        data = ClassroomSerializer(classrooms, many=True).data
+    assert [row["students_count"] for row in data] == [0, 0]
+    assert data[0]["teacher"]["classrooms_count"] == 2
@@ -21,3 +21,19 @@ def test_student_list_serializer():
     )
     serializer = StudentListSerializer(student)
     assert serializer.data["full_name"] == "Student 3"
+
+
+@pytest.mark.django_db
+def test_student_serializer_classroom_choices_load_teachers_once(django_assert_num_queries):
+    for n in range(3):
+        user = get_user_model().objects.create(username=f"teacher_choice{n}")
+        teacher = Teacher.objects.create(
+            user=user, full_name=f"Teacher {n}", email=f"tc{n}@email.com"
+        )
+        Classroom.objects.create(name=f"Choice {n}", teacher=teacher)
+
+    field = StudentListSerializer().fields["classroom"]
+    with django_assert_num_queries(1):
+        labels = list(field.get_choices().values())
+
+    assert labels == ["Choice 0 - Teacher 0", "Choice 1 - Teacher 1", "Choice 2 - Teacher 2"]
@@ -0,0 +1,162 @@
+from datetime import date
+
+import numpy as np
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from learning.analytics import (
+    classroom_analytics,
+    competition_ranks,
+    group_by,
+    load_score_arrays,
+    percentile_ranks,
+    subject_analytics,
+    trend_slopes,
+    z_scores,
+)
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+
+
+@pytest.fixture
+def classroom():
+    user = get_user_model().objects.create(username="teacher_analytics")
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Analytics", email="tanalytics@email.com"
+    )
+    classroom = Classroom.objects.create(name="A1", teacher=teacher)
+    math = Subject.objects.create(name="Math", code="MATH")
+    physics = Subject.objects.create(name="Physics", code="PHY")
+    # Math scores on 2024-09-01 and 2024-10-01, one physics score
+    for i, (first, second, physics_score) in enumerate(
+        [(6, 8, 9), (8, 8, 7), (5, 4, 7)]
+    ):
+        student = Student.objects.create(
+            full_name=f"Student Analytics {i}",
+            birth_date=date(2010, 1, 1),
+            classroom=classroom,
+        )
+        for score, score_date in ((first, date(2024, 9, 1)), (second, date(2024, 10, 1))):
+            Score.objects.create(
+                student=student, subject=math, score=score,
+                score_type="quiz", date=score_date, teacher=teacher,
+            )
+        Score.objects.create(
+            student=student, subject=physics, score=physics_score,
+            score_type="final", date=date(2024, 12, 1), teacher=teacher,
+        )
+    return classroom
+
+
+def test_percentile_and_competition_ranks():
+    values = np.array([7.0, 9.0, 7.0, 5.0])
+
+    assert competition_ranks(values).tolist() == [2, 1, 2, 4]
+    assert percentile_ranks(values).tolist() == [50.0, 87.5, 50.0, 12.5]
+
+
+def test_z_scores():
+    assert z_scores(np.array([4.0, 6.0])).tolist() == [-1.0, 1.0]
+    assert z_scores(np.array([5.0, 5.0])).tolist() == [0.0, 0.0]
+
+
+def test_group_by_and_trend_slopes():
+    students = np.array([2, 1, 2, 1, 3])
+    (keys,), inverse = group_by(students)
+    days = np.array([0, 0, 10, 10, 5])
+    scores = np.array([5.0, 8.0, 7.0, 6.0, 9.0])
+
+    slopes = trend_slopes(inverse, days, scores, len(keys))
+
+    assert keys.tolist() == [1, 2, 3]
+    assert slopes[:2].tolist() == pytest.approx([-0.2, 0.2])
+    # A single day has no trend
+    assert np.isnan(slopes[2])
+
+
+@pytest.mark.django_db
+def test_load_score_arrays(classroom):
+    with CaptureQueriesContext(connection) as queries:
+        arrays = load_score_arrays(Score.objects.filter(score_type="quiz"))
+
+    assert len(queries) == 1
+    assert len(arrays) == 6
+    assert set(arrays["classroom"]) == {classroom.pk}
+    assert sorted(arrays["score"]) == [4.0, 5.0, 6.0, 8.0, 8.0, 8.0]
+    assert set(arrays["day"]) == {
+        (date(2024, 9, 1) - date(1970, 1, 1)).days,
+        (date(2024, 10, 1) - date(1970, 1, 1)).days,
+    }
+    assert len(load_score_arrays(Score.objects.filter(pk__in=[]))) == 0
+
+
+@pytest.mark.django_db
+def test_classroom_analytics(classroom):
+    with CaptureQueriesContext(connection) as queries:
+        analytics = classroom_analytics(classroom)
+
+    assert len(queries) == 3
+    assert analytics["total_scores"] == 9
+    ranking = [(row["full_name"], row["rank"], row["average"]) for row in analytics["students"]]
+    assert ranking == [
+        ("Student Analytics 0", 1, 7.67),
+        ("Student Analytics 1", 1, 7.67),
+        ("Student Analytics 2", 3, 5.33),
+    ]
+    math = analytics["subjects"][0]
+    assert (math["subject_name"], math["count"], math["average"]) == ("Math", 6, 6.5)
+    assert math["percentiles"]["p50"] == 7.0
+    assert [bin_["count"] for bin_ in math["histogram"]] == [0, 0, 0, 0, 1, 1, 1, 0, 3, 0]
+    trends = {row["full_name"]: row["trend"] for row in math["students"]}
+    assert trends == {
+        "Student Analytics 0": 2.0,
+        "Student Analytics 1": 0.0,
+        "Student Analytics 2": -1.0,
+    }
+    physics = analytics["subjects"][1]
+    assert [row["rank"] for row in physics["students"]] == [1, 2, 2]
+    assert physics["students"][0]["trend"] is None
+
+
+@pytest.mark.django_db
+def test_classroom_analytics_without_scores(classroom):
+    analytics = classroom_analytics(classroom, date_from=date(2030, 1, 1))
+
+    assert analytics == {
+        "classroom_id": classroom.pk,
+        "total_scores": 0,
+        "students": [],
+        "subjects": [],
+    }
+
+
+@pytest.mark.django_db
+def test_subject_analytics(classroom):
+    math = Subject.objects.get(code="MATH")
+
+    with CaptureQueriesContext(connection) as queries:
+        analytics = subject_analytics(math, math.scores.all(), limit=2)
+
+    assert len(queries) == 3
+    assert (analytics["count"], analytics["average"], analytics["std_dev"]) == (6, 6.5, 1.61)
+    assert analytics["trend"] == 0.33
+    assert analytics["classrooms"] == [{
+        "classroom_id": classroom.pk,
+        "classroom_name": "A1",
+        "count": 6,
+        "average": 6.5,
+        "rank": 1,
+        "percentile": 50.0,
+        "z_score": 0.0,
+        "student_count": 3,
+    }]
+    assert [row["full_name"] for row in analytics["students"]] == [
+        "Student Analytics 1",
+        "Student Analytics 0",
+    ]
+    assert analytics["students"][0]["z_score"] == 1.02
@@ -0,0 +1,130 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from learning.models.classroom import Classroom
+from learning.models.student import Student
+from learning.models.teacher import Teacher
+from learning.services.enrollment import (
+    allocate_student_ids,
+    enroll_students,
+    student_id_prefix,
+)
+
+
+@pytest.fixture
+def classroom():
+    user = get_user_model().objects.create(username="teacher_enroll")
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Enroll", email="tenroll@email.com"
+    )
+    return Classroom.objects.create(
+        name="E1", teacher=teacher, school_year="2024-2025"
+    )
+
+
+def test_student_id_prefix():
+    assert student_id_prefix("2024-2025") == "2024"
+    assert student_id_prefix(None) == str(date.today().year)
+
+
+@pytest.mark.django_db
+def test_allocate_student_ids_continues_each_sequence(
+    classroom, django_assert_num_queries
+):
+    for student_id in ["202400007", "2024-manual", "202500002"]:
+        Student.objects.create(
+            full_name=student_id,
+            birth_date=date(2010, 1, 1),
+            classroom=classroom,
+            student_id=student_id,
+        )
+
+    with django_assert_num_queries(1):
+        student_ids = allocate_student_ids(
+            ["2024", "2023", "2024"], taken={"202300004"}
+        )
+
+    assert student_ids == ["202400008", "202300005", "202400009"]
+
+
+@pytest.mark.django_db
+def test_enroll_students_creates_and_reports_errors(
+    classroom, django_assert_max_num_queries
+):
+    Student.objects.create(
+        full_name="Existing",
+        birth_date=date(2010, 1, 1),
+        classroom=classroom,
+        student_id="202400001",
+    )
+    row = {"full_name": "New", "birth_date": "2010-02-02", "classroom": classroom.pk}
+    rows = [
+        row,
+        {**row, "student_id": "X-1"},
+        {**row, "birth_date": "not a date"},
+        {**row, "classroom": 0},
+        {**row, "student_id": "X-1"},
+        {**row, "student_id": "202400001"},
+        row,
+    ]
+
+    with django_assert_max_num_queries(7):
+        result = enroll_students(rows, batch_size=2)
+
+    assert result.created == 3
+    assert [(s["index"], s["student_id"]) for s in result.students] == [
+        (0, "202400002"),
+        (1, "X-1"),
+        (6, "202400003"),
+    ]
+    assert [error["index"] for error in result.errors] == [2, 3, 4, 5]
+    assert "birth_date" in result.errors[0]["errors"]
+    assert "classroom" in result.errors[1]["errors"]
+    assert result.errors[2]["errors"] == {"student_id": ["Duplicate of row 1."]}
+    assert "student_id" in result.errors[3]["errors"]
+    assert Student.objects.filter(classroom=classroom).count() == 4
+
+
+@pytest.mark.django_db
+def test_enroll_students_reports_exhausted_student_ids(classroom):
+    Student.objects.create(
+        full_name="Last",
+        birth_date=date(2010, 1, 1),
+        classroom=classroom,
+        student_id="202499998",
+    )
+    row = {"full_name": "New", "birth_date": "2010-02-02", "classroom": classroom.pk}
+
+    assert allocate_student_ids(["2024", "2024", "2023"]) == [
+        "202499999",
+        None,
+        "202300001",
+    ]
+    result = enroll_students([row, row, {**row, "student_id": "X-2"}])
+
+    assert [(s["index"], s["student_id"]) for s in result.students] == [
+        (0, "202499999"),
+        (2, "X-2"),
+    ]
+    assert result.errors == [
+        {
+            "index": 1,
+            "errors": {
+                "student_id": [
+                    "No student id left for the school year starting in 2024."
+                ]
+            },
+        }
+    ]
+
+
+@pytest.mark.django_db
+def test_enroll_students_restricted_to_classrooms(classroom):
+    row = {"full_name": "New", "birth_date": "2010-02-02", "classroom": classroom.pk}
+
+    result = enroll_students([row], classrooms=Classroom.objects.none())
+
+    assert result.created == 0
+    assert "classroom" in result.errors[0]["errors"]
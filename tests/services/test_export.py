@@ -0,0 +1,57 @@
+import csv
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+from learning.services.export import (
+    export_students_queryset,
+    iter_students_csv,
+)
+
+
+@pytest.mark.django_db
+def test_iter_students_csv():
+    user = get_user_model().objects.create(username="teacher_export")
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Export", email="texport@email.com"
+    )
+    subject = Subject.objects.create(name="Math", code="MATH")
+    classrooms = []
+    for name in ("E1", "E2"):
+        classroom = Classroom.objects.create(name=name, teacher=teacher)
+        classrooms.append(classroom)
+        student = Student.objects.create(
+            full_name=f"Student {name}",
+            birth_date=date(2010, 1, 1),
+            gender="F",
+            classroom=classroom,
+        )
+        for day, value in ((1, 7), (2, 8)):
+            Score.objects.create(
+                student=student, subject=subject, score=value,
+                date=date(2024, 9, day), teacher=teacher,
+            )
+    Student.objects.create(
+        full_name="Student No Score",
+        birth_date=date(2010, 1, 1),
+        classroom=classrooms[0],
+    )
+
+    students = export_students_queryset(classrooms)
+    rows = list(csv.reader(iter_students_csv(students, include_classroom=True)))
+
+    assert rows[0][0] == "Classroom"
+    assert [row[:2] for row in rows[1:]] == [
+        ["E1", "Student E1"],
+        ["E1", "Student No Score"],
+        ["E2", "Student E2"],
+    ]
+    assert rows[1][4] == "Female"
+    assert rows[1][-1] == "7.50"
+    assert rows[2][-1] == "N/A"
@@ -0,0 +1,154 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+from learning.models.term import Term, TermResult
+from learning.services.grades import (
+    classroom_grades,
+    score_type_weights,
+    store_term_results,
+    student_grades,
+)
+
+
+@pytest.fixture(autouse=True)
+def weights(settings):
+    settings.SCORE_TYPE_WEIGHTS = {"quiz": 1, "midterm": 2, "final": 3, "participation": 0}
+
+
+@pytest.fixture
+def classroom():
+    user = get_user_model().objects.create(username="teacher_grades")
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Grades", email="tgrades@email.com"
+    )
+    classroom = Classroom.objects.create(name="G1", teacher=teacher)
+    math = Subject.objects.create(name="Math", code="MATH")
+    physics = Subject.objects.create(name="Physics", code="PHY")
+    scores = {
+        # quiz, final, participation (ignored) in math; one physics midterm
+        "Student Grades A": ((4, 8, 1), 9),
+        "Student Grades B": ((10, 6, 10), 7),
+    }
+    for full_name, ((quiz, final, participation), midterm) in scores.items():
+        student = Student.objects.create(
+            full_name=full_name, birth_date=date(2010, 1, 1), classroom=classroom
+        )
+        for score_type, score, score_date in (
+            ("quiz", quiz, date(2024, 9, 1)),
+            ("final", final, date(2024, 12, 1)),
+            ("participation", participation, date(2024, 10, 1)),
+        ):
+            Score.objects.create(
+                student=student, subject=math, score=score,
+                score_type=score_type, date=score_date, teacher=teacher,
+            )
+        Score.objects.create(
+            student=student, subject=physics, score=midterm,
+            score_type="midterm", date=date(2025, 3, 1), teacher=teacher,
+        )
+    return classroom
+
+
+def test_score_type_weights():
+    assert score_type_weights() == {
+        "quiz": 1,
+        "midterm": 2,
+        "final": 3,
+        "assignment": 1,
+        "participation": 0,
+    }
+
+
+@pytest.mark.django_db
+def test_student_grades(classroom):
+    student = classroom.students.get(full_name="Student Grades A")
+
+    grades = student_grades(student)
+
+    # math: (4 * 1 + 8 * 3) / 4 = 7, physics 9, GPA (7 + 9) / 2
+    assert grades["gpa"] == Decimal("8.00")
+    assert grades["score_count"] == 3
+    assert [
+        (subject["subject_name"], subject["weighted_average"], subject["score_count"])
+        for subject in grades["subjects"]
+    ] == [("Math", Decimal("7.00"), 2), ("Physics", Decimal("9.00"), 1)]
+    # Same result from the scores as from the rollup
+    assert student_grades(student, date_from=date(2024, 1, 1)) == grades
+
+
+@pytest.mark.django_db
+def test_student_grades_date_range(classroom):
+    student = classroom.students.get(full_name="Student Grades B")
+
+    grades = student_grades(student, date_from=date(2024, 1, 1), date_to=date(2024, 12, 31))
+    assert grades["gpa"] == Decimal("7.00")
+    assert [subject["subject_name"] for subject in grades["subjects"]] == ["Math"]
+
+    grades = student_grades(student, date_from=date(2030, 1, 1))
+    assert grades == {
+        "student_id": student.pk,
+        "full_name": "Student Grades B",
+        "subjects": [],
+        "score_count": 0,
+        "gpa": None,
+    }
+
+
+@pytest.mark.django_db
+def test_classroom_grades(classroom):
+    with CaptureQueriesContext(connection) as queries:
+        grades = classroom_grades(classroom)
+
+    assert len(queries) == 3
+    # B: math (10 + 6 * 3) / 4 = 7, physics 7
+    assert [
+        (student["full_name"], student["gpa"], student["rank"])
+        for student in grades["students"]
+    ] == [
+        ("Student Grades A", Decimal("8.00"), 1),
+        ("Student Grades B", Decimal("7.00"), 2),
+    ]
+
+
+@pytest.mark.django_db
+def test_store_term_results(classroom):
+    term = Term.objects.create(
+        name="Term 1", start_date=date(2024, 9, 1), end_date=date(2024, 12, 31)
+    )
+    TermResult.objects.create(
+        term=term, student=classroom.students.first(),
+        weighted_average=1, computed_at="2024-01-01T00:00:00Z",
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        assert store_term_results(term) == 4
+
+    # No query per student or result
+    assert len(queries) <= 7
+    results = {
+        (result.student.full_name, result.subject and result.subject.name): (
+            result.weighted_average, result.score_count
+        )
+        for result in TermResult.objects.filter(term=term).select_related("student", "subject")
+    }
+    assert results == {
+        ("Student Grades A", "Math"): (Decimal("7.00"), 2),
+        ("Student Grades A", None): (Decimal("7.00"), 2),
+        ("Student Grades B", "Math"): (Decimal("7.00"), 2),
+        ("Student Grades B", None): (Decimal("7.00"), 2),
+    }
+
+    # Recomputing one classroom keeps the other classrooms' results
+    other = Classroom.objects.create(name="G2", teacher=classroom.teacher)
+    assert store_term_results(term, classrooms=[other]) == 0
+    assert TermResult.objects.filter(term=term).count() == 4
@@ -0,0 +1,83 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+from learning.services.score_import import ingest_scores
+
+
+@pytest.fixture
+def objects():
+    user = get_user_model().objects.create(username="teacher_import")
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Import", email="timport@email.com"
+    )
+    classroom = Classroom.objects.create(name="I1", teacher=teacher)
+    student = Student.objects.create(
+        full_name="Student Import",
+        birth_date=date(2010, 1, 1),
+        classroom=classroom,
+    )
+    subject = Subject.objects.create(name="Math", code="MATH")
+    return teacher, student, subject
+
+
+@pytest.mark.django_db
+def test_ingest_scores_upserts_and_reports_errors(
+    objects, django_assert_max_num_queries
+):
+    teacher, student, subject = objects
+    Score.objects.create(
+        student=student, subject=subject, score=5, score_type="quiz",
+        date=date(2024, 9, 1), teacher=teacher,
+    )
+    row = {
+        "student": student.pk,
+        "subject": subject.pk,
+        "score": "8.50",
+        "score_type": "quiz",
+        "date": "2024-09-01",
+    }
+    rows = [
+        row,
+        {**row, "date": "2024-09-02"},
+        {**row, "score": "11"},
+        {**row, "student": 0, "date": "2024-09-03"},
+        {**row, "date": "2024-09-02", "score": "9"},
+    ]
+
+    with django_assert_max_num_queries(11):
+        result = ingest_scores(rows, teacher=teacher)
+
+    assert (result.created, result.updated) == (1, 1)
+    assert [error["index"] for error in result.errors] == [2, 3, 4]
+    assert "score" in result.errors[0]["errors"]
+    assert "student" in result.errors[1]["errors"]
+    assert "non_field_errors" in result.errors[2]["errors"]
+    assert sorted(
+        Score.objects.values_list("date", "score")
+    ) == [(date(2024, 9, 1), 8.5), (date(2024, 9, 2), 8.5)]
+
+
+@pytest.mark.django_db
+def test_ingest_scores_requires_teacher(objects):
+    teacher, student, subject = objects
+    row = {
+        "student": student.pk,
+        "subject": subject.pk,
+        "score": "7",
+        "date": "2024-09-01",
+    }
+    result = ingest_scores([row])
+    assert result.errors[0]["errors"] == {
+        "teacher": ["This field is required."]
+    }
+
+    result = ingest_scores([{**row, "teacher": teacher.pk}])
+    assert result.created == 1
+    assert Score.objects.get().teacher == teacher
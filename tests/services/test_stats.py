@@ -0,0 +1,68 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+from learning.services.stats import classroom_stats
+
+
+@pytest.fixture
+def classroom():
+    user = get_user_model().objects.create(username="teacher_stats")
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Stats", email="tstats@email.com"
+    )
+    classroom = Classroom.objects.create(name="S1", teacher=teacher)
+    math = Subject.objects.create(name="Math", code="MATH")
+    physics = Subject.objects.create(name="Physics", code="PHY")
+    Subject.objects.create(name="Latin", code="LAT", is_active=False)
+    for i, (math_score, physics_score) in enumerate([(6, 9), (8, 7)]):
+        student = Student.objects.create(
+            full_name=f"Student Stats {i}",
+            birth_date=date(2010, 1, 1),
+            classroom=classroom,
+        )
+        Score.objects.create(
+            student=student, subject=math, score=math_score,
+            score_type="quiz", date=date(2024, 9, 1), teacher=teacher,
+        )
+        Score.objects.create(
+            student=student, subject=physics, score=physics_score,
+            score_type="final", date=date(2024, 12, 1), teacher=teacher,
+        )
+    return classroom
+
+
+@pytest.mark.django_db
+def test_classroom_stats(classroom):
+    with CaptureQueriesContext(connection) as queries:
+        stats = classroom_stats(classroom)
+    assert len(queries) == 2
+    assert stats["total_students"] == 2
+    assert stats["total_scores"] == 4
+    assert stats["overall_average"] == 7.5
+    assert stats["average_score_by_subject"] == {"Math": 7.0, "Physics": 8.0}
+    math = stats["subjects"][0]
+    assert math["count"] == 2
+    assert (math["min_score"], math["max_score"]) == (6.0, 8.0)
+    assert math["std_dev"] == 1.0
+
+
+@pytest.mark.django_db
+def test_classroom_stats_filters(classroom):
+    stats = classroom_stats(classroom, score_type="final")
+    assert stats["average_score_by_subject"] == {"Physics": 8.0}
+
+    stats = classroom_stats(classroom, date_to=date(2024, 10, 1))
+    assert stats["average_score_by_subject"] == {"Math": 7.0}
+
+    stats = classroom_stats(classroom, date_from=date(2025, 1, 1))
+    assert stats["subjects"] == []
+    assert stats["overall_average"] is None
@@ -0,0 +1,29 @@
+from contextlib import contextmanager
+
+from django.db import connections
+
+
+class LazyLoadError(AssertionError):
+    pass
+
+
+@contextmanager
+def forbid_queries(using="default"):
+    """Fail at the first query run inside the block, so the traceback shows what loaded lazily"""
+
+    def block(execute, sql, params, many, context):
+        raise LazyLoadError(f"Unexpected query while rendering: {sql}")
+
+    with connections[using].execute_wrapper(block):
+        yield
+
+
+def assert_renders_without_queries(instances, render=str, using="default"):
+    """
+    Render every instance, evaluating a queryset first, and fail if
+    that needs a query, e.g. a ``__str__`` reading an unloaded relation.
+    Returns the rendered values.
+    """
+    instances = list(instances)
+    with forbid_queries(using):
+        return [render(instance) for instance in instances]
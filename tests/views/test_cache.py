@@ -0,0 +1,157 @@
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from learning.cache import response_cache_stats
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+
+
+@pytest.fixture
+def school():
+    user = get_user_model().objects.create_superuser(
+        username="admin_cache", password="adminpass"
+    )
+    teacher_user = get_user_model().objects.create(username="teacher_cache")
+    teacher = Teacher.objects.create(
+        user=teacher_user, full_name="Teacher Cache", email="tcache@email.com"
+    )
+    classroom = Classroom.objects.create(name="C1", teacher=teacher)
+    student = Student.objects.create(
+        full_name="Student Cache",
+        birth_date=date(2010, 1, 1),
+        classroom=classroom,
+    )
+    subject = Subject.objects.create(name="Math", code="MATH")
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, teacher, classroom, student, subject
+
+
+@pytest.mark.django_db
+def test_classroom_stats_served_from_cache(school, django_assert_num_queries):
+    client, teacher, classroom, student, subject = school
+    url = reverse("classroom-stats", args=[classroom.pk])
+
+    first = client.get(url)
+    assert first["X-Cache"] == "MISS"
+
+    with django_assert_num_queries(0):
+        second = client.get(url)
+    assert second["X-Cache"] == "HIT"
+    assert second.data == first.data
+
+    filtered = client.get(url, {"score_type": "quiz"})
+    assert filtered["X-Cache"] == "MISS"
+
+
+@pytest.mark.django_db
+def test_score_write_invalidates_cached_responses(school):
+    client, teacher, classroom, student, subject = school
+    stats_url = reverse("classroom-stats", args=[classroom.pk])
+    average_url = reverse("subject-statistics", args=[subject.pk])
+    assert client.get(stats_url).data["total_scores"] == 0
+    assert client.get(average_url)["X-Cache"] == "MISS"
+
+    score = Score.objects.create(
+        student=student,
+        subject=subject,
+        teacher=teacher,
+        score=8,
+        score_type="quiz",
+        date=date(2025, 1, 1),
+    )
+    response = client.get(stats_url)
+    assert response["X-Cache"] == "MISS"
+    assert response.data["total_scores"] == 1
+    assert client.get(average_url)["X-Cache"] == "MISS"
+
+    score.delete()
+    assert client.get(stats_url).data["total_scores"] == 0
+
+
+@pytest.mark.django_db
+def test_subject_rename_invalidates_classroom_stats(school):
+    client, teacher, classroom, student, subject = school
+    url = reverse("classroom-stats", args=[classroom.pk])
+    client.get(url)
+
+    subject.name = "Algebra"
+    subject.save()
+    assert client.get(url)["X-Cache"] == "MISS"
+
+
+@pytest.mark.django_db
+def test_responses_read_from_a_replica_are_not_stored(school, monkeypatch):
+    client, teacher, classroom, student, subject = school
+    url = reverse("classroom-stats", args=[classroom.pk])
+    monkeypatch.setattr("learning.cache.used_replica", lambda: True)
+
+    assert client.get(url)["X-Cache"] == "MISS"
+    assert client.get(url)["X-Cache"] == "MISS"
+
+    monkeypatch.setattr("learning.cache.used_replica", lambda: False)
+    client.get(url)
+    assert client.get(url)["X-Cache"] == "HIT"
+
+
+def _score_listing_urls(classroom, student, subject):
+    return [
+        (reverse("student-scores", args=[student.pk]), {}),
+        (reverse("score-by-classroom"), {"classroom_id": classroom.pk}),
+        (reverse("subject-scores", args=[subject.pk]), {}),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("renamed", ["teacher", "subject"])
+def test_rename_invalidates_score_listings(school, renamed):
+    client, teacher, classroom, student, subject = school
+    Score.objects.create(
+        student=student,
+        subject=subject,
+        teacher=teacher,
+        score=8,
+        score_type="quiz",
+        date=date(2025, 1, 1),
+    )
+    urls = _score_listing_urls(classroom, student, subject)
+    for url, params in urls:
+        client.get(url, params)
+        assert client.get(url, params)["X-Cache"] == "HIT"
+
+    if renamed == "teacher":
+        teacher.full_name = "Teacher Renamed"
+        teacher.save()
+    else:
+        subject.name = "Algebra"
+        subject.save()
+
+    for url, params in urls:
+        response = client.get(url, params)
+        assert response["X-Cache"] == "MISS", url
+        assert ("Teacher Renamed" if renamed == "teacher" else "Algebra") in str(response.data)
+
+
+@pytest.mark.django_db
+def test_response_cache_stats(school, capsys):
+    client, teacher, classroom, student, subject = school
+    url = reverse("classroom-students", args=[classroom.pk])
+    client.get(url)
+    client.get(url)
+
+    assert response_cache_stats()["classroom-students"] == {
+        "hits": 1,
+        "misses": 1,
+    }
+    call_command("response_cache_stats")
+    assert "classroom-students: 1 hits, 1 misses, hit rate 50.0%" in (
+        capsys.readouterr().out
+    )
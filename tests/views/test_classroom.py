@@ -34,3 +34,123 @@ def test_classroom_create_api():
     data = {"name": "C2", "teacher": teacher.id}
     response = client.post(url, data)
     assert response.status_code in (201, 400)
+
+
+@pytest.mark.django_db
+def test_classroom_stats_api():
+    client = APIClient()
+    user = get_user_model().objects.create_user(
+        username="teacher_api5", password="pass"
+    )
+    teacher = Teacher.objects.create(user=user)
+    classroom = Classroom.objects.create(name="C3", teacher=teacher)
+    client.force_authenticate(user=user)
+    url = reverse("classroom-stats", args=[classroom.id])
+    response = client.get(url, {"score_type": "final"})
+    assert response.status_code == 200
+    assert response.data["subjects"] == []
+    response = client.get(
+        url, {"date_from": "2024-12-31", "date_to": "2024-01-01"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_classroom_analytics_api():
+    client = APIClient()
+    user = get_user_model().objects.create_user(
+        username="teacher_api7", password="pass"
+    )
+    teacher = Teacher.objects.create(user=user)
+    classroom = Classroom.objects.create(name="C5", teacher=teacher)
+    other = Classroom.objects.create(
+        name="C6", teacher=Teacher.objects.create(
+            user=get_user_model().objects.create(username="teacher_api8"),
+            email="other@email.com",
+        )
+    )
+    client.force_authenticate(user=user)
+
+    url = reverse("classroom-analytics", args=[classroom.id])
+    response = client.get(url, {"score_type": "final"})
+    assert response.status_code == 200
+    assert response.data["classroom_id"] == classroom.id
+    assert response.data["students"] == []
+
+    response = client.get(
+        url, {"date_from": "2024-12-31", "date_to": "2024-01-01"}
+    )
+    assert response.status_code == 400
+
+    response = client.get(reverse("classroom-analytics", args=[other.id]))
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_classroom_gpa_api():
+    client = APIClient()
+    user = get_user_model().objects.create_user(
+        username="teacher_api9", password="pass"
+    )
+    teacher = Teacher.objects.create(user=user)
+    classroom = Classroom.objects.create(name="C7", teacher=teacher)
+    client.force_authenticate(user=user)
+
+    url = reverse("classroom-gpa", args=[classroom.id])
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.data == {"classroom_id": classroom.id, "students": []}
+
+    response = client.get(
+        url, {"date_from": "2024-12-31", "date_to": "2024-01-01"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_classroom_export_api():
+    client = APIClient()
+    user = get_user_model().objects.create_user(
+        username="teacher_api6", password="pass"
+    )
+    teacher = Teacher.objects.create(user=user)
+    classroom = Classroom.objects.create(name="C4", teacher=teacher)
+    client.force_authenticate(user=user)
+
+    url = reverse("classroom-export-students", args=[classroom.id])
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.streaming
+
+    response = client.get(reverse("classroom-export"), {"ids": classroom.id})
+    assert response.status_code == 200
+    content = b"".join(response.streaming_content).decode()
+    assert content.startswith("Classroom,Full Name")
+
+    response = client.get(reverse("classroom-export"), {"ids": "x"})
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_classroom_search_matches_teacher_name():
+    client = APIClient()
+    admin = get_user_model().objects.create_superuser(
+        username="admin_search", password="adminpass"
+    )
+    client.force_authenticate(user=admin)
+    user = get_user_model().objects.create(username="teacher_search_c")
+    teacher = Teacher.objects.create(user=user, full_name="Đỗ Quốc Bảo")
+    Classroom.objects.create(name="10A1", teacher=teacher)
+    Classroom.objects.create(
+        name="11B2", teacher=Teacher.objects.create(
+            user=get_user_model().objects.create(username="teacher_search_d"),
+            full_name="Other",
+            email="other@email.com",
+        ),
+    )
+
+    response = client.get(reverse("classroom-list"), {"search": "do quoc"})
+    assert [row["name"] for row in response.data["results"]] == ["10A1"]
+
+    response = client.get(reverse("classroom-search"), {"search": "11b"})
+    assert [row["name"] for row in response.data] == ["11B2"]
@@ -0,0 +1,140 @@
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+from learning.pagination import ScorePagination
+
+
+@pytest.fixture
+def client_and_scores():
+    user = get_user_model().objects.create_user(
+        username="teacher_pages", password="pass"
+    )
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Pages", email="tpages@email.com"
+    )
+    classroom = Classroom.objects.create(name="P1", teacher=teacher)
+    subject = Subject.objects.create(name="Math", code="MATH")
+    students = Student.objects.bulk_create(
+        Student(
+            full_name=f"Student {i}",
+            birth_date=date(2010, 1, 1),
+            classroom=classroom,
+        )
+        for i in range(5)
+    )
+    # Three dates shared by five students, so the ordering has many ties
+    Score.objects.bulk_create(
+        Score(
+            student=student,
+            subject=subject,
+            score=7,
+            date=date(2024, 9, day),
+            teacher=teacher,
+        )
+        for student in students
+        for day in (1, 2, 3)
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    expected = list(
+        Score.objects.order_by("-date", "id").values_list("id", flat=True)
+    )
+    return client, expected
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_walks_forward_and_back(client_and_scores):
+    client, expected = client_and_scores
+    url = reverse("score-list") + "?page_size=4"
+
+    seen, pages, query_counts = [], [], []
+    while url:
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        assert response.status_code == 200
+        query_counts.append(len(queries))
+        pages.append(response.data)
+        seen.extend(score["id"] for score in response.data["results"])
+        url = response.data["next"]
+
+    assert seen == expected
+    assert len(pages) == 4
+    # Full pages cost the same however deep they are
+    assert len(set(query_counts[:-1])) == 1
+    assert pages[0]["previous"] is None
+
+    response = client.get(pages[-1]["previous"])
+    assert response.data["results"] == pages[-2]["results"]
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_page_size_and_cursor(client_and_scores):
+    client, _expected = client_and_scores
+    url = reverse("score-list")
+
+    response = client.get(url, {"page_size": 10_000})
+    assert len(response.data["results"]) == 15
+    assert ScorePagination.max_page_size < 10_000
+
+    response = client.get(url, {"cursor": "not-a-cursor"})
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_client_ordering(client_and_scores):
+    client, _expected = client_and_scores
+    url = reverse("score-list")
+
+    response = client.get(url, {"ordering": "date", "page_size": 10})
+    assert [s["date"] for s in response.data["results"][:5]] == [
+        "2024-09-01"
+    ] * 5
+    response = client.get(response.data["next"])
+    assert len(response.data["results"]) == 5
+    assert response.data["results"][-1]["date"] == "2024-09-03"
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_keeps_the_microseconds_of_the_cursor():
+    user = get_user_model().objects.create_superuser(
+        username="admin_pages", password="pass"
+    )
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Micro", email="tmicro@email.com"
+    )
+    # Created within the same millisecond
+    created_at = datetime(2024, 9, 1, 8, 0, 0, 123000, tzinfo=UTC)
+    for i in range(4):
+        classroom = Classroom.objects.create(name=f"M{i}", teacher=teacher)
+        Classroom.objects.filter(pk=classroom.pk).update(
+            created_at=created_at + timedelta(microseconds=100 * (3 - i))
+        )
+    expected = list(
+        Classroom.objects.order_by("created_at", "id").values_list(
+            "name", flat=True
+        )
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    url = reverse("classroom-list") + "?ordering=created_at&page_size=1"
+    seen = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        seen.extend(classroom["name"] for classroom in response.data["results"])
+        assert len(seen) <= len(expected)
+        url = response.data["next"]
+
+    assert seen == expected == ["M3", "M2", "M1", "M0"]
@@ -0,0 +1,161 @@
+import json
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from learning.models.classroom import Classroom
+from learning.models.report import Report
+from learning.models.score import Score
+from learning.models.student import Student
+from learning.models.subject import Subject
+from learning.models.teacher import Teacher
+from tasks.reports import generate_report
+
+
+@pytest.fixture
+def teacher_client():
+    user = get_user_model().objects.create_user(
+        username="teacher_report", password="pass"
+    )
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Report", email="treport@email.com"
+    )
+    classroom = Classroom.objects.create(name="R1", teacher=teacher)
+    student = Student.objects.create(
+        full_name="Student Report",
+        birth_date=date(2010, 1, 1),
+        classroom=classroom,
+        student_id="R1-01",
+    )
+    subject = Subject.objects.create(name="Math", code="MATH")
+    Score.objects.create(
+        student=student,
+        subject=subject,
+        teacher=teacher,
+        score=8,
+        score_type="quiz",
+        date=date(2025, 1, 1),
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, teacher, classroom
+
+
+def _request_report(client, django_capture_on_commit_callbacks, data):
+    with django_capture_on_commit_callbacks() as callbacks:
+        response = client.post(reverse("report-list"), data, format="json")
+    return response, callbacks
+
+
+@pytest.mark.django_db
+def test_report_generation_and_download(
+    teacher_client, django_capture_on_commit_callbacks
+):
+    client, teacher, classroom = teacher_client
+    response, callbacks = _request_report(
+        client,
+        django_capture_on_commit_callbacks,
+        {"kind": "classroom", "format": "json", "classroom": classroom.pk},
+    )
+    assert response.status_code == 202
+    assert response.data["status"] == "pending"
+    # The task is only enqueued once the report is committed
+    assert len(callbacks) == 1
+
+    report_id = response.data["id"]
+    generate_report(report_id)
+
+    status_url = reverse("report-status", args=[report_id])
+    response = client.get(status_url)
+    assert response.data["status"] == "success"
+    assert response.data["row_count"] == 1
+
+    response = client.get(reverse("report-download", args=[report_id]))
+    assert response.status_code == 200
+    rows = json.loads(b"".join(response.streaming_content))
+    assert rows[0]["Classroom"] == "R1"
+    assert rows[0]["Student ID"] == "R1-01"
+    assert rows[0]["Average Score"] == "8.00"
+
+
+@pytest.mark.django_db
+def test_report_csv_for_teacher(teacher_client):
+    client, teacher, classroom = teacher_client
+    report = Report.objects.create(kind="teacher", format="csv", teacher=teacher)
+
+    result = generate_report(report.pk)
+
+    # Only a JSON-serializable reference goes to the result backend
+    report.refresh_from_db()
+    assert json.loads(json.dumps(result)) == {
+        "report_id": report.pk,
+        "file": report.file.name,
+        "row_count": 1,
+    }
+    content = report.file.read().decode()
+    assert content.splitlines()[0].startswith("Classroom,Full Name")
+    assert "Student Report" in content
+
+
+@pytest.mark.django_db
+def test_report_download_before_success(teacher_client):
+    client, teacher, classroom = teacher_client
+    report = Report.objects.create(
+        kind="classroom",
+        classroom=classroom,
+        requested_by=teacher.user,
+    )
+    response = client.get(reverse("report-download", args=[report.pk]))
+    assert response.status_code == 409
+
+
+@pytest.mark.django_db
+def test_report_scope_is_restricted_for_teachers(
+    teacher_client, django_capture_on_commit_callbacks
+):
+    client, teacher, classroom = teacher_client
+    other_user = get_user_model().objects.create(username="other_report")
+    other = Teacher.objects.create(
+        user=other_user, full_name="Other", email="oreport@email.com"
+    )
+    other_classroom = Classroom.objects.create(name="R2", teacher=other)
+
+    for data in (
+        {"kind": "classroom", "classroom": other_classroom.pk},
+        {"kind": "teacher", "teacher": other.pk},
+        {"kind": "school"},
+    ):
+        response, callbacks = _request_report(
+            client, django_capture_on_commit_callbacks, data
+        )
+        assert response.status_code == 400
+        assert not callbacks
+
+    # Reports requested by someone else are not visible
+    report = Report.objects.create(kind="school", requested_by=other_user)
+    response = client.get(reverse("report-status", args=[report.pk]))
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_school_report_requires_staff(django_capture_on_commit_callbacks):
+    client = APIClient()
+    user = get_user_model().objects.create_user(username="plain_report", password="pass")
+    client.force_authenticate(user=user)
+
+    response, callbacks = _request_report(
+        client, django_capture_on_commit_callbacks, {"kind": "school"}
+    )
+    assert response.status_code == 400
+    assert not callbacks
+
+    user.is_staff = True
+    user.save()
+    client.force_authenticate(user=user)
+    response, callbacks = _request_report(
+        client, django_capture_on_commit_callbacks, {"kind": "school"}
+    )
+    assert response.status_code == 202
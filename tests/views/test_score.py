@@ -71,3 +71,83 @@ def test_score_create_api():
     }
     response = client.post(url, data)
     assert response.status_code in (201, 400)
+
+
+@pytest.mark.django_db
+def test_score_bulk_create_api():
+    client = APIClient()
+    user = get_user_model().objects.create_user(
+        username="teacher_api5", password="pass"
+    )
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher API5", email="tapi5@email.com"
+    )
+    classroom = Classroom.objects.create(name="A9", teacher=teacher)
+    student = Student.objects.create(
+        full_name="Student API5",
+        birth_date=date(2010, 9, 9),
+        classroom=classroom,
+    )
+    subject = Subject.objects.create(name="Chemistry", code="CHEM")
+    client.force_authenticate(user=user)
+    url = reverse("score-bulk-create")
+    row = {
+        "student": student.id,
+        "subject": subject.id,
+        "score": 8.0,
+        "score_type": "final",
+        "date": date.today().isoformat(),
+    }
+    response = client.post(url, [row, {**row, "score": -1}], format="json")
+    assert response.status_code == 201
+    assert response.data["created"] == 1
+    assert response.data["errors"][0]["index"] == 1
+
+    response = client.post(url, [{**row, "score": -1}], format="json")
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_score_list_flat_fields(django_assert_num_queries):
+    client = APIClient()
+    user = get_user_model().objects.create_user(
+        username="teacher_flat", password="pass"
+    )
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Flat", email="tflat@email.com"
+    )
+    classroom = Classroom.objects.create(name="F1", teacher=teacher)
+    student = Student.objects.create(
+        full_name="Student Flat",
+        birth_date=date(2010, 1, 1),
+        classroom=classroom,
+    )
+    subject = Subject.objects.create(name="Music", code="MUS")
+    score = Score.objects.create(
+        student=student,
+        subject=subject,
+        score=9,
+        score_type="quiz",
+        date=date(2025, 1, 1),
+        teacher=teacher,
+    )
+    client.force_authenticate(user=user)
+    url = reverse("score-list")
+
+    # Only the scores themselves, no nested objects
+    with django_assert_num_queries(1):
+        response = client.get(url, {"fields": "id,student_id,subject_id,score"})
+    assert response.status_code == 200
+    assert response.data["results"] == [
+        {
+            "id": score.pk,
+            "student_id": student.pk,
+            "subject_id": subject.pk,
+            "score": "9.00",
+        }
+    ]
+
+    response = client.get(url)
+    row = response.data["results"][0]
+    assert row["student"]["classroom_name"] == "F1"
+    assert row["teacher_id"] == teacher.pk
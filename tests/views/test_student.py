@@ -6,8 +6,11 @@ from django.urls import reverse
 from rest_framework.test import APIClient
 
 from learning.models.classroom import Classroom
+from learning.models.score import Score
 from learning.models.student import Student
+from learning.models.subject import Subject
 from learning.models.teacher import Teacher
+from learning.models.term import Term
 
 
 @pytest.mark.django_db
@@ -51,3 +54,110 @@ def test_student_create_api():
     }
     response = client.post(url, data)
     assert response.status_code in (201, 400)
+
+
+@pytest.mark.django_db
+def test_student_gpa_api(settings):
+    settings.SCORE_TYPE_WEIGHTS = {"quiz": 1, "final": 3}
+    client = APIClient()
+    user = get_user_model().objects.create_user(
+        username="teacher_gpa", password="pass"
+    )
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher GPA", email="tgpa@email.com"
+    )
+    classroom = Classroom.objects.create(name="A9", teacher=teacher)
+    student = Student.objects.create(
+        full_name="Student GPA", birth_date=date(2010, 5, 5), classroom=classroom
+    )
+    subject = Subject.objects.create(name="Math", code="MATH")
+    for score_type, score, score_date in (
+        ("quiz", 4, date(2024, 9, 1)),
+        ("final", 8, date(2024, 12, 1)),
+        ("final", 10, date(2025, 5, 1)),
+    ):
+        Score.objects.create(
+            student=student, subject=subject, score=score,
+            score_type=score_type, date=score_date, teacher=teacher,
+        )
+    term = Term.objects.create(
+        name="Term 1", start_date=date(2024, 9, 1), end_date=date(2024, 12, 31)
+    )
+    client.force_authenticate(user=user)
+    url = reverse("student-gpa", args=[student.id])
+
+    response = client.get(url, {"term": term.id})
+    assert response.status_code == 200
+    assert response.json()["gpa"] == 7.0
+
+    response = client.get(url)
+    assert response.json()["subjects"][0]["weighted_average"] == 8.29
+
+    assert client.get(url, {"term": 0}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_student_bulk_enroll_api():
+    client = APIClient()
+    user = get_user_model().objects.create_user(
+        username="teacher_enroll_api", password="pass"
+    )
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Enroll API", email="tenrollapi@email.com"
+    )
+    own = Classroom.objects.create(name="B1", teacher=teacher, school_year="2025-2026")
+    other_user = get_user_model().objects.create(username="teacher_enroll_other")
+    other = Classroom.objects.create(
+        name="B2",
+        teacher=Teacher.objects.create(
+            user=other_user, full_name="Other", email="tother@email.com"
+        ),
+    )
+    client.force_authenticate(user=user)
+    url = reverse("student-bulk-enroll")
+    row = {"full_name": "Bulk Student", "birth_date": "2010-03-03"}
+
+    response = client.post(
+        url,
+        [{**row, "classroom": own.pk}, {**row, "classroom": other.pk}],
+        format="json",
+    )
+
+    assert response.status_code == 201
+    assert response.data["created"] == 1
+    assert response.data["students"][0]["student_id"] == "202500001"
+    assert response.data["errors"][0]["index"] == 1
+    assert list(Student.objects.values_list("classroom", flat=True)) == [own.pk]
+
+    response = client.post(url, {"full_name": "Not a list"}, format="json")
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_student_search_ignores_accents():
+    client = APIClient()
+    user = get_user_model().objects.create_user(
+        username="teacher_search_api", password="pass"
+    )
+    teacher = Teacher.objects.create(
+        user=user, full_name="Teacher Search API", email="tsearchapi@email.com"
+    )
+    classroom = Classroom.objects.create(name="C1", teacher=teacher)
+    for full_name in ["Nguyễn Văn Nam", "Văn Nguyên", "Trần Thị Hoa"]:
+        Student.objects.create(
+            full_name=full_name, birth_date=date(2010, 1, 1), classroom=classroom
+        )
+    client.force_authenticate(user=user)
+
+    response = client.get(reverse("student-list"), {"search": "nguyen van"})
+    assert [row["full_name"] for row in response.data["results"]] == [
+        "Nguyễn Văn Nam",
+        "Văn Nguyên",
+    ]
+
+    response = client.get(reverse("student-search"), {"search": "van", "limit": 1})
+    assert response.status_code == 200
+    assert [row["full_name"] for row in response.data] == ["Văn Nguyên"]
+
+    response = client.get(reverse("student-search"))
+    assert response.status_code == 400
@@ -1,9 +1,15 @@
+from datetime import date
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APIClient
 
+from learning.models.classroom import Classroom
+from learning.models.score import Score
+from learning.models.student import Student
 from learning.models.subject import Subject
+from learning.models.teacher import Teacher
 
 
 @pytest.mark.django_db
@@ -30,3 +36,44 @@ def test_subject_create_api():
     data = {"name": "Geography"}
     response = client.post(url, data)
     assert response.status_code in (201, 400)
+
+
+@pytest.mark.django_db
+def test_subject_analytics_api():
+    client = APIClient()
+    subject = Subject.objects.create(name="Music", code="MUS")
+    classrooms = []
+    for i in range(2):
+        user = get_user_model().objects.create(username=f"teacher_subject{i}")
+        teacher = Teacher.objects.create(
+            user=user, email=f"tsubject{i}@email.com"
+        )
+        classroom = Classroom.objects.create(name=f"M{i}", teacher=teacher)
+        student = Student.objects.create(
+            full_name=f"Student Music {i}",
+            birth_date=date(2010, 1, 1),
+            classroom=classroom,
+        )
+        Score.objects.create(
+            student=student, subject=subject, score=5 + i,
+            score_type="quiz", date=date(2024, 9, 1), teacher=teacher,
+        )
+        classrooms.append(classroom)
+    url = reverse("subject-analytics", args=[subject.id])
+
+    client.force_authenticate(user=classrooms[0].teacher.user)
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.data["count"] == 1
+    assert [row["classroom_name"] for row in response.data["classrooms"]] == ["M0"]
+
+    admin = get_user_model().objects.create_superuser(
+        username="admin6", password="adminpass6"
+    )
+    client.force_authenticate(user=admin)
+    response = client.get(url, {"limit": 1})
+    assert response.data["count"] == 2
+    assert [row["full_name"] for row in response.data["students"]] == ["Student Music 1"]
+    assert response.data["classrooms"][0]["rank"] == 1
+
+    assert client.get(url, {"limit": 0}).status_code == 400
@@ -20,18 +20,31 @@ from django.http.response import HttpResponse
 from django.urls import include, path
 from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.response import Response
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
     TokenVerifyView,
 )
-from rest_framework.permissions import AllowAny
+
+from learning.views import TokenRevokeView
+from libs.db_pool import database_pool_stats
+from libs.metrics import metrics_view
 
 
 def health(request):
     return HttpResponse()
 
 
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def database_health(request):
+    # The pool configuration and counters are for the staff only
+    return Response(database_pool_stats())
+
+
 schema_view = get_schema_view(
     openapi.Info(
         title="API Docs",
@@ -46,9 +59,12 @@ schema_view = get_schema_view(
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("health/", health, name="health"),
+    path("health/db/", database_health, name="health_db"),
+    path("metrics", metrics_view, name="metrics"),
     path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("api/token/verify/", TokenVerifyView.as_view(), name="token_verify"),
+    path("api/token/revoke/", TokenRevokeView.as_view(), name="token_revoke"),
     path("docs/", schema_view.with_ui("swagger", cache_timeout=0), name="api_docs"),
     path("", include("learning.urls")),
 ]